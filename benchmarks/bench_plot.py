@@ -0,0 +1,264 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmarks for hoggormplot rendering.
+
+Synthetic nipalsPCA and nipalsPLS2 models are fitted at increasing sizes
+(objects x variables x components). Every plot type of ``hoggormplot.plot``,
+the convenience functions and ``plotSMI`` are then rendered on the Agg
+backend. For each case the wall time for building the figures, the wall
+time for drawing them, the number of artists and the peak memory allocated
+while building are reported.
+
+Run from the repository root::
+
+    python benchmarks/bench_plot.py
+    python benchmarks/bench_plot.py --sizes small medium --repeat 5
+    python benchmarks/bench_plot.py --save baseline.json
+    python benchmarks/bench_plot.py --compare baseline.json --tolerance 0.25
+
+With ``--compare`` the script exits with status 1 if any case got slower
+than the stored results by more than the tolerance, so it can guard an
+upgrade of hoggormplot.
+"""
+
+import argparse
+import contextlib
+import gc
+import io
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+import matplotlib
+matplotlib.use('Agg')
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+import numpy as np
+import hoggorm as ho
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                os.pardir))
+import hoggormplot as hopl
+
+
+# Name: (objects, variables, components)
+SIZES = {
+    'small': (50, 20, 4),
+    'medium': (500, 200, 6),
+    'large': (5000, 1000, 8),
+}
+
+
+# Cross validation settings passed to hoggorm
+CV = {
+    'kfold': ['KFold', 7],
+    'loo': ['loo'],
+    'none': None,
+}
+
+
+def fitModels(objects, variables, components, cv='loo', seed=0):
+    """
+    Fits a PCA and a PLS2 model on random data with some latent structure.
+    """
+    rng = np.random.RandomState(seed)
+    latent = rng.randn(objects, components)
+    X = (np.dot(latent, rng.randn(components, variables))
+         + 0.5 * rng.randn(objects, variables))
+    Y = np.dot(latent, rng.randn(components, 3)) + 0.5 * rng.randn(objects, 3)
+
+    # hoggorm reports progress on stdout
+    with contextlib.redirect_stdout(io.StringIO()):
+        if CV[cv] is None:
+            pca = ho.nipalsPCA(arrX=X, numComp=components)
+            pls2 = ho.nipalsPLS2(arrX=X, arrY=Y, numComp=components)
+        else:
+            pca = ho.nipalsPCA(arrX=X, numComp=components, cvType=CV[cv])
+            pls2 = ho.nipalsPLS2(arrX=X, arrY=Y, numComp=components,
+                                 cvType=CV[cv])
+        smi = ho.SMI(pca.X_scores(), pls2.X_scores(),
+                     ncomp1=components, ncomp2=components)
+    return pca, pls2, smi
+
+
+def cases(pca, pls2, smi, validated=True):
+    """
+    Returns list of (name, function) pairs. Each function renders one case
+    and returns the created figures. Explained variance plots need validated
+    results and are left out for models without cross validation.
+    """
+    plotTypes = ['scores', 'loadings', 'correlationLoadings', 'biplot',
+                 'coeffs', 'explainedVariance', 'predict', 'controlChart',
+                 'influence']
+    result = []
+    for modelName, model in [('PCA', pca), ('PLS2', pls2)]:
+        for num, plotType in enumerate(plotTypes, 1):
+            if modelName == 'PCA' and num in [5, 7]:
+                continue
+            if num == 6 and not validated:
+                continue
+            result.append(('plot {0} {1}'.format(modelName, plotType),
+                           lambda model=model, num=num: hopl.plot(
+                               model, plots=[num], show=False)))
+
+    result.extend([
+        ('scores', lambda: hopl.scores(pls2, show=False)),
+        ('loadings', lambda: hopl.loadings(pls2, show=False)),
+        ('loadings line', lambda: hopl.loadings(pls2, line=True, show=False)),
+        ('loadingWeights', lambda: hopl.loadingWeights(pls2, show=False)),
+        ('correlationLoadings',
+         lambda: hopl.correlationLoadings(pls2, show=False)),
+        ('biplot', lambda: hopl.biplot(pls2, show=False)),
+        ('coefficients', lambda: hopl.coefficients(pls2, show=False)),
+        ('predict', lambda: hopl.predict(pls2, show=False)),
+        ('controlChart', lambda: hopl.controlChart(pls2, show=False)),
+        ('controlChart newX',
+         lambda: hopl.controlChart(pls2, newX=pls2.arrX_input, show=False)),
+        ('influence', lambda: hopl.influence(pls2, show=False)),
+        ('scores maxLabels=50',
+         lambda: hopl.scores(pls2, maxLabels=50, show=False)),
+        ('scores density', lambda: hopl.scores(pls2, density=True,
+                                               show=False)),
+        ('plotSMI', lambda: [hopl.plotSMI(smi, B=100, seed=0, processes=1,
+                                          show=False)]),
+    ])
+    if validated:
+        result.extend([
+            ('explainedVariance',
+             lambda: hopl.explainedVariance(pls2, show=False)),
+            ('explainedVariance individual',
+             lambda: hopl.explainedVariance(pls2, individual=True,
+                                            show=False)),
+        ])
+    return result
+
+
+def countArtists(figs):
+    return sum(len(fig.findobj()) for fig in figs)
+
+
+def measure(func, repeat):
+    """
+    Returns the best build and draw times over ``repeat`` runs, the number of
+    artists and the peak memory (in bytes) allocated while building.
+    """
+    buildTimes = []
+    drawTimes = []
+    for run in range(repeat):
+        hopl.clearCache()
+        gc.collect()
+        start = time.perf_counter()
+        figs = func()
+        built = time.perf_counter()
+        for fig in figs:
+            FigureCanvasAgg(fig).draw()
+        drawn = time.perf_counter()
+        buildTimes.append(built - start)
+        drawTimes.append(drawn - built)
+        numArtists = countArtists(figs)
+        del figs
+
+    # Memory is traced in a separate run, tracing slows down the timings
+    hopl.clearCache()
+    gc.collect()
+    tracemalloc.start()
+    figs = func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del figs
+
+    return {'build': min(buildTimes), 'draw': min(drawTimes),
+            'artists': numArtists, 'peak': peak}
+
+
+def run(sizes, repeat, cv='loo'):
+    results = {}
+    for sizeName in sizes:
+        objects, variables, components = SIZES[sizeName]
+        print('\n{0}: {1} objects x {2} variables x {3} components'.format(
+            sizeName, objects, variables, components))
+        print('{0:<34}{1:>10}{2:>10}{3:>10}{4:>11}'.format(
+            'case', 'build [s]', 'draw [s]', 'artists', 'peak [MB]'))
+
+        validated = CV[cv] is not None
+        try:
+            models = fitModels(objects, variables, components, cv=cv)
+        except Exception as error:
+            # Cross validation of some hoggorm versions fails on current
+            # numpy (e.g. KFold uses the removed np.int alias)
+            if not validated:
+                raise
+            print('cross validation {0!r} failed ({1}: {2}), fitted without '
+                  'it'.format(cv, type(error).__name__,
+                              str(error).splitlines()[0]))
+            models = fitModels(objects, variables, components, cv='none')
+            validated = False
+        # Compute SMI P-values once, only the plotting is measured
+        hopl.smiSignificance(models[2], B=100, seed=0, processes=1)
+
+        for caseName, func in cases(*models, validated=validated):
+            res = measure(func, repeat)
+            results['{0}/{1}'.format(sizeName, caseName)] = res
+            print('{0:<34}{1:>10.3f}{2:>10.3f}{3:>10d}{4:>11.1f}'.format(
+                caseName, res['build'], res['draw'], res['artists'],
+                res['peak'] / 2.0**20))
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """
+    Prints cases whose total time exceeds the baseline by more than the
+    tolerance and returns their number.
+    """
+    regressions = 0
+    print('\nComparison with baseline (tolerance {0:.0%})'.format(tolerance))
+    for key, res in sorted(results.items()):
+        if key not in baseline:
+            continue
+        old = baseline[key]['build'] + baseline[key]['draw']
+        new = res['build'] + res['draw']
+        if new > old * (1 + tolerance):
+            regressions += 1
+            print('  SLOWER  {0}: {1:.3f} s -> {2:.3f} s'.format(key, old, new))
+    if regressions == 0:
+        print('  no regressions')
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Benchmarks for hoggormplot rendering.')
+    parser.add_argument('--sizes', nargs='+', choices=sorted(SIZES),
+                        default=['small', 'medium'],
+                        help='model sizes to run (default: small medium)')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='runs per case, the best time is reported')
+    parser.add_argument('--cv', choices=sorted(CV), default='loo',
+                        help='cross validation of the models (default: '
+                             'loo), explained variance plots are skipped '
+                             'with none')
+    parser.add_argument('--save', metavar='FILE',
+                        help='write results to a JSON file')
+    parser.add_argument('--compare', metavar='FILE',
+                        help='compare against results saved with --save')
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help='allowed relative slowdown for --compare')
+    args = parser.parse_args(argv)
+
+    results = run(args.sizes, args.repeat, args.cv)
+
+    if args.save:
+        with open(args.save, 'w') as fp:
+            json.dump(results, fp, indent=1, sort_keys=True)
+    if args.compare:
+        with open(args.compare) as fp:
+            baseline = json.load(fp)
+        if compare(results, baseline, args.tolerance) > 0:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
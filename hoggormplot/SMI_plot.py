@@ -1,14 +1,36 @@
 # -*- coding: utf-8 -*-
 
 import hoggorm
-from .main_plot import plot
+from .main_plot import plot, _newFigure
+from .SMI_significance import smiSignificance
+from .profiling import _Timer
 import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib as mpl
+from matplotlib.collections import PolyCollection
+from matplotlib.textpath import TextPath
+from matplotlib.transforms import Affine2D
+
+
+def _drawGlyphs(ax, text, x, y, fontsize):
+    """
+    Draws the same text centred at all points (x, y) as a single collection.
+    The glyph outline is sized in points, so it scales like ``ax.text``.
+    """
+    path = TextPath((0, 0), text, size=fontsize)
+    ext = path.get_extents()
+    path = path.transformed(Affine2D().translate(-(ext.x0+ext.x1)/2,
+                                                 -(ext.y0+ext.y1)/2))
+    # A scatter with size 1 scales its paths from points to pixels and keeps
+    # the offsets in data coordinates
+    glyphs = ax.scatter(x, y, s=1, c='k', linewidths=0)
+    glyphs.set_paths([path])
+    return glyphs
 
 
 def plotSMI(smi, pc='max', significance=True, X1name='X1', X2name='X2',
-            B=10000, fontscale=1, figsize=None):
+            B=10000, fontscale=1, figsize=None, show=True, seed=None,
+            processes=1, cacheFile=None, profile=None):
     """
     Diamond plot for Similarity of matrices index (SMI)
 
@@ -38,6 +60,32 @@ def plotSMI(smi, pc='max', significance=True, X1name='X1', X2name='X2',
     figsize : tuple, optional 
         Sets figure width and height in inches
 
+    show : boolean, optional
+        When set to ``'show=False'`` the figure is returned instead of being
+        displayed with ``plt.show()``. It is not registered with pyplot and
+        need not be closed.
+
+    seed : int, optional
+        seed of the permutations used with significance testing.
+
+    processes : int, optional
+        number of processes used for significance testing, defaults to 1,
+        i.e. no worker processes. With None one process per CPU is used.
+
+    cacheFile : str, optional
+        ``.npz`` file in which P-values are stored and reused across
+        sessions. P-values are in any case cached per SMI object, B and seed
+        for the running session (see ``hoggormplot.smiSignificance``).
+
+    profile : callable, optional
+        a ``hoggormplot.PlotProfile`` object or any callable receiving a
+        record with the time spent in significance testing, drawing and
+        ``plt.show()`` (see ``hoggormplot.plot``).
+
+    RETURNS
+    -------
+    The matplotlib figure if ``'show=False'``, otherwise None.
+
     EXAMPLES
     --------
     >>> import numpy as np
@@ -54,6 +102,10 @@ def plotSMI(smi, pc='max', significance=True, X1name='X1', X2name='X2',
     >>> hopl.plotSMI(smiOP)
     """
 
+    figs = []
+    timer = _Timer(profile, 'plotSMI')
+    timer.begin('SMI', figs=figs)
+
     # Check how many components to use
     if pc == 'max':
         pc = np.shape(smi.smi)
@@ -61,61 +113,50 @@ def plotSMI(smi, pc='max', significance=True, X1name='X1', X2name='X2',
 
     # Perform significance calculations if needed
     if significance:
-        Pval = smi.significance(B=B)
+        Pval = smiSignificance(smi, B=B, seed=seed, processes=processes,
+                               cacheFile=cacheFile)
+    timer.lap('significance')
 
     # Main plot, equal axes
-    fig = plt.figure(figsize=figsize)
+    fig = _newFigure(figsize, show)
+    figs.append(fig)
     ax = fig.add_subplot(111, adjustable='box', aspect=1)
-
-    # Loop over all combinations of components
-    for i in range(pc[0]):
-        for j in range(pc[1]):
-            p = plt.Rectangle([(j-i)/2, (i+j)/2], np.sqrt(1/2), np.sqrt(1/2), fill=True, angle=45,
-                              edgecolor=[0, 0, 0],
-                              facecolor=[smi.smi[i, j], smi.smi[i, j], smi.smi[i, j]])
-
-            ax.add_patch(p)
-            # Add significance symbols
-            if significance:
-                if Pval[i, j] < 0.001:
-                    ax.text((j-i)/2, (i+j)/2+0.5, '***',
-                            fontsize=10*7/maxpc*fontscale, horizontalalignment='center',
-                            verticalalignment='center')
-                elif Pval[i, j] < 0.01:
-                    ax.text((j-i)/2, (i+j)/2+0.5, '**',
-                            fontsize=10*7/maxpc*fontscale, horizontalalignment='center',
-                            verticalalignment='center')
-                elif Pval[i, j] < 0.05:
-                    ax.text((j-i)/2, (i+j)/2+0.5, '*',
-                            fontsize=10*7/maxpc*fontscale, horizontalalignment='center',
-                            verticalalignment='center')
-                elif Pval[i, j] < 0.1:
-                    ax.text((j-i)/2, (i+j)/2+0.5, r'$\cdot$',
-                            fontsize=10*7/maxpc*fontscale, horizontalalignment='center',
-                            verticalalignment='center')
-                else:
-                    if i == j:
-                        ax.text((j-i)/2, (i+j)/2+0.5, '=',
-                                fontsize=10*7/maxpc*fontscale, horizontalalignment='center',
-                                verticalalignment='center')
-                    elif i > j:
-                        ax.text((j-i)/2, (i+j)/2+0.5, r'$\supset$',
-                                fontsize=10*7/maxpc*fontscale, horizontalalignment='center',
-                                verticalalignment='center')
-                    else:
-                        ax.text((j-i)/2, (i+j)/2+0.5, r'$\subset$',
-                                fontsize=10*7/maxpc*fontscale, horizontalalignment='center',
-                                verticalalignment='center')
+    fontsize = 10*7/maxpc*fontscale
+
+    # Diamonds for all combinations of components, drawn as one collection
+    # coloured by the SMI values. Each diamond has its bottom corner at
+    # ((j-i)/2, (i+j)/2).
+    I, J = np.meshgrid(np.arange(pc[0]), np.arange(pc[1]), indexing='ij')
+    x = np.ravel(J-I)/2
+    y = np.ravel(I+J)/2
+    corners = np.array([[0, 0], [0.5, 0.5], [0, 1], [-0.5, 0.5]])
+    verts = np.column_stack([x, y])[:, np.newaxis, :] + corners
+    diamonds = PolyCollection(verts, cmap=mpl.cm.gray,
+                              norm=mpl.colors.Normalize(vmin=0, vmax=1),
+                              edgecolors=[0, 0, 0])
+    diamonds.set_array(np.ravel(smi.smi[:pc[0], :pc[1]]))
+    ax.add_collection(diamonds)
+
+    # Add significance symbols, one batch of glyphs per symbol
+    if significance:
+        P = np.ravel(Pval[:pc[0], :pc[1]])
+        symbols = np.select([P < 0.001, P < 0.01, P < 0.05, P < 0.1,
+                             np.ravel(I == J), np.ravel(I > J)],
+                            ['***', '**', '*', r'$\cdot$', '=', r'$\supset$'],
+                            default=r'$\subset$')
+        for symbol in np.unique(symbols):
+            mask = symbols == symbol
+            _drawGlyphs(ax, symbol, x[mask], y[mask]+0.5, fontsize)
 
     # Add component labels
     for i in range(pc[0]):
         ax.text(-i/2-0.25-maxpc*0.015, i/2-maxpc*0.015, i+1,
-                fontsize=10*7/maxpc*fontscale, horizontalalignment='right',
+                fontsize=fontsize, horizontalalignment='right',
                 verticalalignment='center')
 
     for j in range(pc[1]):
         ax.text(j/2+0.25+maxpc*0.015, j/2-maxpc*0.015, j+1,
-                fontsize=10*7/maxpc*fontscale, horizontalalignment='left',
+                fontsize=fontsize, horizontalalignment='left',
                 verticalalignment='center')
 
     # Set axis limitations
@@ -127,8 +168,8 @@ def plotSMI(smi, pc='max', significance=True, X1name='X1', X2name='X2',
             verticalalignment='center')
     ax.text((pc[1]+3)/4, (pc[0]+pc[1]+4)/16, X2name, horizontalalignment='left',
             verticalalignment='center')
-    plt.axis('off')
-    plt.subplots_adjust(right=0.7)
+    ax.axis('off')
+    fig.subplots_adjust(right=0.7)
 
     # Add a custom colorbar
     ax1 = fig.add_axes([0.85, 0.15, 0.05, 0.7])
@@ -138,4 +179,9 @@ def plotSMI(smi, pc='max', significance=True, X1name='X1', X2name='X2',
                                     norm=norm,
                                     orientation='vertical')
     cb1.set_label('SMI')
-    plt.show()
+    timer.lap('artists')
+    if show:
+        plt.show()
+    timer.end('show')
+    if not show:
+        return fig
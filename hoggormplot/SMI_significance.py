@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+"""Cached and parallel permutation testing for the SMI"""
+
+import hashlib
+import os
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+
+# Number of permutations per task. Fixed, so that results for a given seed
+# do not depend on the number of processes.
+CHUNKSIZE = 250
+
+# P-values per SMI object, keyed by the settings of the permutation test
+_pvalues = weakref.WeakKeyDictionary()
+
+
+def _smiValues(TU, projection):
+    """
+    Returns the SMI values for all combinations of components from the cross
+    product TU of two orthonormal score matrices.
+    """
+    ncomp1, ncomp2 = np.shape(TU)
+    if projection == 'Orthogonal':
+        m = np.minimum.outer(np.arange(ncomp1), np.arange(ncomp2)) + 1
+        return np.cumsum(np.cumsum(np.square(TU), axis=1), axis=0) / m
+
+    smiB = np.zeros([ncomp1, ncomp2])
+    for p in range(ncomp1):
+        for q in range(ncomp2):
+            s = np.linalg.svd(TU[:p+1, :q+1], compute_uv=False)
+            smiB[p, q] = np.square(np.mean(s))
+    return smiB
+
+
+def _permutationCounts(task):
+    """
+    Runs one chunk of permutations and returns, per combination of
+    components, how often the observed SMI exceeded the permuted one.
+    """
+    Scores1, Scores2, smi, projection, replicates, B, seed = task
+    rng = np.random.RandomState(seed)
+    counts = np.zeros(np.shape(smi))
+
+    if replicates is not None:
+        # Permute across and inside replicate sets, objects are assumed to
+        # be ordered by replicate set
+        uni = np.unique(replicates, return_inverse=True)
+        vecOut = np.arange(np.shape(uni[0])[0])
+        vecIn = np.arange(np.sum(uni[1] == 0))
+        BScores1 = Scores1.copy()
+
+    for b in range(B):
+        if replicates is None:
+            BScores1 = Scores1[rng.permutation(np.shape(Scores1)[0])]
+        else:
+            rng.shuffle(vecOut)
+            for j in range(len(vecOut)):
+                rng.shuffle(vecIn)
+                BScores1[uni[1] == j, :] = Scores1[vecOut[j]*len(vecIn) + vecIn, :]
+        smiB = _smiValues(np.dot(np.transpose(BScores1), Scores2), projection)
+        # Increase P-value if non-significant permutation
+        counts[smi > np.maximum(smiB, 1-smiB)] += 1
+    return counts
+
+
+def _fingerprint(smi, B, seed, replicates):
+    """
+    Returns a key identifying the SMI results and the permutation settings.
+    """
+    digest = hashlib.sha1()
+    for arr in [smi.smi, smi.Scores1[:, :smi.ncomp1], smi.Scores2[:, :smi.ncomp2]]:
+        digest.update(np.ascontiguousarray(arr, dtype=float).tobytes())
+    if replicates is not None:
+        digest.update(np.ascontiguousarray(replicates).tobytes())
+    digest.update(repr((smi.projection, B, seed)).encode('utf-8'))
+    return 'p_' + digest.hexdigest()
+
+
+def smiSignificance(smi, B=10000, replicates=None, seed=None, processes=1,
+                    cacheFile=None):
+    """
+    Permutation based significance estimation for Similarity of matrices
+    index (SMI). Computes the same test as ``smi.significance``, but spreads
+    the permutations over a pool of processes and caches the P-values.
+
+    Results are cached per SMI object, number of permutations, seed and
+    replicates, so repeated calls (e.g. re-plotting with another font size)
+    return immediately. With ``cacheFile`` the P-values are also stored on
+    disk and reused across sessions as long as the SMI results are equal.
+
+    PARAMETERS
+    ----------
+    smi : SMI class object
+        the SMI results to test.
+
+    B : int, optional
+        number of permutations, default = 10000.
+
+    replicates : numpy array, optional
+        integer vector of replicates (must be balanced).
+
+    seed : int, optional
+        seed of the random permutations. With a given seed the P-values are
+        reproducible, independent of the number of processes.
+
+    processes : int, optional
+        number of worker processes. Defaults to 1, i.e. all permutations are
+        run in the calling process. With None one process per CPU is used.
+        Worker processes are started anew, so scripts calling this with
+        more than one process need an ``if __name__ == '__main__':`` guard
+        on platforms without the 'fork' start method (Windows, macOS).
+
+    cacheFile : str, optional
+        path of a ``.npz`` file in which P-values are stored. The extension
+        ``.npz`` is appended if missing.
+
+    RETURNS
+    -------
+    An array containing P-values for all combinations of components.
+
+    EXAMPLES
+    --------
+    >>> import hoggorm as ho
+    >>> import hoggormplot as hopl
+    >>> smiOP = ho.SMI(X1, X2, ncomp1=20, ncomp2=20)
+    >>> Pval = hopl.smiSignificance(smiOP, B=10000, seed=1, processes=4,
+    ...                             cacheFile='smi.npz')
+    >>> hopl.plotSMI(smiOP, seed=1, cacheFile='smi.npz')
+    """
+    repKey = None if replicates is None else tuple(np.ravel(replicates))
+    settings = (B, seed, repKey)
+    cached = _pvalues.setdefault(smi, {})
+    if settings in cached:
+        return cached[settings]
+
+    key = None
+    if cacheFile is not None:
+        if not cacheFile.endswith('.npz'):
+            cacheFile = cacheFile + '.npz'
+        key = _fingerprint(smi, B, seed, replicates)
+        if os.path.isfile(cacheFile):
+            with np.load(cacheFile) as stored:
+                if key in stored.files:
+                    cached[settings] = stored[key]
+                    return cached[settings]
+
+    # Split the permutations into chunks with their own seeds
+    numChunks = int(np.ceil(B / float(CHUNKSIZE)))
+    chunkSeeds = np.random.RandomState(seed).randint(0, 2**31 - 1, numChunks)
+    Scores1 = np.asarray(smi.Scores1)[:, :smi.ncomp1]
+    Scores2 = np.asarray(smi.Scores2)[:, :smi.ncomp2]
+    tasks = [(Scores1, Scores2, smi.smi, smi.projection, replicates,
+              min(CHUNKSIZE, B - chunk*CHUNKSIZE), chunkSeeds[chunk])
+             for chunk in range(numChunks)]
+
+    if processes == 1 or numChunks == 1:
+        counts = sum(_permutationCounts(task) for task in tasks)
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            counts = sum(pool.map(_permutationCounts, tasks))
+    P = counts / B
+
+    cached[settings] = P
+    if cacheFile is not None:
+        stored = {}
+        if os.path.isfile(cacheFile):
+            with np.load(cacheFile) as old:
+                stored = dict((name, old[name]) for name in old.files)
+        stored[key] = P
+        np.savez(cacheFile, **stored)
+    return P
@@ -11,13 +11,26 @@
 
 from .version import __version__
 
+from .batch_plot import batchPlot
 from .conv_biPlot import biplot
-from .conv_coefficientsPlot import (coefficients, coeffs)
+from .conv_coefficientsPlot import (coefficients, coeffs, coefficientsRange,
+                                    coefficientsStack)
+from .conv_controlChartPlot import controlChart
 from .conv_correlationLoadingsPlot import correlationLoadings
 from .conv_explainedVariancePlot import (explainedVariance, explVar)
+from .conv_influencePlot import influence
 from .conv_loadingWeightsPlot import loadingWeights
 from .conv_loadingsPlot import loadings
 from .conv_predictPlot import predict
 from .conv_scoresPlot import scores
+from .explorer import ComponentExplorer
+from .linked_views import LinkedViews
 from .main_plot import plot
+from .model_cache import (clearCache, setCacheSize)
+from .monitoring import (controlLimits, controlStatistics,
+                         influenceStatistics)
+from .profiling import PlotProfile
 from .SMI_plot import plotSMI
+from .snapshot import (PlotSnapshot, loadSnapshot, saveSnapshot)
+from .SMI_significance import smiSignificance
+from .stream_plot import ScoresStream
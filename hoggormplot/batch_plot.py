@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+"""Headless rendering of many hoggorm models to image files"""
+
+import os
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor
+
+import matplotlib.pyplot as plt
+
+from .main_plot import plot
+
+
+FORMATS = ['png', 'svg', 'pdf']
+
+# Models of the batch, set in each worker process by _initWorker
+_models = []
+
+
+def _initWorker(models):
+    # Worker processes never show anything, so render on the Agg backend
+    plt.switch_backend('Agg')
+    _models[:] = models
+
+
+def _renderModel(job):
+    """
+    Renders all plot specs for one model and writes the figures to file.
+    Returns the list of written file paths.
+    """
+    modelInd, modelName, specs, outDir, formats, dpi = job
+    model = _models[modelInd]
+    written = []
+    for ind, spec in enumerate(specs):
+        spec = dict(spec)
+        specName = spec.pop('name', 'plot{0}'.format(ind + 1))
+
+        spec['show'] = False
+        figs = plot(model, **spec)
+
+        for figInd, fig in enumerate(figs):
+            for fmt in formats:
+                fileName = '{0}_{1}_{2}.{3}'.format(modelName, specName,
+                                                    figInd + 1, fmt)
+                path = os.path.join(outDir, fileName)
+                fig.savefig(path, format=fmt, dpi=dpi)
+                written.append(path)
+    return written
+
+
+def batchPlot(models, specs, outDir, formats=['png'], modelNames=[],
+              processes=None, dpi=None):
+    """
+    Renders plots of many hoggorm models to image files. Models are
+    distributed over a pool of worker processes which draw on the
+    non-interactive Agg backend, so no display is needed.
+
+    PARAMETERS
+    ----------
+    models : list
+        List of nipalsPCA/nipalsPCR/nipalsPLS1/nipalsPLS2 class objects
+        computed in hoggorm. Snapshots opened with ``loadSnapshot`` may be
+        given instead. Forked workers inherit them like models, otherwise
+        they are pickled as their path and every worker maps the arrays
+        itself.
+
+    specs : list
+        List of dictionaries holding keyword arguments for
+        ``hoggormplot.plot``, e.g. ``{'plots': [1, 2], 'comp': [1, 3]}``.
+        Every spec is rendered for every model. The optional key ``'name'``
+        sets the spec part of the file names (default: 'plot1', 'plot2', ...).
+
+    outDir : str
+        Directory the files are written to. It is created if needed.
+
+    formats : list, optional
+        File formats to write, any of ``'png'``, ``'svg'`` and ``'pdf'``.
+        Defaults to ['png'].
+
+    modelNames : list, optional
+        Names used as prefix of the file names, one per model. Defaults to
+        'model1', 'model2', ...
+
+    processes : int, optional
+        Number of worker processes. Defaults to the number of CPUs. On
+        platforms without the 'fork' start method (e.g. Windows) the models
+        are pickled and sent to every worker.
+
+    dpi : float, optional
+        Resolution of raster files. Defaults to the matplotlib setting.
+
+    RETURNS
+    -------
+    A list holding the paths of all written files. Files are named
+    ``<modelName>_<specName>_<figure number>.<format>``.
+
+    EXAMPLES
+    --------
+    >>> import hoggorm as ho
+    >>> import hoggormplot as hopl
+    >>> models = [ho.nipalsPCA(arrX=X, numComp=4) for X in my_X_datasets]
+    >>> specs = [{'name': 'overview', 'plots': [1, 2, 6]},
+    ...          {'name': 'scores23', 'plots': [1], 'comp': [2, 3]}]
+    >>> hopl.batchPlot(models, specs, 'report', formats=['png', 'pdf'])
+    """
+    for fmt in formats:
+        if fmt not in FORMATS:
+            raise ValueError('Unsupported format {0}, use one of {1}'.format(
+                fmt, FORMATS))
+    if len(modelNames) == 0:
+        modelNames = ['model{0}'.format(num)
+                      for num in range(1, len(models) + 1)]
+    elif len(modelNames) != len(models):
+        raise ValueError('modelNames must hold one name per model')
+
+    if not os.path.isdir(outDir):
+        os.makedirs(outDir)
+
+    # The models reach every worker once through the pool initializer.
+    # Models holding cross validation results can not be pickled, so fork
+    # the workers where the platform supports it: forked workers inherit
+    # the initializer arguments without pickling.
+    if 'fork' in mp.get_all_start_methods():
+        context = mp.get_context('fork')
+    else:
+        context = mp.get_context()
+    jobs = [(ind, modelName, list(specs), outDir, list(formats), dpi)
+            for ind, modelName in enumerate(modelNames)]
+
+    written = []
+    with ProcessPoolExecutor(max_workers=processes, mp_context=context,
+                             initializer=_initWorker,
+                             initargs=(list(models),)) as pool:
+        for paths in pool.map(_renderModel, jobs):
+            written.extend(paths)
+    return written
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+"""Redrawing of changing artists over a cached figure background"""
+
+
+class _Blitter(object):
+    """
+    Keeps a copy of the figure without the artists returned by ``artists``
+    and redraws only those artists on top of it. The artists are marked as
+    animated, so they are left out of every full draw and the background
+    is refreshed on each draw event. Canvases that do not support blitting
+    fall back to ``draw_idle``.
+    """
+
+    def __init__(self, fig, artists):
+        self.fig = fig
+        self.artists = artists
+        self.enabled = False
+        self._background = None
+
+    def connect(self):
+        """
+        Starts blitting on the current canvas of the figure.
+        """
+        canvas = self.fig.canvas
+        self.enabled = getattr(canvas, 'supports_blit', False)
+        if self.enabled:
+            for artist in self.artists():
+                artist.set_animated(True)
+            canvas.mpl_connect('draw_event', self._onDraw)
+
+    def _onDraw(self, event):
+        # A full redraw leaves out the animated artists, store the result
+        # as background and draw them on top
+        self._background = self.fig.canvas.copy_from_bbox(self.fig.bbox)
+        self._drawArtists()
+
+    def _drawArtists(self):
+        for artist in self.artists():
+            self.fig.draw_artist(artist)
+
+    def redraw(self):
+        """
+        Shows the current state of the artists.
+        """
+        canvas = self.fig.canvas
+        if not self.enabled or self._background is None:
+            canvas.draw_idle()
+            return
+        canvas.restore_region(self._background)
+        self._drawArtists()
+        canvas.blit(self.fig.bbox)
+        canvas.flush_events()
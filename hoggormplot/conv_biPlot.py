@@ -4,7 +4,9 @@ from .main_plot import plot
 
 
 def biplot(model, comp=[1, 2], which=[],
-           objNames=[], XvarNames=[], YvarNames=[], figsize=None):
+           objNames=[], XvarNames=[], YvarNames=[], figsize=None,
+           maxLabels=None, labelBy='distance', show=True, density=False,
+           densityOutliers=0):
     """
     This is a convenience plot function which generates a bi-plot of hoggorm
     models.
@@ -25,18 +27,40 @@ def biplot(model, comp=[1, 2], which=[],
 
             - ``'Both'`` (defaults listed with 'plots' parameter)
 
-    objNames : list, optional
+    objNames : list or pandas Index, optional
         Object names may be provided in this list.
 
-    XvarNames : list, optional
+    XvarNames : list or pandas Index, optional
         Names of variables in array X may be provided in this list.
 
-    YvarNames : list, optional
+    YvarNames : list or pandas Index, optional
         Names of variables in Y may be provided in this list.
 
     figsize : tuple, optional
         Sets figure width and height in inches
 
+    maxLabels : int, optional
+        Maximum number of names drawn per scatter block. Defaults to None,
+        i.e. all points are labelled.
+
+    labelBy : str, optional
+        Ranking of points when ``maxLabels`` is set, either ``'distance'``
+        (default) or ``'leverage'``.
+
+    show : boolean, optional
+        When set to ``'show=False'`` the figures are returned in a list
+        instead of being displayed with ``plt.show()``. They are not
+        registered with pyplot and need not be closed.
+
+    density : boolean or int, optional
+        When set to ``'density=True'`` objects are drawn as a density image
+        instead of as individual points. An integer sets the number of bins
+        per axis (default 200).
+
+    densityOutliers : int, optional
+        In density mode, objects in bins holding at most this many objects
+        are also drawn as individual points. Defaults to 0.
+
     RETURNS
     -------
     A bi-plot based on the input hoggorm model.
@@ -50,6 +74,7 @@ def biplot(model, comp=[1, 2], which=[],
     >>> hopl.biplot(myModel, comp=[2, 4], which=['Both'])
     >>> hopl.biplot(myModel)
     """
-    plot(model=model, comp=comp, plots=[4], which=which,
-         objNames=objNames, XvarNames=XvarNames, YvarNames=YvarNames,
-         figsize=figsize)
+    return plot(model=model, comp=comp, plots=[4], which=which,
+                objNames=objNames, XvarNames=XvarNames, YvarNames=YvarNames,
+                figsize=figsize, maxLabels=maxLabels, labelBy=labelBy,
+                show=show, density=density, densityOutliers=densityOutliers)
@@ -1,10 +1,16 @@
 # -*- coding: utf-8 -*-
 
 import hoggorm
-from .main_plot import plot
+import numpy as np
+from matplotlib.collections import LineCollection
+from matplotlib.colors import Normalize
+from .labels import _asNames, _DefaultNames
+from .main_plot import plot, _decimate, _Figures, _maxPoints
+from .model_cache import cached, derived
 
 
-def coefficients(model, comp=[1], figsize=None):
+def coefficients(model, comp=[1], figsize=None, show=True, overlay=False,
+                 smallMultiples=False, maxPoints=None):
     """
     This is a convenience plot function which generates coefficients plots of 
     hoggorm models.
@@ -20,6 +26,24 @@ def coefficients(model, comp=[1], figsize=None):
     figsize : tuple, optional 
         Sets figure width and height in inches
 
+    show : boolean, optional
+        When set to ``'show=False'`` the figures are returned in a list
+        instead of being displayed with ``plt.show()``. They are not
+        registered with pyplot and need not be closed.
+
+    overlay : boolean, optional
+        When set to ``'overlay=True'`` the coefficients of all responses are
+        drawn into one axes as a single line collection.
+
+    smallMultiples : boolean, optional
+        When set to ``'smallMultiples=True'`` the coefficients of all
+        responses are drawn as small panels of one figure.
+
+    maxPoints : int or str, optional
+        Maximum number of points per coefficient line. Long spectra are
+        reduced to the minima and maxima of equally sized segments. With
+        ``'auto'`` two points are kept per pixel of the axes width.
+
     RETURNS
     -------
     A coefficients plot based on the input Hoggorm model.
@@ -33,11 +57,15 @@ def coefficients(model, comp=[1], figsize=None):
     >>> hopl.coefficients(myModel, comp=[1, 2, 3])
     >>> hopl.coefficients(myModel)
     >>> hopl.coefficients(myModel, comp=[2])
+    >>> hopl.coefficients(myModel, overlay=True, maxPoints=1000)
     """
-    plot(model=model, plots=[5], comp=comp, figsize=figsize)
+    return plot(model=model, plots=[5], comp=comp, figsize=figsize, show=show,
+                overlay=overlay, smallMultiples=smallMultiples,
+                maxPoints=maxPoints)
 
 
-def coeffs(model, comp=[1], figsize=None):
+def coeffs(model, comp=[1], figsize=None, show=True, overlay=False,
+           smallMultiples=False, maxPoints=None):
     """
     This is a convenience plot function which generates coefficients plots of 
     hoggorm models. Note that this convenience function is identical to 
@@ -53,6 +81,24 @@ def coeffs(model, comp=[1], figsize=None):
     figsize : tuple, optional 
         Sets figure width and height in inches
 
+    show : boolean, optional
+        When set to ``'show=False'`` the figures are returned in a list
+        instead of being displayed with ``plt.show()``. They are not
+        registered with pyplot and need not be closed.
+
+    overlay : boolean, optional
+        When set to ``'overlay=True'`` the coefficients of all responses are
+        drawn into one axes as a single line collection.
+
+    smallMultiples : boolean, optional
+        When set to ``'smallMultiples=True'`` the coefficients of all
+        responses are drawn as small panels of one figure.
+
+    maxPoints : int or str, optional
+        Maximum number of points per coefficient line. Long spectra are
+        reduced to the minima and maxima of equally sized segments. With
+        ``'auto'`` two points are kept per pixel of the axes width.
+
     RETURNS
     -------
     A coefficients plot based on the input Hoggorm model.
@@ -66,5 +112,169 @@ def coeffs(model, comp=[1], figsize=None):
     >>> hopl.coeffs(myModel, comp=[1, 2, 3])
     >>> hopl.coeffs(myModel)
     >>> hopl.coeffs(myModel, comp=[2])
+    >>> hopl.coeffs(myModel, overlay=True, maxPoints=1000)
     """
-    plot(model=model, plots=[5], comp=comp, figsize=figsize)
+    return plot(model=model, plots=[5], comp=comp, figsize=figsize, show=show,
+                overlay=overlay, smallMultiples=smallMultiples,
+                maxPoints=maxPoints)
+
+
+def coefficientsStack(model, numComp=None):
+    """
+    Returns the regression coefficients of a model for 1 up to ``numComp``
+    components stacked into one array. The coefficients of all component
+    counts are fetched in one pass and cached per model, so repeated calls
+    (and coefficient plots of single component counts) reuse them.
+
+    PARAMETERS
+    ----------
+    model : nipalsPCR/nipalsPLSR1/nipalsPLSR2 class object computed in Hoggorm
+
+    numComp : int, optional
+        Highest number of components. Defaults to all components of the
+        model.
+
+    RETURNS
+    -------
+    An array of shape (numComp, number of X variables, number of Y
+    variables). Entry ``[a - 1]`` holds the coefficients for ``a``
+    components. The array is shared with the cache and must not be
+    modified in place.
+
+
+    EXAMPLES
+    --------
+    >>> import hoggorm as ho
+    >>> import hoggormplot as hopl
+    >>> myModel = ho.nipalsPLS2(arrX=my_X_data, arrY=my_Y_data, cvType=["loo"])
+    >>> stack = hopl.coefficientsStack(myModel)
+    >>> stack[2]  # coefficients for 3 components
+    """
+    maxComp = np.shape(cached(model, 'X_scores'))[1]
+    if numComp is None:
+        numComp = maxComp
+    numComp = int(numComp)
+    if not 1 <= numComp <= maxComp:
+        raise ValueError('numComp must be between 1 and {0}'.format(maxComp))
+
+    def stack():
+        coefs = [cached(model, 'regressionCoefficients', num)
+                 for num in range(1, maxComp + 1)]
+        numX = np.shape(coefs[0])[0]
+        return np.stack([np.reshape(coef, (numX, -1)) for coef in coefs])
+
+    return derived(model, ('coefficientsStack',), stack)[:numComp]
+
+
+def coefficientsRange(model, numComp=None, mode='overlay', YvarNames=[],
+                      figsize=None, show=True, maxPoints=None):
+    """
+    This is a convenience plot function which generates one plot per
+    response with the regression coefficients for 1 up to ``numComp``
+    components, for choosing the number of components of a model. The
+    coefficients are taken from ``coefficientsStack``, so the model is
+    queried only once for all component counts.
+
+
+    PARAMETERS
+    ----------
+    model : nipalsPCR/nipalsPLSR1/nipalsPLSR2 class object computed in Hoggorm
+
+    numComp : int, optional
+        Highest number of components. Defaults to all components of the
+        model.
+
+    mode : str, optional
+        ``'overlay'`` (default) draws the coefficients of all component
+        counts as one line collection coloured by the number of
+        components. ``'heatmap'`` draws them as an image with one row per
+        number of components.
+
+    YvarNames : list or pandas Index, optional
+        Names of Y variables may be provided in this list.
+
+    figsize : tuple, optional 
+        Sets figure width and height in inches
+
+    show : boolean, optional
+        When set to ``'show=False'`` the figures are returned in a list
+        instead of being displayed with ``plt.show()``. They are not
+        registered with pyplot and need not be closed.
+
+    maxPoints : int or str, optional
+        Maximum number of points per coefficient line. Long spectra are
+        reduced to the minima and maxima of equally sized segments. With
+        ``'auto'`` two points are kept per pixel of the axes width. Only
+        used in overlay mode.
+
+    RETURNS
+    -------
+    Coefficients plots based on the input Hoggorm model.
+
+
+    EXAMPLES
+    --------
+    >>> import hoggorm as ho
+    >>> import hoggormplot as hopl
+    >>> myModel = ho.nipalsPLS2(arrX=my_X_data, arrY=my_Y_data, cvType=["loo"])
+    >>> hopl.coefficientsRange(myModel)
+    >>> hopl.coefficientsRange(myModel, numComp=8, mode='heatmap')
+    """
+    if mode not in ['overlay', 'heatmap']:
+        raise ValueError("mode must be 'overlay' or 'heatmap', "
+                         "got {0!r}".format(mode))
+    stack = coefficientsStack(model, numComp)
+    numComp, numX, numY = np.shape(stack)
+    YvarNames = _asNames(YvarNames)
+    if len(YvarNames) == 0:
+        YvarNames = _DefaultNames('Var', numY)
+
+    figures = _Figures(figsize, show)
+    for ind in range(numY):
+        ax = figures.newAxes()
+        coefs = stack[:, :, ind]
+
+        if mode == 'overlay':
+            # One line per number of components, positions are decimated
+            # per line so every line keeps its own peaks
+            xPos, values = _decimate(coefs.T, _maxPoints(ax, maxPoints))
+            norm = Normalize(0.5, numComp + 0.5)
+            lines = LineCollection(np.stack([xPos.T, values.T], axis=-1),
+                                   cmap='viridis', norm=norm, linewidths=1)
+            lines.set_array(np.arange(1, numComp + 1))
+            ax.add_collection(lines)
+            xMaxLine = numX * 1.05
+            ax.plot([0, xMaxLine], [0, 0], color='0.4', linestyle='dashed',
+                    linewidth=1)
+
+            yMin = np.min(values)
+            yMax = np.max(values)
+            yMargin = (yMax - yMin) * .05
+            ax.set_xlim(0, xMaxLine)
+            ax.set_ylim(min(yMin - yMargin, 0), max(yMax + yMargin, 0))
+            colorbar = ax.figure.colorbar(lines, ax=ax)
+            colorbar.set_label('Number of components')
+            ticks = colorbar
+        else:
+            lim = np.max(np.abs(coefs))
+            if lim == 0:
+                lim = 1.0
+            image = ax.imshow(coefs, aspect='auto', interpolation='nearest',
+                              cmap='RdBu_r', norm=Normalize(-lim, lim),
+                              origin='lower',
+                              extent=[-0.5, numX - 0.5, 0.5, numComp + 0.5])
+            ax.set_ylabel('Number of components')
+            colorbar = ax.figure.colorbar(image, ax=ax)
+            colorbar.set_label('Regression coefficient')
+            ticks = ax.yaxis
+        if numComp <= 10:
+            ticks.set_ticks(range(1, numComp + 1))
+
+        title = 'Regression coefficients'
+        if numY > 1:
+            title += ', ' + YvarNames[ind]
+        ax.set_title(title)
+        figures.finish()
+
+    if not show:
+        return figures.figs
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+from .main_plot import plot
+from .model_cache import cached
+
+
+def controlChart(model, comp=None, newX=[], limitLevels=[95, 99],
+                 figsize=None, show=True, maxPoints=None):
+    """
+    This is a convenience function that generates control charts of
+    Hotelling T2 and Q residuals of hoggorm models, for the calibration
+    objects followed by new objects in the order they are given.
+
+
+    PARAMETERS
+    ----------
+    model : nipalsPCA/nipalsPCR/nipalsPLSR1/nipalsPLSR2 class object computed
+        in Hoggorm
+
+    comp : list, optional
+        The list contains the number of components used. Defaults to all
+        components of the model.
+
+    newX : array or pandas DataFrame, optional
+        New measurement data X. The index and columns of a DataFrame are
+        used as default object and variable names.
+
+    limitLevels : list, optional
+        Confidence levels in percent of the control limits, estimated as
+        percentiles of the calibration objects. Defaults to [95, 99].
+
+    figsize : tuple, optional 
+        Sets figure width and height in inches
+
+    show : boolean, optional
+        When set to ``'show=False'`` the figures are returned in a list
+        instead of being displayed with ``plt.show()``. They are not
+        registered with pyplot and need not be closed.
+
+    maxPoints : int or str, optional
+        Maximum number of points per chart line. Long series are reduced to
+        the minima and maxima of equally sized segments, with ``'auto'`` to
+        two points per pixel of the axes width. Objects beyond the control
+        limits are always drawn.
+
+    RETURNS
+    -------
+    Control charts of Hotelling T2 and Q residuals.
+
+
+    EXAMPLES
+    --------
+    >>> import hoggorm as ho
+    >>> import hoggormplot as hopl
+    >>> myModel = ho.nipalsPCA(arrX=my_X_data, numComp=3)
+    >>> hopl.controlChart(myModel)
+    >>> hopl.controlChart(myModel, comp=[2], newX=my_new_data, maxPoints=5000)
+    """
+    if comp is None:
+        comp = [np.shape(cached(model, 'X_scores'))[1]]
+    return plot(model, comp=comp, plots=[8], newX=newX,
+                limitLevels=limitLevels, figsize=figsize, show=show,
+                maxPoints=maxPoints)
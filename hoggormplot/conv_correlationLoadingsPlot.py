@@ -5,7 +5,8 @@ from .main_plot import plot
 
 
 def correlationLoadings(model, comp=[1, 2], which=[],
-                        XvarNames=[], YvarNames=[], figsize=None):
+                        XvarNames=[], YvarNames=[], figsize=None,
+                        maxLabels=None, labelBy='distance', show=True):
     """
     This is a convenience plot function which generates correlation loadings 
     plots of hoggorm models.
@@ -26,15 +27,28 @@ def correlationLoadings(model, comp=[1, 2], which=[],
             - ``'Y'``
             - ``'Both'`` (defaults listed with 'plots' parameter)
 
-    XvarNames : list, optional
+    XvarNames : list or pandas Index, optional
         Names of variables in array X may be provided in this list.
 
-    YvarNames : list, optional
+    YvarNames : list or pandas Index, optional
         Names of variables in Y may be provided in this list.
 
     figsize : tuple, optional 
         Sets figure width and height in inches
 
+    maxLabels : int, optional
+        Maximum number of names drawn per scatter block. Defaults to None,
+        i.e. all points are labelled.
+
+    labelBy : str, optional
+        Ranking of points when ``maxLabels`` is set, either ``'distance'``
+        (default) or ``'leverage'``.
+
+    show : boolean, optional
+        When set to ``'show=False'`` the figures are returned in a list
+        instead of being displayed with ``plt.show()``. They are not
+        registered with pyplot and need not be closed.
+
     RETURNS
     -------
     A correlation loadings plot based on the input hoggorm model.
@@ -48,5 +62,6 @@ def correlationLoadings(model, comp=[1, 2], which=[],
     >>> hopl.correlationLoadings(myModel, comp=[2,4], which=['Both'])
     >>> hopl.correlationLoadings(myModel)
     """
-    plot(model=model, comp=comp, plots=[3], which=which,
-         XvarNames=XvarNames, YvarNames=YvarNames, figsize=figsize)
+    return plot(model=model, comp=comp, plots=[3], which=which,
+                XvarNames=XvarNames, YvarNames=YvarNames, figsize=figsize,
+                maxLabels=maxLabels, labelBy=labelBy, show=show)
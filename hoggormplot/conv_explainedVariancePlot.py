@@ -5,7 +5,8 @@ from .main_plot import plot
 
 
 def explainedVariance(model, which=[], cumulative=True, individual=False,
-                      validated=[], figsize=None):
+                      validated=[], figsize=None, show=True, heatmap=False,
+                      varOrder=None):
     """
     This function generates explained variances plots of hoggorm models.
 
@@ -38,6 +39,22 @@ def explainedVariance(model, which=[], cumulative=True, individual=False,
     figsize : tuple, optional 
         Sets figure width and height in inches
 
+    show : boolean, optional
+        When set to ``'show=False'`` the figures are returned in a list
+        instead of being displayed with ``plt.show()``. They are not
+        registered with pyplot and need not be closed.
+
+    heatmap : boolean, optional
+        When set to ``'heatmap=True'`` together with ``'individual=True'``
+        the explained variances of all variables are drawn as one image
+        with a row per component and a column per variable.
+
+    varOrder : str, optional
+        Order of the variables in the heatmap, either None (order of the
+        data, default), ``'sort'`` (by total explained variance) or
+        ``'cluster'`` (similar explained variance profiles next to each
+        other).
+
     RETURNS
     -------
     An explained variance plot based on the input Hoggorm model.
@@ -51,14 +68,17 @@ def explainedVariance(model, which=[], cumulative=True, individual=False,
     >>> hopl.explainedVariance(myModel, which=['Both'], individual=False)
     >>> hopl.explainedVariance(myModel)
     >>> hopl.explainedVariance(myModel, cumulative=True)
+    >>> hopl.explainedVariance(myModel, individual=True, heatmap=True,
+    ...                        varOrder='cluster')
     """
-    plot(model, plots=[6], which=which,
-         cumulative=cumulative, individual=individual, validated=validated,
-         figsize=figsize)
+    return plot(model, plots=[6], which=which, cumulative=cumulative,
+                individual=individual, validated=validated, figsize=figsize,
+                show=show, heatmap=heatmap, varOrder=varOrder)
 
 
 def explVar(model, which=[],
-            cumulative=True, individual=False, validated=[], figsize=None):
+            cumulative=True, individual=False, validated=[], figsize=None,
+            show=True, heatmap=False, varOrder=None):
     """
     This function generates explained variances plots of hoggorm models.
 
@@ -91,6 +111,22 @@ def explVar(model, which=[],
     figsize : tuple, optional 
         Sets figure width and height in inches
 
+    show : boolean, optional
+        When set to ``'show=False'`` the figures are returned in a list
+        instead of being displayed with ``plt.show()``. They are not
+        registered with pyplot and need not be closed.
+
+    heatmap : boolean, optional
+        When set to ``'heatmap=True'`` together with ``'individual=True'``
+        the explained variances of all variables are drawn as one image
+        with a row per component and a column per variable.
+
+    varOrder : str, optional
+        Order of the variables in the heatmap, either None (order of the
+        data, default), ``'sort'`` (by total explained variance) or
+        ``'cluster'`` (similar explained variance profiles next to each
+        other).
+
     RETURNS
     -------
     An explained variance plot based on the input Hoggorm model.
@@ -104,7 +140,8 @@ def explVar(model, which=[],
     >>> hopl.explVar(myModel, which=['Both'], individual=False)
     >>> hopl.explVar(myModel)
     >>> hopl.explVar(myModel, cumulative=True)
+    >>> hopl.explVar(myModel, individual=True, heatmap=True, varOrder='cluster')
     """
-    plot(model, plots=[6], which=which,
-         cumulative=cumulative, individual=individual, validated=validated,
-         figsize=figsize)
+    return plot(model, plots=[6], which=which, cumulative=cumulative,
+                individual=individual, validated=validated, figsize=figsize,
+                show=show, heatmap=heatmap, varOrder=varOrder)
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+from .main_plot import plot
+from .model_cache import cached
+
+
+def influence(model, comp=None, objNames=[], limitLevels=[95, 99],
+              figsize=None, maxLabels=None, labelBy='distance', show=True,
+              density=False, densityOutliers=0):
+    """
+    This is a convenience function that generates influence plots, i.e.
+    leverage vs. residual variance of the calibration objects, of hoggorm
+    models.
+
+
+    PARAMETERS
+    ----------
+    model : nipalsPCA/nipalsPCR/nipalsPLSR1/nipalsPLSR2 class object computed
+        in Hoggorm
+
+    comp : list, optional
+        The list contains the number of components used. Defaults to all
+        components of the model.
+
+    objNames : list or pandas Index, optional
+        Object names may be provided in this list.
+
+    limitLevels : list, optional
+        Confidence levels in percent of the dashed limit lines, estimated as
+        percentiles of the calibration objects. Defaults to [95, 99].
+
+    figsize : tuple, optional 
+        Sets figure width and height in inches
+
+    maxLabels : int, optional
+        Maximum number of names drawn. Defaults to None, i.e. all points
+        are labelled.
+
+    labelBy : str, optional
+        Ranking of points when ``maxLabels`` is set, either ``'distance'``
+        (default) or ``'leverage'``.
+
+    show : boolean, optional
+        When set to ``'show=False'`` the figures are returned in a list
+        instead of being displayed with ``plt.show()``. They are not
+        registered with pyplot and need not be closed.
+
+    density : boolean or int, optional
+        When set to ``'density=True'`` objects are drawn as a density image
+        instead of as individual points. An integer sets the number of bins
+        per axis (default 200).
+
+    densityOutliers : int, optional
+        In density mode, objects in bins holding at most this many objects
+        are also drawn as individual points. Defaults to 0.
+
+    RETURNS
+    -------
+    An influence plot.
+
+
+    EXAMPLES
+    --------
+    >>> import hoggorm as ho
+    >>> import hoggormplot as hopl
+    >>> myModel = ho.nipalsPCA(arrX=my_X_data, numComp=3)
+    >>> hopl.influence(myModel)
+    >>> hopl.influence(myModel, comp=[2], maxLabels=10)
+    """
+    if comp is None:
+        comp = [np.shape(cached(model, 'X_scores'))[1]]
+    return plot(model, comp=comp, plots=[9], objNames=objNames,
+                limitLevels=limitLevels, figsize=figsize,
+                maxLabels=maxLabels, labelBy=labelBy, show=show,
+                density=density, densityOutliers=densityOutliers)
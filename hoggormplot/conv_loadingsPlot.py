@@ -5,7 +5,8 @@ from .main_plot import plot
 
 
 def loadings(model, comp=[1, 2], which=[], line=False,
-             weights=False, XvarNames=[], YvarNames=[], figsize=None):
+             weights=False, XvarNames=[], YvarNames=[], figsize=None,
+             maxLabels=None, labelBy='distance', show=True, maxPoints=None):
     """
     This is a convenience function that generates loadings plots of hoggorm 
     models.
@@ -34,15 +35,35 @@ def loadings(model, comp=[1, 2], which=[], line=False,
         When set to ``'weights=TRUE'`` loading weights will be plotted instead 
         of loadings.
 
-    XvarNames : list, optional
+    XvarNames : list or pandas Index, optional
         Names of variables in array X may be provided in this list.
 
-    YvarNames : list, optional
+    YvarNames : list or pandas Index, optional
         Names of variables in Y may be provided in this list.
 
     figsize : tuple, optional 
         Sets figure width and height in inches
 
+    maxLabels : int, optional
+        Maximum number of names drawn per scatter block. Defaults to None,
+        i.e. all points are labelled.
+
+    labelBy : str, optional
+        Ranking of points when ``maxLabels`` is set, either ``'distance'``
+        (default) or ``'leverage'``.
+
+    show : boolean, optional
+        When set to ``'show=False'`` the figures are returned in a list
+        instead of being displayed with ``plt.show()``. They are not
+        registered with pyplot and need not be closed.
+
+    maxPoints : int or str, optional
+        Maximum number of points per line in line mode. Long loading
+        vectors (e.g. spectra) are reduced to the minima and maxima of
+        equally sized segments, and reduced again for the visible range
+        when zooming. With ``'auto'`` two points are kept per pixel of the
+        axes width.
+
     RETURNS
     -------
     A loadings plot.
@@ -56,7 +77,9 @@ def loadings(model, comp=[1, 2], which=[], line=False,
     >>> hopl.loadings(myModel, comp=[2,4], which=['Both'])
     >>> hopl.loadings(myModel)
     >>> hopl.loadings(myModel, line=True, weights=False)
+    >>> hopl.loadings(myModel, line=True, maxPoints='auto')
     """
-    plot(model=model, comp=comp, plots=[2], which=which, line=line,
-         weights=weights, XvarNames=XvarNames, YvarNames=YvarNames,
-         figsize=figsize)
+    return plot(model=model, comp=comp, plots=[2], which=which, line=line,
+                weights=weights, XvarNames=XvarNames, YvarNames=YvarNames,
+                figsize=figsize, maxLabels=maxLabels, labelBy=labelBy,
+                show=show, maxPoints=maxPoints)
@@ -5,7 +5,9 @@ from .main_plot import plot
 
 
 def predict(model, comp=[1, 2],
-            objNames=[], newX=[], newY=[], newObjNames=[], figsize=None):
+            objNames=[], newX=[], newY=[], newObjNames=[], figsize=None,
+            maxLabels=None, labelBy='distance', show=True, density=False,
+            densityOutliers=0, smallMultiples=False):
     """
     This is a convenience function that generates plots of predicted vs. 
     original values of hoggorm models.
@@ -19,18 +21,46 @@ def predict(model, comp=[1, 2],
     comp : list, optional
         The list contains components to be displayed. Defaults to [1,2].
 
-    newX : list, optional
-        The list contains one array of new measurement data X.
+    newX : array or pandas DataFrame, optional
+        New measurement data X. The index and columns of a DataFrame are
+        used as default object and variable names.
 
-    newY : list, optional
-        The list contains one array of new measurements of Y.
+    newY : array or pandas DataFrame, optional
+        New measurements of Y. The columns of a DataFrame are used as
+        default names of the Y variables.
 
-    newObjNames : list, optional
+    newObjNames : list or pandas Index, optional
         The list contains object names of new measurement data in X or Y.
 
     figsize : tuple, optional 
         Sets figure width and height in inches
 
+    maxLabels : int, optional
+        Maximum number of names drawn per scatter block. Defaults to None,
+        i.e. all points are labelled.
+
+    labelBy : str, optional
+        Ranking of points when ``maxLabels`` is set, either ``'distance'``
+        (default) or ``'leverage'``.
+
+    show : boolean, optional
+        When set to ``'show=False'`` the figures are returned in a list
+        instead of being displayed with ``plt.show()``. They are not
+        registered with pyplot and need not be closed.
+
+    density : boolean or int, optional
+        When set to ``'density=True'`` objects are drawn as a density image
+        instead of as individual points. An integer sets the number of bins
+        per axis (default 200).
+
+    densityOutliers : int, optional
+        In density mode, objects in bins holding at most this many objects
+        are also drawn as individual points. Defaults to 0.
+
+    smallMultiples : boolean, optional
+        When set to ``'smallMultiples=True'`` the predictions of all
+        responses are drawn as small panels of one figure.
+
     RETURNS
     -------
     A predicted vs. measured plot.
@@ -43,7 +73,10 @@ def predict(model, comp=[1, 2],
     >>> myModel = ho.nipalsPLS2(arrX=my_X_data, arrY=my_Y_data, cvType=["loo"])
     >>> hopl.predict(myModel)
     >>> hopl.predict(myModel, comp=[3, 4])
+    >>> hopl.predict(myModel, smallMultiples=True)
     """
-    plot(model, comp=comp, plots=[7],
-         objNames=objNames, newX=newX, newY=newY, newObjNames=newObjNames,
-         figsize=figsize)
+    return plot(model, comp=comp, plots=[7], objNames=objNames, newX=newX,
+                newY=newY, newObjNames=newObjNames, figsize=figsize,
+                maxLabels=maxLabels, labelBy=labelBy, show=show,
+                density=density, densityOutliers=densityOutliers,
+                smallMultiples=smallMultiples)
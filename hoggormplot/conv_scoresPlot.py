@@ -5,7 +5,9 @@ from .main_plot import plot
 
 
 def scores(model, comp=[1, 2], which=[],
-           objNames=[], newX=[], newY=[], newObjNames=[], figsize=None):
+           objNames=[], newX=[], newY=[], newObjNames=[], figsize=None,
+           maxLabels=None, labelBy='distance', show=True, density=False,
+           densityOutliers=0):
     """
     This is a convenience function that generates scores plots of hoggorm 
     models.
@@ -26,21 +28,45 @@ def scores(model, comp=[1, 2], which=[],
             - ``'Y'``
             - ``'Both'`` (defaults listed with 'plots' parameter)
 
-    objNames : list, optional
+    objNames : list or pandas Index, optional
         Object names may be provided in this list.
 
-    newX : list, optional
-        The list contains one array of new measurement data X.
+    newX : array or pandas DataFrame, optional
+        New measurement data X. The index and columns of a DataFrame are
+        used as default object and variable names.
 
-    newY : list, optional
-        The list contains one array of new measurements of Y.
+    newY : array or pandas DataFrame, optional
+        New measurements of Y. The columns of a DataFrame are used as
+        default names of the Y variables.
 
-    newObjNames : list, optional
+    newObjNames : list or pandas Index, optional
         The list contains object names of new measurement data in X or Y.
 
     figsize : tuple, optional 
         Sets figure width and height in inches
 
+    maxLabels : int, optional
+        Maximum number of names drawn per scatter block. Defaults to None,
+        i.e. all points are labelled.
+
+    labelBy : str, optional
+        Ranking of points when ``maxLabels`` is set, either ``'distance'``
+        (default) or ``'leverage'``.
+
+    show : boolean, optional
+        When set to ``'show=False'`` the figures are returned in a list
+        instead of being displayed with ``plt.show()``. They are not
+        registered with pyplot and need not be closed.
+
+    density : boolean or int, optional
+        When set to ``'density=True'`` objects are drawn as a density image
+        instead of as individual points. An integer sets the number of bins
+        per axis (default 200).
+
+    densityOutliers : int, optional
+        In density mode, objects in bins holding at most this many objects
+        are also drawn as individual points. Defaults to 0.
+
     RETURNS
     -------
     A scores plot.
@@ -54,6 +80,8 @@ def scores(model, comp=[1, 2], which=[],
     >>> hopl.scores(myModel, comp=[1, 3])
     >>> hopl.scores(myModel)
     """
-    plot(model=model, comp=comp, plots=[1], which=which,
-         objNames=objNames, newX=newX, newY=newY, newObjNames=newObjNames,
-         figsize=figsize)
+    return plot(model=model, comp=comp, plots=[1], which=which,
+                objNames=objNames, newX=newX, newY=newY,
+                newObjNames=newObjNames, figsize=figsize, maxLabels=maxLabels,
+                labelBy=labelBy, show=show, density=density,
+                densityOutliers=densityOutliers)
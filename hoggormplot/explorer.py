@@ -0,0 +1,226 @@
+# -*- coding: utf-8 -*-
+"""Interactive browsing of component pairs in scores and loadings plots"""
+
+import numpy as np
+import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
+
+from .blitting import _Blitter
+from .labels import _asNames, _DefaultNames, selectLabels
+from .main_plot import plot, _pyplotFigures
+from .model_cache import cached
+
+
+class ComponentExplorer(object):
+    """
+    Scores and loadings plot side by side in one figure, in which the
+    displayed pair of components can be changed in place. Both panels are
+    drawn once by ``hoggormplot.plot``. Changing the components only moves
+    the points of the existing collections and updates labels, while the
+    axis limits are fixed to the range of all components. On backends that
+    support it the changes are blitted, so a step takes milliseconds also
+    for models with many components.
+
+    Keys in the figure window:
+
+        - right / left: next / previous pair, both components +1 / -1
+        - up / down: second component +1 / -1
+
+    PARAMETERS
+    ----------
+    model : nipalsPCA/nipalsPCR/nipalsPLS1/nipalsPLS2 class object computed
+        in hoggorm.
+
+    comp : list, optional
+        The pair of components displayed first. Defaults to [1, 2].
+
+    which : str, optional
+        Block to display, ``'X'`` (default) or ``'Y'``.
+
+    objNames : list, optional
+        Object names may be provided in this list.
+
+    XvarNames : list, optional
+        Names of X variables may be provided in this list.
+
+    YvarNames : list, optional
+        Names of Y variables may be provided in this list.
+
+    maxLabels : int, optional
+        Maximum number of names drawn per panel, selected anew for every
+        pair of components. Defaults to 20. With None all points are
+        labelled.
+
+    labelBy : str, optional
+        Ranking of points when ``maxLabels`` is set, either ``'distance'``
+        (default) or ``'leverage'``.
+
+    figsize : tuple, optional
+        Sets figure width and height in inches.
+
+    show : boolean, optional
+        When True (default) the figure is registered with pyplot, key
+        handling is connected and the figure is shown. Otherwise the
+        figure is available as ``explorer.fig`` and the components are
+        changed by calling ``setComponents`` or ``step``.
+
+    EXAMPLES
+    --------
+    >>> import hoggorm as ho
+    >>> import hoggormplot as hopl
+    >>> myModel = ho.nipalsPLS2(arrX=my_X_data, arrY=my_Y_data, numComp=20)
+    >>> hopl.ComponentExplorer(myModel)
+
+    Without a window, e.g. to save all pairs of neighbouring components:
+
+    >>> explorer = hopl.ComponentExplorer(myModel, show=False)
+    >>> for num in range(1, 20):
+    ...     explorer.setComponents([num, num + 1])
+    ...     explorer.fig.savefig('comp{0}.png'.format(num))
+    """
+
+    def __init__(self, model, comp=[1, 2], which='X', objNames=[],
+                 XvarNames=[], YvarNames=[], maxLabels=20,
+                 labelBy='distance', figsize=None, show=True):
+        self.model = model
+        self.which = which
+        self.maxLabels = maxLabels
+        self.labelBy = labelBy
+
+        with _pyplotFigures(show):
+            self.fig = plot(model, comp=comp, plots=[1, 2], which=[which],
+                            objNames=objNames, XvarNames=XvarNames,
+                            YvarNames=YvarNames, figsize=figsize,
+                            maxLabels=maxLabels, labelBy=labelBy, show=False,
+                            layout=(1, 2))[0]
+
+        self.XexplVar = cached(model, 'X_calExplVar')
+        self.YexplVar = None
+        if which == 'Y':
+            scores = cached(model, 'Y_scores')
+            loadings = cached(model, 'Y_loadings')
+            varNames = YvarNames
+        else:
+            scores = cached(model, 'X_scores')
+            loadings = cached(model, 'X_loadings')
+            varNames = XvarNames
+        if hasattr(model, 'arrY_input') or hasattr(model, 'vecy_input'):
+            self.YexplVar = cached(model, 'Y_calExplVar')
+        objNames = _asNames(objNames)
+        varNames = _asNames(varNames)
+        if len(objNames) == 0:
+            objNames = _DefaultNames('Obj', np.shape(scores)[0])
+        if len(varNames) == 0:
+            varNames = _DefaultNames('Var', np.shape(loadings)[0])
+        self.numComp = min(np.shape(scores)[1], np.shape(loadings)[1])
+
+        self.panels = [self._panel(self.fig.axes[0], scores, objNames, 0),
+                       self._panel(self.fig.axes[1], loadings, varNames, .05)]
+
+        self.comp = None
+        self._blitter = _Blitter(self.fig, self._animated)
+        self.setComponents(comp)
+
+        if show:
+            plt.figure(self.fig.number)
+            self._connect()
+            plt.show()
+
+    def _panel(self, ax, values, names, space):
+        """
+        Prepares one panel for in-place updates: fixed symmetric limits over
+        all components, axis lines across the whole panel and a pool of text
+        artists replacing the labels drawn by ``plot``.
+        """
+        lim = np.max(np.abs(values[:, :self.numComp])) * 1.3
+        if lim == 0:
+            lim = 1.0
+        ax.set_xlim(-lim, lim)
+        ax.set_ylim(-lim, lim)
+        axisLines = [collection for collection in ax.collections
+                     if isinstance(collection, LineCollection)][0]
+        axisLines.set_segments([[[0, -lim], [0, lim]], [[-lim, 0], [lim, 0]]])
+
+        fontsize = ax.texts[0].get_fontsize() if ax.texts else 10
+        for text in list(ax.texts):
+            text.remove()
+        numTexts = len(names) if self.maxLabels is None else \
+            min(self.maxLabels, len(names))
+        texts = [ax.text(0, 0, '', fontsize=fontsize) for num in range(numTexts)]
+
+        return {'ax': ax, 'values': values, 'names': names,
+                'collection': ax.collections[0], 'texts': texts,
+                'space': space * lim / 1.3}
+
+    def _axisLabel(self, num, scores):
+        explVar = 'comp {0} ({1}%'.format(num, round(self.XexplVar[num-1], 1))
+        if scores and self.YexplVar is not None:
+            explVar += ', {0}%'.format(round(self.YexplVar[num-1], 1))
+        return explVar + ')'
+
+    def _animated(self):
+        """
+        Returns all artists that change with the components.
+        """
+        artists = []
+        for panel in self.panels:
+            ax = panel['ax']
+            artists.extend([panel['collection'], ax.xaxis.label,
+                            ax.yaxis.label])
+            artists.extend(panel['texts'])
+        return artists
+
+    def setComponents(self, comp):
+        """
+        Displays the given pair of components, e.g. ``[2, 3]``.
+        """
+        comp = [int(comp[0]), int(comp[1])]
+        for num in comp:
+            if not 1 <= num <= self.numComp:
+                raise ValueError('components must be between 1 and '
+                                 '{0}'.format(self.numComp))
+        self.comp = comp
+
+        for ind, panel in enumerate(self.panels):
+            coords = panel['values'][:, [comp[0]-1, comp[1]-1]]
+            panel['collection'].set_offsets(coords)
+
+            texts = panel['texts']
+            if self.maxLabels is None:
+                indices = range(len(texts))
+            else:
+                indices = selectLabels(coords, self.maxLabels, self.labelBy)
+            for text, num in zip(texts, indices):
+                text.set_position(coords[num] + panel['space'])
+                text.set_text(panel['names'][num])
+                text.set_visible(True)
+            for text in texts[len(indices):]:
+                text.set_visible(False)
+
+            panel['ax'].set_xlabel(self._axisLabel(comp[0], ind == 0))
+            panel['ax'].set_ylabel(self._axisLabel(comp[1], ind == 0))
+
+        self._blitter.redraw()
+
+    def step(self, delta=1, second=False):
+        """
+        Moves both components by ``delta``, or only the second component
+        with ``second=True``. Steps beyond the available components are
+        ignored.
+        """
+        if second:
+            comp = [self.comp[0], self.comp[1] + delta]
+        else:
+            comp = [self.comp[0] + delta, self.comp[1] + delta]
+        if min(comp) >= 1 and max(comp) <= self.numComp:
+            self.setComponents(comp)
+
+    def _connect(self):
+        self._blitter.connect()
+        self.fig.canvas.mpl_connect('key_press_event', self._onKey)
+
+    def _onKey(self, event):
+        steps = {'right': (1, False), 'left': (-1, False),
+                 'up': (1, True), 'down': (-1, True)}
+        if event.key in steps:
+            self.step(*steps[event.key])
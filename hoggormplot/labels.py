@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+"""Selection and placement of point labels in scatter plots"""
+
+import operator
+
+import numpy as np
+
+
+class _DefaultNames(object):
+    """
+    Read-only sequence of the default names '<prefix> 1', '<prefix> 2', ...
+    Only the length is stored, a name is formatted when it is looked up.
+    """
+
+    def __init__(self, prefix, length):
+        self.prefix = prefix
+        self.length = int(length)
+
+    def __len__(self):
+        return self.length
+
+    def __getitem__(self, ind):
+        if isinstance(ind, slice):
+            return [self[num] for num in range(*ind.indices(self.length))]
+        ind = operator.index(ind)
+        if ind < 0:
+            ind += self.length
+        if not 0 <= ind < self.length:
+            raise IndexError('name index out of range')
+        return '{0} {1}'.format(self.prefix, ind + 1)
+
+    def __iter__(self):
+        for ind in range(self.length):
+            yield self[ind]
+
+    def __repr__(self):
+        return '_DefaultNames({0!r}, {1})'.format(self.prefix, self.length)
+
+
+class _Labels(object):
+    """
+    Read-only sequence of names taken from a pandas Index or Series, a NumPy
+    array or another sequence. The labels are not copied, a name is
+    converted to a string when it is looked up.
+    """
+
+    def __init__(self, values):
+        self.values = values
+        # Series are indexed by position through iloc
+        self._lookup = values.iloc if hasattr(values, 'iloc') else values
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getitem__(self, ind):
+        if isinstance(ind, slice):
+            return [self[num] for num in range(*ind.indices(len(self)))]
+        return str(self._lookup[operator.index(ind)])
+
+    def __iter__(self):
+        for ind in range(len(self)):
+            yield self[ind]
+
+    def __repr__(self):
+        return '_Labels({0!r})'.format(self.values)
+
+
+def _asNames(names):
+    """
+    Returns names given as list, tuple, pandas Index or Series or array as
+    a sequence that can be indexed by position. Lists and tuples are
+    returned as they are, None as an empty list.
+    """
+    if names is None:
+        return []
+    if isinstance(names, (list, tuple, _DefaultNames, _Labels)):
+        return names
+    return _Labels(names)
+
+
+class GridIndex(object):
+    """
+    Uniform grid index over a set of 2-D coordinates. Every point is assigned
+    to one cell of a ``gridSize`` x ``gridSize`` grid spanning the range of
+    the coordinates, which allows neighbourhood look-ups without comparing
+    all pairs of points.
+
+    PARAMETERS
+    ----------
+    coords : array
+        Array of shape (n, 2) holding the x and y coordinates of the points.
+
+    gridSize : int, optional
+        Number of cells along each axis. Defaults to 32.
+    """
+
+    def __init__(self, coords, gridSize=32):
+        coords = np.asarray(coords, dtype=float)
+        self.coords = coords
+        self.gridSize = max(int(gridSize), 1)
+        if len(coords) > 0:
+            self.lower = np.min(coords, axis=0)
+            span = np.max(coords, axis=0) - self.lower
+        else:
+            self.lower = np.zeros(2)
+            span = np.zeros(2)
+        span[span == 0] = 1.0
+        self.cellSize = span / self.gridSize
+
+        cells = self.cellsOf(coords)
+        self.cellIds = cells[:, 0] * self.gridSize + cells[:, 1]
+
+        # Points sorted by cell, so that the members of a cell are a slice
+        self._order = np.argsort(self.cellIds, kind='stable')
+        self._bounds = np.searchsorted(self.cellIds[self._order],
+                                       np.arange(self.gridSize**2 + 1))
+
+    def cellsOf(self, coords):
+        """
+        Returns array of shape (n, 2) holding the (column, row) cell of each
+        coordinate pair. Coordinates outside the grid are clipped to the
+        border cells.
+        """
+        cells = np.floor((np.asarray(coords, dtype=float) - self.lower)
+                         / self.cellSize).astype(int)
+        return np.clip(cells, 0, self.gridSize - 1).reshape(-1, 2)
+
+    def query(self, xMin, xMax, yMin, yMax):
+        """
+        Returns indices of the points inside the rectangle spanned by the
+        given limits.
+        """
+        (c0, r0), (c1, r1) = self.cellsOf([[xMin, yMin], [xMax, yMax]])
+        cellIds = (np.arange(c0, c1 + 1)[:, None] * self.gridSize
+                   + np.arange(r0, r1 + 1)[None, :]).ravel()
+        candidates = np.concatenate(
+            [self._order[self._bounds[cell]:self._bounds[cell + 1]]
+             for cell in cellIds])
+        pts = self.coords[candidates]
+        inside = ((pts[:, 0] >= xMin) & (pts[:, 0] <= xMax) &
+                  (pts[:, 1] >= yMin) & (pts[:, 1] <= yMax))
+        return np.sort(candidates[inside])
+
+
+def selectLabels(coords, maxLabels, labelBy='distance', gridSize=None):
+    """
+    Selects a bounded subset of points to be labelled.
+
+    Points are ranked either by their distance from the origin or by their
+    leverage along the plotted components. Overlapping labels are culled
+    with a grid index: of all points falling in the same grid cell, only the
+    highest ranked one keeps its label.
+
+    PARAMETERS
+    ----------
+    coords : array
+        Array of shape (n, 2) holding the plotted coordinates.
+
+    maxLabels : int
+        Maximum number of labels to return.
+
+    labelBy : str, optional
+        Ranking criterion, either ``'distance'`` (default) or ``'leverage'``.
+
+    gridSize : int, optional
+        Number of cells along each axis of the culling grid. Defaults to a
+        grid with about four cells per requested label.
+
+    RETURNS
+    -------
+    Array with indices of the points to be labelled, highest ranked first.
+    """
+    coords = np.asarray(coords, dtype=float)
+    if maxLabels <= 0 or len(coords) == 0:
+        return np.array([], dtype=int)
+
+    if labelBy == 'distance':
+        rank = np.sqrt(np.sum(coords**2, axis=1))
+    elif labelBy == 'leverage':
+        ss = np.sum(coords**2, axis=0)
+        ss[ss == 0] = 1.0
+        rank = np.sum(coords**2 / ss, axis=1)
+    else:
+        raise ValueError("labelBy must be 'distance' or 'leverage'")
+
+    if gridSize is None:
+        gridSize = int(np.ceil(2 * np.sqrt(maxLabels)))
+    grid = GridIndex(coords, gridSize=gridSize)
+
+    # Keep the highest ranked point of every occupied cell
+    order = np.argsort(-rank, kind='stable')
+    cells, first = np.unique(grid.cellIds[order], return_index=True)
+    winners = order[np.sort(first)]
+
+    return winners[:maxLabels]
+
+
+def drawLabels(ax, x, y, names, maxLabels=None, labelBy='distance',
+               rankCoords=None, xSpace=0, ySpace=0, **kwargs):
+    """
+    Adds names as text labels to the points (x, y) of a scatter plot.
+
+    With ``maxLabels=None`` all points are labelled. Otherwise at most
+    ``maxLabels`` points are labelled, chosen by :func:`selectLabels` from
+    ``rankCoords`` (defaults to the plotted coordinates). Only the names of
+    labelled points are looked up.
+
+    Remaining keyword arguments are passed to ``ax.text``.
+    """
+    if maxLabels is None:
+        indices = range(len(names))
+    else:
+        if rankCoords is None:
+            rankCoords = np.column_stack([x, y])
+        indices = [ind for ind in selectLabels(rankCoords, maxLabels, labelBy)
+                   if ind < len(names)]
+
+    for ind in indices:
+        ax.text(x[ind] + xSpace, y[ind] + ySpace, names[ind], **kwargs)
@@ -0,0 +1,254 @@
+# -*- coding: utf-8 -*-
+"""Linked lasso selection between scores, loadings, biplot and prediction
+plots"""
+
+import numpy as np
+import matplotlib.pyplot as plt
+from matplotlib.path import Path
+from matplotlib.widgets import LassoSelector
+
+from .blitting import _Blitter
+from .labels import GridIndex
+from .main_plot import plot, _pyplotFigures
+from .model_cache import cached
+
+
+def _lassoHits(layer, verts):
+    """
+    Returns indices of the points of a layer inside the lasso polygon
+    ``verts`` (given in data coordinates of the layer). Only points in grid
+    cells overlapping the bounding box of the lasso are tested.
+    """
+    path = Path(verts)
+    xMin, yMin = np.min(verts, axis=0)
+    xMax, yMax = np.max(verts, axis=0)
+    candidates = layer['index'].query(xMin, xMax, yMin, yMax)
+    if len(candidates) == 0:
+        return candidates
+    return candidates[path.contains_points(layer['coords'][candidates])]
+
+
+def _matches(source, target, selected, numMatches):
+    """
+    Returns indices of the ``numMatches`` rows of ``target`` pointing most
+    in the mean direction of the selected rows of ``source``, e.g. the
+    variables whose loadings match a group of selected objects.
+    """
+    if len(selected) == 0 or numMatches == 0:
+        return np.array([], dtype=int)
+    direction = np.mean(source[selected], axis=0)
+    projection = np.dot(target, direction)
+    order = np.argsort(-projection, kind='stable')[:numMatches]
+    return order[projection[order] > 0]
+
+
+class LinkedViews(object):
+    """
+    Scores, loadings, biplot and prediction plots of a model in one figure,
+    linked by lasso selection. Objects selected with the lasso in any plot
+    showing objects are highlighted in all plots showing objects, together
+    with the variables whose loadings point in the direction of the selected
+    objects. Selecting variables in the loadings plot highlights them and
+    the matching objects in the same way.
+
+    The points hit by the lasso are looked up with a grid index over the
+    plotted coordinates, and only the highlight markers are redrawn (blitted
+    where the backend supports it).
+
+    PARAMETERS
+    ----------
+    model : nipalsPCA/nipalsPCR/nipalsPLS1/nipalsPLS2 class object computed
+        in hoggorm.
+
+    comp : list, optional
+        The pair of components displayed. Defaults to [1, 2]. Prediction
+        plots use ``comp[0]`` components.
+
+    plots : list, optional
+        Linked plots, any of 1 (scores), 2 (loadings), 4 (biplot) and
+        7 (predict). Defaults to [1, 2, 4] for PCA and [1, 2, 4, 7]
+        otherwise.
+
+    objNames : list, optional
+        Object names may be provided in this list.
+
+    XvarNames : list, optional
+        Names of X variables may be provided in this list.
+
+    YvarNames : list, optional
+        Names of Y variables may be provided in this list.
+
+    maxLabels : int, optional
+        Maximum number of names drawn per scatter block. Defaults to 20.
+
+    labelBy : str, optional
+        Ranking of points when ``maxLabels`` is set, either ``'distance'``
+        (default) or ``'leverage'``.
+
+    numMatches : int, optional
+        Maximum number of matching variables (or objects) highlighted for
+        a selection of objects (or variables). Defaults to 10.
+
+    onSelect : callable, optional
+        Called as ``onSelect(objects, variables)`` with the index arrays of
+        the highlighted objects and variables after every selection.
+
+    figsize : tuple, optional
+        Sets figure width and height in inches.
+
+    show : boolean, optional
+        When True (default) the figure is registered with pyplot, the lasso
+        selectors are connected and the figure is shown. Otherwise the
+        figure is available as ``views.fig`` and selections are made by
+        calling ``select``.
+
+    EXAMPLES
+    --------
+    >>> import hoggorm as ho
+    >>> import hoggormplot as hopl
+    >>> myModel = ho.nipalsPLS2(arrX=my_X_data, arrY=my_Y_data, numComp=5)
+    >>> views = hopl.LinkedViews(myModel, onSelect=lambda objects, variables:
+    ...                          print(objects, variables))
+
+    >>> views = hopl.LinkedViews(myModel, show=False)
+    >>> views.select(objects=[3, 17, 42])
+    >>> views.fig.savefig('outliers.png')
+    """
+
+    def __init__(self, model, comp=[1, 2], plots=None, objNames=[],
+                 XvarNames=[], YvarNames=[], maxLabels=20,
+                 labelBy='distance', numMatches=10, onSelect=None,
+                 figsize=None, show=True):
+        isPCA = not (hasattr(model, 'arrY_input') or
+                     hasattr(model, 'vecy_input'))
+        if plots is None:
+            plots = [1, 2, 4] if isPCA else [1, 2, 4, 7]
+        for item in plots:
+            if item not in [1, 2, 4, 7] or (item == 7 and isPCA):
+                raise ValueError('LinkedViews supports plots 1, 2, 4 and 7 '
+                                 '(7 not for PCA), got {0}'.format(item))
+
+        self.model = model
+        self.numMatches = numMatches
+        self.onSelect = onSelect
+        with _pyplotFigures(show):
+            self.fig = plot(model, comp=comp, plots=list(plots), which=['X'],
+                            objNames=objNames, XvarNames=XvarNames,
+                            YvarNames=YvarNames, figsize=figsize,
+                            maxLabels=maxLabels, labelBy=labelBy, show=False,
+                            layout='grid')[0]
+
+        cols = [comp[0]-1, comp[1]-1]
+        self.scores = cached(model, 'X_scores')[:, cols]
+        self.loadings = cached(model, 'X_loadings')[:, cols]
+
+        # Walk through the axes in the order plot() created them and find
+        # the layer of objects or variables drawn in each of them
+        self.layers = []
+        axes = iter(self.fig.axes)
+        for item in plots:
+            if item == 1:
+                self._addLayer(next(axes), 'objects')
+            elif item == 2:
+                self._addLayer(next(axes), 'variables')
+            elif item == 4:
+                ax = next(axes)
+                next(axes)  # twin axes holding the loadings ticks
+                ax2 = next(axes)
+                self._addLayer(ax, 'objects', eventAx=ax2)
+                self._addLayer(ax2, 'variables')
+            else:
+                ny = 1 if hasattr(model, 'vecy_input') else \
+                    np.shape(model.arrY_input)[1]
+                for ys in range(ny):
+                    self._addLayer(next(axes), 'objects')
+
+        self.objects = np.array([], dtype=int)
+        self.variables = np.array([], dtype=int)
+        self.selectors = []
+        self._blitter = _Blitter(self.fig, self._overlays)
+
+        if show:
+            plt.figure(self.fig.number)
+            self._connect()
+            plt.show()
+
+    def _addLayer(self, ax, kind, eventAx=None):
+        coords = np.asarray(ax.collections[0].get_offsets(), dtype=float)
+        gridSize = max(int(np.sqrt(len(coords) / 4.0)), 1)
+        overlay = ax.scatter([], [], s=40, facecolors='none',
+                             edgecolors='r', linewidths=1.5, zorder=3)
+        self.layers.append({'ax': ax, 'eventAx': eventAx or ax,
+                            'kind': kind, 'coords': coords,
+                            'index': GridIndex(coords, gridSize),
+                            'overlay': overlay})
+
+    def _overlays(self):
+        return [layer['overlay'] for layer in self.layers]
+
+    def _connect(self):
+        self._blitter.connect()
+        eventAxes = []
+        for layer in self.layers:
+            if layer['eventAx'] not in eventAxes:
+                eventAxes.append(layer['eventAx'])
+        self.selectors = [
+            LassoSelector(ax, lambda verts, ax=ax: self._onLasso(ax, verts))
+            for ax in eventAxes]
+
+    def _onLasso(self, eventAx, verts):
+        # Objects and variables hit in all layers sharing the event axes,
+        # with the lasso converted to the data coordinates of each layer
+        display = eventAx.transData.transform(verts)
+        hits = {'objects': [], 'variables': []}
+        for layer in self.layers:
+            if layer['eventAx'] is not eventAx:
+                continue
+            layerVerts = layer['ax'].transData.inverted().transform(display)
+            hits[layer['kind']].append(_lassoHits(layer, layerVerts))
+        objects = np.unique(np.concatenate(hits['objects'])) \
+            if hits['objects'] else None
+        variables = np.unique(np.concatenate(hits['variables'])) \
+            if hits['variables'] else None
+        if objects is not None and variables is not None:
+            # Biplot, keep the kind that was hit
+            if len(variables) == 0:
+                variables = None
+            elif len(objects) == 0:
+                objects = None
+        self.select(objects, variables)
+
+    def select(self, objects=None, variables=None):
+        """
+        Highlights the given objects and/or variables (lists of indices).
+        If only one of them is given, the other is set to the matching
+        variables or objects.
+
+        RETURNS
+        -------
+        Tuple of the index arrays of highlighted objects and variables.
+        """
+        if objects is not None:
+            objects = np.asarray(objects, dtype=int).ravel()
+        if variables is not None:
+            variables = np.asarray(variables, dtype=int).ravel()
+        if objects is None and variables is None:
+            objects = variables = np.array([], dtype=int)
+        elif variables is None:
+            variables = _matches(self.scores, self.loadings, objects,
+                                 self.numMatches)
+        elif objects is None:
+            objects = _matches(self.loadings, self.scores, variables,
+                               self.numMatches)
+        self.objects = objects
+        self.variables = variables
+
+        for layer in self.layers:
+            indices = objects if layer['kind'] == 'objects' else variables
+            layer['overlay'].set_offsets(
+                layer['coords'][indices].reshape(-1, 2))
+        self._blitter.redraw()
+
+        if self.onSelect is not None:
+            self.onSelect(objects, variables)
+        return objects, variables
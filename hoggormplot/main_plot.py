@@ -3,14 +3,425 @@
 # Import needed packages
 import numpy as np
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
+from matplotlib.colors import LogNorm
+from matplotlib.lines import Line2D
+from matplotlib.figure import Figure
+import contextlib
 import itertools as it
+import threading
+import weakref
 import hoggorm
+from .labels import drawLabels, _asNames, _DefaultNames
+from .model_cache import cached, derived
+from .monitoring import (controlLimits, controlStatistics,
+                         influenceStatistics)
+from .profiling import _Timer
+
+
+# Nesting depth of _pyplotFigures blocks per thread
+_pyplot = threading.local()
+
+
+@contextlib.contextmanager
+def _pyplotFigures(active=True):
+    """
+    Figures created inside the block (by the current thread) are created
+    through pyplot also when they are not shown by ``plot``. Used by the
+    interactive classes, which show the figure themselves after setting it
+    up.
+    """
+    depth = getattr(_pyplot, 'depth', 0)
+    _pyplot.depth = depth + int(active)
+    try:
+        yield
+    finally:
+        _pyplot.depth = depth
+
+
+def _newFigure(figsize=None, show=True):
+    """
+    Returns a new figure. Figures that are shown are created through pyplot.
+    Otherwise the figure is not registered with pyplot, so it is released as
+    soon as the caller drops the reference and never has to be closed.
+    """
+    if show or getattr(_pyplot, 'depth', 0) > 0:
+        return plt.figure(figsize=figsize)
+    return Figure(figsize=figsize)
+
+
+def _asData(data):
+    """
+    Returns data given as array, list or pandas DataFrame as array, together
+    with the row and column labels of a DataFrame (None otherwise). The
+    values of a DataFrame held in a single block of one numeric type (e.g.
+    created from one array) are passed on as a view without copying.
+    """
+    if not hasattr(data, 'iloc'):
+        return np.asarray(data), None, None
+    return np.asarray(data), data.index, getattr(data, 'columns', None)
+
+
+class _Figures(object):
+    """
+    Creates the figures of one plot call and keeps track of them. With a
+    grid layout all axes are subplots of one figure holding ``numPanels``
+    panels, otherwise every axes gets its own figure. Time spent in layout
+    and ``plt.show()`` is booked on ``timer``.
+    """
+
+    def __init__(self, figsize=None, show=True, layout=None, numPanels=1,
+                 timer=None):
+        self.figsize = figsize
+        self.show = show
+        self.timer = timer if timer is not None else _Timer(None, None)
+        self.figs = []
+        self.grid = None
+        self.panel = 0
+
+        if layout is None:
+            return
+        if layout == 'grid':
+            ncols = int(np.ceil(np.sqrt(numPanels)))
+            nrows = int(np.ceil(numPanels / float(ncols)))
+        else:
+            nrows, ncols = layout
+            if nrows * ncols < numPanels:
+                raise ValueError('layout {0} has too few panels, {1} are '
+                                 'needed'.format(layout, numPanels))
+        self.grid = (nrows, ncols)
+        if figsize is None:
+            width, height = plt.rcParams['figure.figsize']
+            self.figsize = (width * ncols, height * nrows)
+        self.figs.append(_newFigure(self.figsize, self.show))
+
+    def newAxes(self):
+        """
+        Returns the axes of a new figure, or the next panel of the grid.
+        """
+        if self.grid is None:
+            fig = _newFigure(self.figsize, self.show)
+            self.figs.append(fig)
+            return fig.add_subplot(111)
+
+        self.panel += 1
+        return self.figs[0].add_subplot(self.grid[0], self.grid[1],
+                                        self.panel)
+
+    def finish(self):
+        """
+        Called when the current figure is complete.
+        """
+        if self.show and self.grid is None:
+            self.timer.lap('artists')
+            plt.show()
+            self.timer.lap('show')
+
+    def finishAll(self):
+        """
+        Called when all plots are drawn. Completes and shows the grid figure.
+        """
+        if self.grid is None:
+            return
+        fig = self.figs[0]
+        fig.tight_layout()
+        self.timer.lap('layout')
+        if self.show:
+            plt.show()
+            self.timer.lap('show')
+
+
+# Static geometry shared by all figures. Artists can not be shared between
+# figures, so the vertices and styles are built once and every axes gets a
+# single collection drawn from them. Line widths of None follow the current
+# rc settings and are looked up whenever a template is drawn.
+_templates = {}
+
+
+def _template(name):
+    """
+    Returns the cached segments and styles of a static template.
+    """
+    if name not in _templates:
+        if name == 'correlationLoadings':
+            # Dashed axes, and the circles of 50% and 100% explained
+            # variance as given by corrLoadingsEllipses of hoggorm models
+            t = np.arange(0.0, 2*np.pi, 0.01)
+            circle = np.column_stack([np.cos(t), np.sin(t)])
+            _templates[name] = {
+                'segments': [np.array([[0, 1.2], [0, -1.2]]),
+                             np.array([[-1.2, 0], [1.2, 0]]),
+                             0.707 * circle, circle],
+                'colors': ['0.4', '0.4', 'k', 'k'],
+                'linestyles': ['dashed', 'dashed', 'solid', 'solid'],
+                'linewidths': [1, 1, None, None]}
+        else:
+            raise KeyError(name)
+    return _templates[name]
+
+
+def _drawTemplate(ax, name):
+    """
+    Adds a static template to the axes as one line collection.
+    """
+    template = _template(name)
+    linewidths = [plt.rcParams['lines.linewidth'] if width is None else width
+                  for width in template['linewidths']]
+    return ax.add_collection(LineCollection(
+        template['segments'], colors=template['colors'],
+        linestyles=template['linestyles'], linewidths=linewidths),
+        autolim=False)
+
+
+def _drawAxisLines(ax, xLims, yLims):
+    """
+    Draws dashed lines through the origin, spanning ``xLims`` and
+    ``yLims``, as one line collection.
+    """
+    return ax.add_collection(LineCollection(
+        [[[0, yLims[0]], [0, yLims[1]]], [[xLims[0], 0], [xLims[1], 0]]],
+        colors='0.4', linestyles='dashed', linewidths=1), autolim=False)
+
+
+def _drawDensity(ax, x, y, bins=200, outliers=0):
+    """
+    Draws the points (x, y) as one image of a 2-D histogram with logarithmic
+    colour scale. Points in bins holding at most ``outliers`` points are
+    additionally drawn as individual markers.
+    """
+    counts, xEdges, yEdges = np.histogram2d(x, y, bins=bins)
+    ax.imshow(np.ma.masked_equal(counts.T, 0), origin='lower', aspect='auto',
+              interpolation='nearest', cmap='viridis', norm=LogNorm(),
+              extent=[xEdges[0], xEdges[-1], yEdges[0], yEdges[-1]])
+
+    if outliers > 0:
+        numX, numY = np.shape(counts)
+        xBin = np.clip(np.searchsorted(xEdges, x, side='right') - 1, 0, numX - 1)
+        yBin = np.clip(np.searchsorted(yEdges, y, side='right') - 1, 0, numY - 1)
+        sparse = counts[xBin, yBin] <= outliers
+        ax.scatter(x[sparse], y[sparse], s=10, c='w', marker='o',
+                   edgecolor='grey')
+
+
+def _drawObjects(ax, x, y, names, density=False, densityOutliers=0,
+                 maxLabels=None, labelBy='distance', rankCoords=None):
+    """
+    Draws objects of scores, biplot and prediction plots, either as one
+    scatter collection or as a density image, and adds their names. In
+    density mode names are only added when ``maxLabels`` is set.
+    """
+    if density is False:
+        ax.scatter(x, y, s=10, c='w', marker='o', edgecolor='grey')
+    else:
+        bins = 200 if density is True else density
+        _drawDensity(ax, x, y, bins, densityOutliers)
+        if maxLabels is None:
+            return
+    drawLabels(ax, x, y, names, maxLabels=maxLabels, labelBy=labelBy,
+               rankCoords=rankCoords, fontsize=10)
+
+
+def _maxPoints(ax, maxPoints):
+    """
+    Returns the number of points kept per line drawn into ``ax``: None, an
+    integer, or for ``'auto'`` two points per pixel of the axes width.
+    """
+    if maxPoints is None:
+        return None
+    if maxPoints == 'auto':
+        return max(int(2 * ax.bbox.width), 2)
+    if isinstance(maxPoints, str):
+        raise ValueError("maxPoints must be an integer, 'auto' or None, "
+                         "got {0!r}".format(maxPoints))
+    return int(maxPoints)
+
+
+def _decimate(values, maxPoints):
+    """
+    Min/max decimation of the columns of ``values`` (n x m) for line plots.
+    The rows are split into ``maxPoints // 2`` buckets and the minimum and
+    maximum of every bucket are kept in their original order, so peaks
+    survive. Returns arrays of row positions and values, each of shape
+    (about maxPoints) x m.
+    """
+    values = np.asarray(values, dtype=float)
+    numRows, numCols = np.shape(values)
+    if maxPoints is None or numRows <= maxPoints:
+        return np.tile(np.arange(numRows)[:, np.newaxis], (1, numCols)), values
+
+    numBuckets = max(maxPoints // 2, 1)
+    size = int(np.ceil(numRows / float(numBuckets)))
+    padded = np.pad(values, ((0, numBuckets * size - numRows), (0, 0)),
+                    mode='edge').reshape(numBuckets, size, numCols)
+    start = np.arange(numBuckets)[:, np.newaxis] * size
+    lower = start + np.argmin(padded, axis=1)
+    upper = start + np.argmax(padded, axis=1)
+    pos = np.sort(np.stack([lower, upper], axis=1), axis=1)
+    pos = np.minimum(pos.reshape(2 * numBuckets, numCols), numRows - 1)
+    return pos, values[pos, np.arange(numCols)]
+
+
+class _DecimatedLine(object):
+    """
+    Line through one column of a long model result (e.g. a loading vector
+    of a spectrum) drawn with min/max decimation. Only the visible range is
+    decimated, and it is decimated again whenever the x limits of the axes
+    change, so zooming in reveals the full resolution. The decimated full
+    range is cached per model, result and column. With ``maxPoints='auto'``
+    two points are kept per pixel of the axes width.
+    """
+
+    def __init__(self, ax, model, accessor, column, maxPoints, **kwargs):
+        self.ax = ax
+        self.model = weakref.ref(model)
+        self.key = ('decimated', accessor, column)
+        self.values = cached(model, accessor)[:, column]
+        self.maxPoints = maxPoints
+        self.last = None
+        pos, values = self._range(0, len(self.values))
+        self.line, = ax.plot(pos, values, **kwargs)
+        # Bound methods are only weakly referenced by the callback registry
+        ax.callbacks.connect('xlim_changed', lambda ax: self.update())
+
+    def _decimated(self, start, stop, maxPoints):
+        pos, values = _decimate(self.values[start:stop, np.newaxis], maxPoints)
+        return pos[:, 0] + start, values[:, 0]
+
+    def _range(self, start, stop):
+        """
+        Returns positions and values of the decimated rows start:stop.
+        """
+        maxPoints = _maxPoints(self.ax, self.maxPoints)
+        settings = (start, stop, maxPoints)
+        if self.last is not None and self.last[0] == settings:
+            return self.last[1]
+
+        model = self.model()
+        if model is not None and (start, stop) == (0, len(self.values)):
+            result = derived(model, self.key + (maxPoints,),
+                             lambda: self._decimated(start, stop, maxPoints))
+        else:
+            result = self._decimated(start, stop, maxPoints)
+        self.last = (settings, result)
+        return result
+
+    def update(self):
+        """
+        Decimates the rows in the current x limits of the axes.
+        """
+        numRows = len(self.values)
+        xMin, xMax = sorted(self.ax.get_xlim())
+        # One point beyond each limit, so the line runs to the axes edges
+        start = int(np.clip(np.floor(xMin), 0, numRows - 1))
+        stop = int(np.clip(np.ceil(xMax) + 1, start + 1, numRows))
+        self.line.set_data(*self._range(start, stop))
+
+
+def _smallMultiples(figures, numPanels, figsize=None, show=True,
+                    timer=None):
+    """
+    Returns a grid of ``numPanels`` small panels in a new figure, or
+    ``figures`` itself if it already draws into a grid layout.
+    """
+    if figures.grid is not None:
+        return figures
+    ncols = int(np.ceil(np.sqrt(numPanels)))
+    nrows = int(np.ceil(numPanels / float(ncols)))
+    if figsize is None:
+        figsize = (3 * ncols, 3 * nrows)
+    return _Figures(figsize, show, (nrows, ncols), numPanels, timer=timer)
+
+
+def _orderVariables(explVar, varOrder=None):
+    """
+    Returns the order of the variables (columns of the cumulative explained
+    variances ``explVar``) in an explained variance heatmap. ``'sort'`` orders by
+    the total explained variance, ``'cluster'`` by the first principal
+    component of the explained variance profiles, so variables explained
+    by the same components end up next to each other.
+    """
+    numVars = np.shape(explVar)[1]
+    if varOrder is None:
+        return np.arange(numVars)
+    if varOrder == 'sort':
+        return np.argsort(-explVar[-1], kind='stable')
+    if varOrder == 'cluster':
+        # Per component increments, centred over the variables
+        profiles = np.diff(explVar, axis=0)
+        profiles = profiles - np.mean(profiles, axis=1, keepdims=True)
+        u, s, vt = np.linalg.svd(profiles, full_matrices=False)
+        position = vt[0] if np.sum(u[:, 0]) >= 0 else -vt[0]
+        return np.argsort(position, kind='stable')
+    raise ValueError("varOrder must be None, 'sort' or 'cluster', "
+                     "got {0!r}".format(varOrder))
+
+
+def _drawExplVarHeatmap(ax, cumExplVar, varNames, order, cumulative=True):
+    """
+    Draws explained variances of individual variables as one image with a
+    row per number of components (or per component, when ``cumulative`` is
+    False) and a column per variable, in the given order. ``cumExplVar``
+    holds the cumulative explained variances starting with 0 components.
+    Variable names are used as tick labels for up to 30 variables.
+    """
+    if cumulative:
+        explVar = cumExplVar
+        first = 0
+    else:
+        explVar = np.diff(cumExplVar, axis=0)
+        first = 1
+    numRows, numVars = np.shape(explVar)
+    vmax = 100 if cumulative else max(np.max(explVar), 1e-12)
+    image = ax.imshow(explVar[:, order], aspect='auto', origin='lower',
+                      interpolation='nearest', cmap='viridis', vmin=0,
+                      vmax=vmax, extent=[-0.5, numVars - 0.5,
+                                         first - 0.5, first + numRows - 0.5])
+    colorbar = ax.figure.colorbar(image, ax=ax)
+    colorbar.set_label('Explained variance [%]')
+
+    ax.set_ylabel('Number of components' if cumulative else 'Component')
+    if numRows <= 20:
+        ax.set_yticks(range(first, first + numRows))
+    if numVars <= 30:
+        ax.set_xticks(range(numVars))
+        ax.set_xticklabels([varNames[ind] for ind in order], rotation=90,
+                           fontsize=8)
+    else:
+        ax.set_xlabel('Variables')
+
+
+def _numPanels(model, plots, which, modeltype, newData, comp,
+               overlay=False):
+    """
+    Returns the number of axes drawn by plot() for the given plot types.
+    Twin axes of the biplot are not counted.
+    """
+    numPanels = 0
+    for plotInd, item in enumerate(plots):
+        if item == 1 and newData:
+            numPanels += 1
+        elif item in [1, 2] and which[plotInd] not in ['X', 'Y']:
+            numPanels += 2
+        elif item == 5 and overlay:
+            numPanels += 1
+        elif item == 5:
+            numPanels += np.shape(cached(model, 'regressionCoefficients', comp[0]))[1]
+        elif item == 7 and modeltype != 'PLS1':
+            numPanels += np.shape(model.arrY_input)[1]
+        elif item == 8:
+            numPanels += 2
+        else:
+            numPanels += 1
+    return numPanels
 
 
 def plot(model, comp=[1, 2], plots=[1, 2, 3, 4], which=[], line=False,
          weights=False, cumulative=True, individual=False, validated=[],
          objNames=[], XvarNames=[], YvarNames=[], newX=[], newY=[],
-         newObjNames=[], figsize=None):
+         newObjNames=[], figsize=None, maxLabels=None, labelBy='distance',
+         show=True, layout=None, density=False, densityOutliers=0,
+         profile=None, smallMultiples=False, overlay=False, maxPoints=None,
+         heatmap=False, varOrder=None, limitLevels=[95, 99]):
     """
     This is the main plot function that generates plots that visualise results 
     from PCA, PCR, PLSR and PLSR2 models computed with the Hoggorm package.
@@ -19,6 +430,8 @@ def plot(model, comp=[1, 2], plots=[1, 2, 3, 4], which=[], line=False,
     ----------
     model : nipalsPCR/nipalsPLSR1/nipalsPLSR2 class object computed in Hoggorm 
         The statistical results of the submitted model will be visualized.
+        A PlotSnapshot opened with ``loadSnapshot`` may be given instead
+        for plot types 1 to 6 without new data.
 
     comp : list, optional
         The list contains components to be displayed. Defaults to [1,2].
@@ -34,6 +447,8 @@ def plot(model, comp=[1, 2], plots=[1, 2, 3, 4], which=[], line=False,
             - 5 : Regression coefficients
             - 6 : Explained variance (default: Y)
             - 7 : Prediction
+            - 8 : Control chart (Hotelling T2 and Q residuals)
+            - 9 : Influence (leverage vs. residual variance)
 
         Instead of integers, string arguments may be useds. The following 
         options are available:
@@ -44,6 +459,8 @@ def plot(model, comp=[1, 2], plots=[1, 2, 3, 4], which=[], line=False,
             - ``'coeffs'``
             - ``'explainedVariance'``
             - ``'predict'``
+            - ``'controlChart'``
+            - ``'influence'``
 
     which : list, optional
         This list may contain one string argument. The following options are 
@@ -72,22 +489,119 @@ def plot(model, comp=[1, 2], plots=[1, 2, 3, 4], which=[], line=False,
        When set to ``'validated=[TRUE]'`` validated values are plotted if 
        applicable (scores => False, explainedVariance => True).
 
-    objNames : list, optional
+    objNames : list or pandas Index, optional
         Object names may be provided in this list.
 
-    XvarNames : list, optional
+    XvarNames : list or pandas Index, optional
         Names of variables in array X may be provided in this list.
 
-    YvarNames : list, optional
+    YvarNames : list or pandas Index, optional
         Names of variables in Y may be provided in this list.
 
+    newX : array or pandas DataFrame, optional
+        New measurement data X, projected onto the model in scores, control
+        chart and prediction plots. The index and columns of a DataFrame
+        are used as default object and variable names. Its values are
+        passed on without copying when the DataFrame holds one block of a
+        single numeric type.
+
+    newY : array or pandas DataFrame, optional
+        New measurements of Y for prediction plots. The columns of a
+        DataFrame are used as default names of the Y variables.
+
+    newObjNames : list or pandas Index, optional
+        Names of the objects in newX may be provided in this list.
+
     figsize : tuple, optional 
         Sets figure width and height in inches
 
+    maxLabels : int, optional
+        Maximum number of object or variable names drawn per scatter block.
+        Defaults to None, i.e. all points are labelled. When set, only the
+        highest ranked points are labelled and labels that would overlap on
+        a coarse grid are dropped. Use ``maxLabels=0`` to omit all labels.
+
+    labelBy : str, optional
+        Ranking used together with ``maxLabels``. The following options are
+        available:
+            - ``'distance'`` : distance from the origin (default)
+            - ``'leverage'`` : leverage along the plotted components
+
+        In prediction plots points are ranked by their prediction residual.
+
+    show : boolean, optional
+        When set to ``'show=True'`` (default) every figure is displayed with
+        ``plt.show()``. When set to ``'show=False'`` nothing is displayed and
+        the figures are returned instead. These figures are not registered
+        with pyplot, so they need not be closed and are freed as soon as they
+        are no longer referenced.
+
+    layout : str or tuple, optional
+        Defaults to None, i.e. every plot is drawn in a figure of its own.
+        When set to ``'grid'`` all plots, including X and Y variants, are
+        drawn as panels of a single figure arranged in a near-square grid.
+        A tuple ``(rows, columns)`` sets the grid explicitly. ``figsize`` then
+        refers to the whole figure.
+
+    density : boolean or int, optional
+        When set to ``'density=True'`` the objects in scores, biplot and
+        prediction plots are drawn as a single density image (2-D histogram
+        with 200 x 200 bins) instead of as individual points. An integer sets
+        the number of bins per axis. Object names are then only drawn when
+        ``maxLabels`` is given.
+
+    densityOutliers : int, optional
+        In density mode, objects in bins holding at most this many objects
+        are also drawn as individual points. Defaults to 0.
+
+    profile : callable, optional
+        Opt-in profiling. A ``hoggormplot.PlotProfile`` object or any
+        callable is passed one record per plot item with the time spent in
+        model accessors, name generation, artist creation, layout and
+        ``plt.show()``, and the number of artists drawn. Defaults to None.
+
+    smallMultiples : boolean, optional
+        When set to ``'smallMultiples=True'`` the prediction and regression
+        coefficient plots of all responses are drawn as small panels of one
+        figure instead of one figure per response. Ignored when ``layout``
+        is given.
+
+    overlay : boolean, optional
+        When set to ``'overlay=True'`` the regression coefficients of all
+        responses are drawn into one axes as a single line collection.
+
+    maxPoints : int or str, optional
+        Maximum number of points per regression coefficient line and per
+        line of line-mode loadings. Longer lines (e.g. spectra) are reduced
+        by keeping the minimum and maximum of equally sized segments.
+        Defaults to None, i.e. all points. With ``'auto'`` two points are
+        kept per pixel of the axes width. Loadings lines are reduced again
+        for the visible range when zooming.
+
+    heatmap : boolean, optional
+        When set to ``'heatmap=True'`` explained variances of individual
+        variables are drawn as one image with a row per component and a
+        column per variable, instead of one line per variable. Suited for
+        many variables.
+
+    varOrder : str, optional
+        Order of the variables in the explained variance heatmap. The
+        following options are available:
+            - None : order of the data (default)
+            - ``'sort'`` : by total explained variance, highest first
+            - ``'cluster'`` : variables with similar explained variance
+              profiles next to each other
+
+    limitLevels : list, optional
+        Confidence levels in percent of the control limits in control
+        charts and influence plots, estimated as percentiles of the
+        calibration objects. Defaults to [95, 99].
 
     RETURNS
     -------
-    Multiple plots. 
+    Multiple plots. With ``'show=False'`` a list holding the matplotlib
+    figures is returned, the axes of each figure are available through
+    ``fig.axes``.
 
     EXAMPLES
     --------
@@ -97,6 +611,12 @@ def plot(model, comp=[1, 2], plots=[1, 2, 3, 4], which=[], line=False,
     >>> hopl.plot(myModel, plots=[1, 2, 3, 6], cumulative=True, line=True)
     >>> hopl.plot(myModel)
     >>> hopl.plot(myModel, plots=['scores', 'loadings', 'explainedVariance'], cumulative=True)
+    >>> figs = hopl.plot(myModel, plots=[1, 2], show=False)
+    >>> figs[0].savefig('scores.png')
+    >>> hopl.plot(myModel, plots=[1, 2, 3, 6], layout='grid')
+    >>> profile = hopl.PlotProfile()
+    >>> hopl.plot(myModel, plots=[1, 2], profile=profile)
+    >>> print(profile)
 
     """
 
@@ -104,17 +624,24 @@ def plot(model, comp=[1, 2], plots=[1, 2, 3, 4], which=[], line=False,
     # Initialization and checks #
     #############################
 
-    # Create local copies of mutable input objects
-    comp = comp.copy()
-    plots = plots.copy()
-    which = which.copy()
-    newX = newX.copy()
-    newY = newY.copy()
-    objNames = objNames.copy()
-    XvarNames = XvarNames.copy()
-    YvarNames = YvarNames.copy()
-    newObjNames = newObjNames.copy()
-    validated = validated.copy()
+    timer = _Timer(profile, 'plot')
+    timer.begin('setup')
+
+    # Create local copies of mutable input objects that are changed below
+    comp = [comp] if isinstance(comp, int) else list(comp)
+    plots = [plots] if isinstance(plots, (int, str)) else list(plots)
+    which = list(which)
+    if not isinstance(validated, bool):
+        validated = list(validated)
+
+    # Data and names are only read. Data frames are passed on as array
+    # views, their index and columns serve as default names.
+    newX, newXrows, newXcolumns = _asData(newX)
+    newY, _, newYcolumns = _asData(newY)
+    objNames = _asNames(objNames)
+    XvarNames = _asNames(XvarNames)
+    YvarNames = _asNames(YvarNames)
+    newObjNames = _asNames(newObjNames)
 
     # Check input class
     if isinstance(model, hoggorm.pca.nipalsPCA):
@@ -125,16 +652,13 @@ def plot(model, comp=[1, 2], plots=[1, 2, 3, 4], which=[], line=False,
         modeltype = 'PLS1'
     elif isinstance(model, hoggorm.plsr2.nipalsPLS2):
         modeltype = 'PLS2'
-
-    if isinstance(plots, int):
-        plots = [plots]
-    if isinstance(comp, int):
-        comp = [comp]
-    if isinstance(plots, str):
-        plots = [plots]
+    else:
+        # Results read from a snapshot (see saveSnapshot)
+        modeltype = model.modeltype
 
     # Convert string type plots to integers
-    plotTypes = ['scores', 'loadings', 'correlationLoadings', 'biplot', 'coeffs', 'explainedVariance', 'predict']
+    plotTypes = ['scores', 'loadings', 'correlationLoadings', 'biplot', 'coeffs', 'explainedVariance', 'predict',
+                 'controlChart', 'influence']
     for i in range(len(plots)):
         if isinstance(plots[i], type('')):
             plots[i] = plotTypes.index(plots[i]) + 1
@@ -173,54 +697,66 @@ def plot(model, comp=[1, 2], plots=[1, 2, 3, 4], which=[], line=False,
     else:
         newData = False
 
-    # Generate names/numbers for objects if no objects are given
-    if (bool(objNames) == False) | (len(objNames) == 0):
-        numObj, numVar = np.shape(model.modelSettings()['arrX'])
-
-        for num in range(1, numObj+1):
-            label = 'Obj {0}'.format(num)
-            objNames.append(label)
-
-    # Generate names/numbers for new objects if no objects are given
-    if (bool(newObjNames) == False) & (len(newX) > 0):
-        numNewObj, numVar = np.shape(newX)
-
-        for num in range(1, numNewObj+1):
-            label = 'Obj {0}'.format(num)
-            newObjNames.append(label)
-
-    # Generate names/numbers for variables if no objects are given
-    if bool(XvarNames) == False:
-        numObj, numVar = np.shape(model.modelSettings()['arrX'])
-
-        for num in range(1, numVar+1):
-            label = 'Var {0}'.format(num)
-            XvarNames.append(label)
-
-    # Generate names/numbers for variables if no objects are given
-    if (bool(YvarNames) == False) & (modeltype != 'PCA'):
-        numObj, numVar = np.shape(model.modelSettings()['arrY'])
-
-        for num in range(1, numVar+1):
-            label = 'Var {0}'.format(num)
-            YvarNames.append(label)
+    timer.lap('inputs')
+
+    # Default names/numbers for objects and variables if none are given. The
+    # names are only formatted when they are drawn.
+    if len(objNames) == 0:
+        objNames = _DefaultNames('Obj',
+                                  np.shape(timer.fetch(model, 'X_scores'))[0])
+
+    if (len(newObjNames) == 0) & (len(newX) > 0):
+        if newXrows is not None:
+            newObjNames = _asNames(newXrows)
+        else:
+            newObjNames = _DefaultNames('Obj', np.shape(newX)[0])
+
+    if (len(XvarNames) == 0) & (newXcolumns is not None):
+        XvarNames = _asNames(newXcolumns)
+    if len(XvarNames) == 0:
+        XvarNames = _DefaultNames('Var',
+                                   np.shape(timer.fetch(model, 'X_loadings'))[0])
+
+    if (len(YvarNames) == 0) & (newYcolumns is not None):
+        YvarNames = _asNames(newYcolumns)
+    if (len(YvarNames) == 0) & (modeltype != 'PCA'):
+        if modeltype == 'PLS1':
+            YvarNames = _DefaultNames('Var', 1)
+        else:
+            YvarNames = _DefaultNames(
+                'Var', np.shape(timer.fetch(model, 'Y_loadings'))[0])
+
+    timer.lap('names')
+
+    # Keep track of the created figures
+    if layout is None:
+        figures = _Figures(figsize, show, timer=timer)
+    else:
+        figures = _Figures(figsize, show, layout,
+                           _numPanels(model, plots, which, modeltype, newData, comp,
+                                      overlay),
+                           timer=timer)
+    timer.lap('figures')
 
     # Generate a list with names of PC's used for PCR/PLSR
-    obj, numPC = np.shape(model.X_scores())
+    obj, numPC = np.shape(timer.fetch(model, 'X_scores'))
     pcNames = []
 
     for num in range(numPC+1):
         label = 'comp {0}'.format(num)
         pcNames.append(label)
+    timer.end('names')
 
     ########################
     # Plotting starts here #
     ########################
 
     # 1 : scores, 2 : loadings, 3 : correlationLoadings, 4 : biplot,
-    # 5 : coeffs, 6 : explainedVariance,  7 : predict
+    # 5 : coeffs, 6 : explainedVariance,  7 : predict, 8 : controlChart,
+    # 9 : influence
 
     for plotInd, item in enumerate(plots):
+        timer.begin(item, plotInd, figures.figs)
 
         # Scores
         if item == 1:
@@ -228,45 +764,41 @@ def plot(model, comp=[1, 2], plots=[1, 2, 3, 4], which=[], line=False,
             if newData == False:
                 # Ordinary scores
                 theObjNames = objNames
-                XexplVar = model.X_calExplVar()
+                XexplVar = timer.fetch(model, 'X_calExplVar')
                 if modeltype != 'PCA':
-                    YexplVar = model.Y_calExplVar()
+                    YexplVar = timer.fetch(model, 'Y_calExplVar')
                 if which[plotInd] == 'X':
                     XorY = 'X'
-                    Score = [model.X_scores()[:, [comp[0]-1, comp[1]-1]]]
+                    Score = [timer.fetch(model, 'X_scores')[:, [comp[0]-1, comp[1]-1]]]
                 elif which[plotInd] == 'Y':
                     XorY = 'Y'
-                    Score = [model.Y_scores()[:, [comp[0]-1, comp[1]-1]]]
+                    Score = [timer.fetch(model, 'Y_scores')[:, [comp[0]-1, comp[1]-1]]]
                 else:
                     XorY = ['X', 'Y']
-                    Score = [model.X_scores()[:, comp], model.Y_scores()[:, [comp[0]-1, comp[1]-1]]]
+                    Score = [timer.fetch(model, 'X_scores')[:, comp], timer.fetch(model, 'Y_scores')[:, [comp[0]-1, comp[1]-1]]]
             else:
                 # New scores
                 theObjNames = newObjNames
-                XexplVar = model.X_calExplVar()
+                XexplVar = timer.fetch(model, 'X_calExplVar')
                 if modeltype != 'PCA':
-                    YexplVar = model.Y_calExplVar()
+                    YexplVar = timer.fetch(model, 'Y_calExplVar')
                 XorY = 'X'
-                Score = [model.X_scores_predict(newX)]
+                Score = [timer.call(model.X_scores_predict, newX)]
 
             for xy in range(len(XorY)):
                 Scores = Score[xy]
-                fig = plt.figure(figsize=figsize)
-                ax = fig.add_subplot(111)
-
-                # Loop through all coordinates (PC1,PC2) and names to plot scores.
-                for ind, objName in enumerate(theObjNames):
+                ax = figures.newAxes()
 
-                    ax.scatter(Scores[ind, 0], Scores[ind, 1], s=10, c='w',
-                               marker='o', edgecolor='grey')
-                    ax.text(Scores[ind, 0], Scores[ind, 1], objName, fontsize=10)
+                # Plot all scores at once, then add the object names.
+                _drawObjects(ax, Scores[:, 0], Scores[:, 1], theObjNames,
+                             density, densityOutliers, maxLabels, labelBy)
 
                 # Find maximum and minimum scores along PC1 and PC2
-                xMax = max(Scores[:, 0])
-                xMin = min(Scores[:, 0])
+                xMax = np.max(Scores[:, 0])
+                xMin = np.min(Scores[:, 0])
 
-                yMax = max(Scores[:, 1])
-                yMin = min(Scores[:, 1])
+                yMax = np.max(Scores[:, 1])
+                yMin = np.min(Scores[:, 1])
 
                 # Set limits for lines representing the axes.
                 # x-axis
@@ -293,10 +825,7 @@ def plot(model, comp=[1, 2], plots=[1, 2, 3, 4], which=[], line=False,
                 yMaxLine = yMax + extraY
                 yMinLine = yMin - extraY
 
-                ax.plot([0, 0], [yMaxLine, yMinLine], color='0.4', linestyle='dashed',
-                        linewidth=1)
-                ax.plot([xMinLine, xMaxLine], [0, 0], color='0.4', linestyle='dashed',
-                        linewidth=1)
+                _drawAxisLines(ax, [xMinLine, xMaxLine], [yMaxLine, yMinLine])
 
                 # Set limits for plot regions.
                 xMaxLim = xMax + limX
@@ -323,38 +852,67 @@ def plot(model, comp=[1, 2], plots=[1, 2, 3, 4], which=[], line=False,
                 else:
                     ax.set_title('Y scores plot')
 
-                plt.show()
+                figures.finish()
+
+        # 9. Influence, leverage vs. residual variance of the calibration
+        #    objects
+        if item == 9:
+            leverage, residualVar = timer.call(influenceStatistics, model,
+                                               comp[0])
+            T2lim, Qlim = timer.call(controlLimits, model, comp[0], limitLevels)
+            numObj = len(leverage)
+            ax = figures.newAxes()
+
+            _drawObjects(ax, leverage, residualVar, objNames, density,
+                         densityOutliers, maxLabels, labelBy,
+                         rankCoords=np.column_stack([
+                             leverage / np.max(leverage),
+                             residualVar / max(np.max(residualVar), 1e-300)]))
+
+            # Control limits converted to leverage and residual variance
+            for limit in T2lim / (numObj - 1) + 1.0 / numObj:
+                ax.axvline(limit, color='0.4', linestyle='dashed', linewidth=1)
+            for limit in Qlim / np.shape(timer.fetch(model, 'X_loadings'))[0]:
+                ax.axhline(limit, color='0.4', linestyle='dashed', linewidth=1)
+
+            ax.set_xlim(0, np.max(leverage) * 1.1)
+            ax.set_ylim(0, np.max(residualVar) * 1.1)
+            ax.set_xlabel('Leverage')
+            ax.set_ylabel('Residual variance')
+            ax.set_title('Influence plot ({0} comp.)'.format(comp[0]))
+            figures.finish()
 
         # Loadings (and loading weights)
         if item == 2:
 
             # Access loadings and explained variances from model
-            XexplVar = model.X_calExplVar()
+            XexplVar = timer.fetch(model, 'X_calExplVar')
             if which[plotInd] == 'X':
                 XorY = 'X'
                 if weights == False:
-                    Loading = [model.X_loadings()]
+                    LoadingAccessor = ['X_loadings']
                 else:
-                    Loading = [model.X_loadingWeights()]
+                    LoadingAccessor = ['X_loadingWeights']
                 varName = [XvarNames]
             elif which[plotInd] == 'Y':
                 XorY = 'Y'
-                Loading = [model.Y_loadings()]
+                LoadingAccessor = ['Y_loadings']
                 varName = [YvarNames]
             else:
                 XorY = ['X', 'Y']
                 if weights == False:
-                    Loading = [model.X_loadings(), model.Y_loadings()]
+                    LoadingAccessor = ['X_loadings', 'Y_loadings']
                 else:
-                    Loading = [model.X_loadingWeights(), model.Y_loadings()]
+                    LoadingAccessor = ['X_loadingWeights', 'Y_loadings']
                 varName = [XvarNames, YvarNames]
+            Loading = [timer.fetch(model, accessor)
+                       for accessor in LoadingAccessor]
 
             # Initiate plot
             for xy in range(len(XorY)):
                 varNames = varName[xy]
                 Loadings = Loading[xy]
-                fig = plt.figure(figsize=figsize)
-                ax = fig.add_subplot(111)
+                ax = figures.newAxes()
 
                 if line == False:
                     # Find maximum and minimum scores along along PC's selected
@@ -388,13 +946,12 @@ def plot(model, comp=[1, 2], plots=[1, 2, 3, 4], which=[], line=False,
                         extraY = abs(yMin) * .4
                         limY = abs(yMin) * .3
 
-                    # Loop through all coordinates (PC1,PC2) and names to plot scores.
-                    for ind, name in enumerate(varNames):
-
-                        ax.scatter(Loadings[ind, comp[0]-1], Loadings[ind, comp[1]-1],
-                                   s=10, c='w', marker='o', edgecolor='grey')
-                        ax.text(Loadings[ind, comp[0]-1] + xSpace,
-                                Loadings[ind, comp[1]-1] + ySpace, name, fontsize=12)
+                    # Plot all loadings in one collection, then add the names.
+                    ax.scatter(Loadings[:, comp[0]-1], Loadings[:, comp[1]-1],
+                               s=10, c='w', marker='o', edgecolor='grey')
+                    drawLabels(ax, Loadings[:, comp[0]-1], Loadings[:, comp[1]-1],
+                               varNames, maxLabels=maxLabels, labelBy=labelBy,
+                               xSpace=xSpace, ySpace=ySpace, fontsize=12)
 
                     # Set limits for dashed lines representing axes
                     xMaxLine = xMax + extraX
@@ -404,10 +961,7 @@ def plot(model, comp=[1, 2], plots=[1, 2, 3, 4], which=[], line=False,
                     yMinLine = yMin - extraY
 
                     # Plot dashes axes lines
-                    ax.plot([0, 0], [yMaxLine, yMinLine], color='0.4',
-                            linestyle='dashed', linewidth=1)
-                    ax.plot([xMinLine, xMaxLine], [0, 0], color='0.4',
-                            linestyle='dashed', linewidth=1)
+                    _drawAxisLines(ax, [xMinLine, xMaxLine], [yMaxLine, yMinLine])
 
                     # Set limits for plot regions.
                     xMaxLim = xMax + limX
@@ -426,10 +980,17 @@ def plot(model, comp=[1, 2], plots=[1, 2, 3, 4], which=[], line=False,
                                                       str(round(XexplVar[comp[1]-1], 1))))
 
                 else:  # Line plot
-                    ax.plot(Loadings[:, comp[0]], color='b',
-                            linewidth=1, label='comp {0}'.format(str(comp[0])))
-                    ax.plot(Loadings[:, comp[1]], color='r',
-                            linewidth=1, label='comp {0}'.format(str(comp[1])))
+                    if maxPoints is None:
+                        ax.plot(Loadings[:, comp[0]], color='b',
+                                linewidth=1, label='comp {0}'.format(str(comp[0])))
+                        ax.plot(Loadings[:, comp[1]], color='r',
+                                linewidth=1, label='comp {0}'.format(str(comp[1])))
+                    else:
+                        # Decimated, again for the visible range on zooming
+                        for num, color in zip(comp[:2], ['b', 'r']):
+                            _DecimatedLine(ax, model, LoadingAccessor[xy], num,
+                                           maxPoints, color=color, linewidth=1,
+                                           label='comp {0}'.format(str(num)))
 
                     xMaxLine = np.shape(Loadings)[0] * 1.05
                     ax.plot([0, xMaxLine], [0, 0], color='0.4', linestyle='dashed',
@@ -441,8 +1002,8 @@ def plot(model, comp=[1, 2], plots=[1, 2, 3, 4], which=[], line=False,
                         ax.set_title('Loading weights')
                     ax.set_xlim(0, xMaxLine)
 
-                    plt.legend(loc='best', shadow=False, labelspacing=.1)
-                    ltext = plt.gca().get_legend().get_texts()
+                    ax.legend(loc='best', shadow=False, labelspacing=.1)
+                    ltext = ax.get_legend().get_texts()
                     plt.setp(ltext[0], fontsize=10, color='k')
 
                 if weights == False:
@@ -450,72 +1011,46 @@ def plot(model, comp=[1, 2], plots=[1, 2, 3, 4], which=[], line=False,
                 else:
                     ax.set_title('Loading weights plot')
 
-                plt.show()
+                figures.finish()
 
         # Correlation loadings
         if item == 3:
 
-            XexplVar = model.X_calExplVar()
-            XcorrLoadings = model.X_corrLoadings()
+            XexplVar = timer.fetch(model, 'X_calExplVar')
+            XcorrLoadings = timer.fetch(model, 'X_corrLoadings')
             if modeltype != 'PCA':
-                YexplVar = model.Y_calExplVar()
-                YcorrLoadings = model.Y_corrLoadings()
+                YexplVar = timer.fetch(model, 'Y_calExplVar')
+                YcorrLoadings = timer.fetch(model, 'Y_corrLoadings')
 
-            fig = plt.figure(figsize=figsize)
-            ax = fig.add_subplot(111)
+            ax = figures.newAxes()
 
-            # Plot lines through origo
-            xMaxLine = 1.2
-            xMinLine = -1.2
-
-            yMaxLine = 1.2
-            yMinLine = -1.2
-
-            ax.plot([0, 0], [yMaxLine, yMinLine], color='0.4', linestyle='dashed',
-                    linewidth=1)
-            ax.plot([xMinLine, xMaxLine], [0, 0], color='0.4', linestyle='dashed',
-                    linewidth=1)
-
-            # Plot ellipses for correlation loadings
-            ellipses = model.corrLoadingsEllipses()
-            xcords50perc = ellipses['x50perc']
-            ycords50perc = ellipses['y50perc']
-
-            xcords100perc = ellipses['x100perc']
-            ycords100perc = ellipses['y100perc']
-
-            ax.plot(xcords50perc, ycords50perc, 'k-')
-            ax.plot(xcords100perc, ycords100perc, 'k-')
+            # Lines through origo and ellipses of 50% and 100% explained
+            # variance, the same for all models
+            _drawTemplate(ax, 'correlationLoadings')
 
             if which[plotInd] in ['Y', 'Both']:
-                # Loop through all coordinates (PC1,PC2) and names to plot Y loadings
-                for ind, varName in enumerate(YvarNames):
-
-                    ax.scatter(YcorrLoadings[ind, comp[0]-1], YcorrLoadings[ind, comp[1]-1], s=10, c='w',
-                               marker='o', edgecolor='b')
-
-                    ax.text(YcorrLoadings[ind, comp[0]-1], YcorrLoadings[ind, comp[1]-1], varName,
-                            fontsize=10, color='b')
+                # Plot all Y correlation loadings in one collection, then add names
+                ax.scatter(YcorrLoadings[:, comp[0]-1], YcorrLoadings[:, comp[1]-1], s=10, c='w',
+                           marker='o', edgecolor='b')
+                drawLabels(ax, YcorrLoadings[:, comp[0]-1], YcorrLoadings[:, comp[1]-1],
+                           YvarNames, maxLabels=maxLabels, labelBy=labelBy,
+                           fontsize=10, color='b')
 
             if which[plotInd] == 'Both':
-                # Loop through all coordinates (PC1,PC2) and names to plot X loadings
-                for ind, varName in enumerate(XvarNames):
-
-                    ax.scatter(XcorrLoadings[ind, comp[0]-1], XcorrLoadings[ind, comp[1]-1], s=10, c='w',
-                               marker='o', edgecolor='r')
-
-                    ax.text(XcorrLoadings[ind, comp[0]-1], XcorrLoadings[ind, comp[1]-1], varName,
-                            fontsize=10, color='r')
+                # Plot all X correlation loadings in one collection, then add names
+                ax.scatter(XcorrLoadings[:, comp[0]-1], XcorrLoadings[:, comp[1]-1], s=10, c='w',
+                           marker='o', edgecolor='r')
+                drawLabels(ax, XcorrLoadings[:, comp[0]-1], XcorrLoadings[:, comp[1]-1],
+                           XvarNames, maxLabels=maxLabels, labelBy=labelBy,
+                           fontsize=10, color='r')
 
             if which[plotInd] == 'X':
-                # Loop through all coordinates (PC1,PC2) and names to plot X loadings
-                for ind, varName in enumerate(XvarNames):
-
-                    ax.scatter(XcorrLoadings[ind, comp[0]-1], XcorrLoadings[ind, comp[1]-1], s=10, c='w',
-                               marker='o', edgecolor='b')
-
-                    ax.text(XcorrLoadings[ind, comp[0]-1], XcorrLoadings[ind, comp[1]-1], varName,
-                            fontsize=10, color='b')
+                # Plot all X correlation loadings in one collection, then add names
+                ax.scatter(XcorrLoadings[:, comp[0]-1], XcorrLoadings[:, comp[1]-1], s=10, c='w',
+                           marker='o', edgecolor='b')
+                drawLabels(ax, XcorrLoadings[:, comp[0]-1], XcorrLoadings[:, comp[1]-1],
+                           XvarNames, maxLabels=maxLabels, labelBy=labelBy,
+                           fontsize=10, color='b')
 
             # Plot title, axis names.
             if modeltype != 'PCA':
@@ -550,20 +1085,20 @@ def plot(model, comp=[1, 2], plots=[1, 2, 3, 4], which=[], line=False,
             ax.set_xlim(-1.1, 1.1)
             ax.set_ylim(-1.1, 1.1)
 
-            plt.show()
+            figures.finish()
 
         # 4. Biplot (scores + loadings)
         if item == 4:
             if which[plotInd] == 'X':
-                X = model.X_scores()[:, [comp[0]-1, comp[1]-1]]
-                Y = model.X_loadings()[:, [comp[0]-1, comp[1]-1]]
+                X = timer.fetch(model, 'X_scores')[:, [comp[0]-1, comp[1]-1]]
+                Y = timer.fetch(model, 'X_loadings')[:, [comp[0]-1, comp[1]-1]]
                 varNames = XvarNames
-                explVar = model.X_calExplVar()
+                explVar = timer.fetch(model, 'X_calExplVar')
             else:
-                X = model.Y_scores()[:, [comp[0]-1, comp[1]-1]]
-                Y = model.Y_loadings()[:, [comp[0]-1, comp[1]-1]]
+                X = timer.fetch(model, 'Y_scores')[:, [comp[0]-1, comp[1]-1]]
+                Y = timer.fetch(model, 'Y_loadings')[:, [comp[0]-1, comp[1]-1]]
                 varNames = YvarNames
-                explVar = model.Y_calExplVar()
+                explVar = timer.fetch(model, 'Y_calExplVar')
 
             # Decide plot regions and ratios
             rangX = [-abs(np.min(X, axis=0)), abs(np.max(X, axis=0))]
@@ -572,72 +1107,109 @@ def plot(model, comp=[1, 2], plots=[1, 2, 3, 4], which=[], line=False,
             rangY = [-abs(np.min(Y, axis=0)), abs(np.max(Y, axis=0))]
             ratio = np.max(np.vstack(rangY)/np.transpose(np.vstack([rangX1, rangX1])))
 
-            fig = plt.figure(figsize=figsize)
-            ax = fig.add_subplot(111)
+            ax = figures.newAxes()
 
-            # Loop through scores.
-            for ind, objName in enumerate(objNames):
+            # Plot all scores at once, then add the object names.
+            _drawObjects(ax, X[:, 0], X[:, 1], objNames,
+                         density, densityOutliers, maxLabels, labelBy)
 
-                ax.scatter(X[ind, 0], X[ind, 1], s=10, c='w',
-                           marker='o', edgecolor='grey')
-                ax.text(X[ind, 0], X[ind, 1], objName, fontsize=10)
-
-            ax.plot([0, 0], [rangX1[0]-rangDiff*0.1, rangX1[1]+rangDiff*0.1], color='0.4', linestyle='dashed',
-                    linewidth=1)
-            ax.plot([rangX1[0]-rangDiff*0.1, rangX1[1]+rangDiff*0.2], [0, 0], color='0.4', linestyle='dashed',
-                    linewidth=1)
+            _drawAxisLines(ax, [rangX1[0]-rangDiff*0.1, rangX1[1]+rangDiff*0.2],
+                           [rangX1[0]-rangDiff*0.1, rangX1[1]+rangDiff*0.1])
             ax.set_xlim(rangX1[0]-rangDiff*0.05, rangX1[1]+rangDiff*0.15)
             ax.set_ylim(rangX1[0]-rangDiff*0.05, rangX1[1]+rangDiff*0.05)
 
-            plt.xlabel('Scores comp {0} ({1}%)'.format(str(comp[0]),
-                                                       str(round(explVar[comp[0]-1], 1))))
-            plt.ylabel('Scores comp {0} ({1}%)'.format(str(comp[1]),
-                                                       str(round(explVar[comp[1]-1], 1))))
-            ax1 = plt.twiny()
-            plt.xlabel('Loadings comp {0} ({1}%)'.format(str(comp[0]),
-                                                         str(round(explVar[comp[0]-1], 1))), color='red')
-            plt.tick_params(axis="x", labelcolor="r")
-            ax2 = plt.twinx()
-            plt.ylabel('Loadings comp {0} ({1}%)'.format(str(comp[1]),
-                                                         str(round(explVar[comp[1]-1], 1))), color='red')
-            plt.tick_params(axis="y", labelcolor="r")
+            ax.set_xlabel('Scores comp {0} ({1}%)'.format(str(comp[0]),
+                                                          str(round(explVar[comp[0]-1], 1))))
+            ax.set_ylabel('Scores comp {0} ({1}%)'.format(str(comp[1]),
+                                                          str(round(explVar[comp[1]-1], 1))))
+            ax1 = ax.twiny()
+            ax1.set_xlabel('Loadings comp {0} ({1}%)'.format(str(comp[0]),
+                                                             str(round(explVar[comp[0]-1], 1))), color='red')
+            ax1.tick_params(axis="x", labelcolor="r")
+            ax2 = ax1.twinx()
+            ax2.set_ylabel('Loadings comp {0} ({1}%)'.format(str(comp[1]),
+                                                             str(round(explVar[comp[1]-1], 1))), color='red')
+            ax2.tick_params(axis="y", labelcolor="r")
             ax2.set_xlim((rangX1[0]-rangDiff*0.05)*ratio, (rangX1[1]+rangDiff*0.15)*ratio)
             ax2.set_ylim((rangX1[0]-rangDiff*0.05)*ratio, (rangX1[1]+rangDiff*0.05)*ratio)
 
-            # Loop through loadings.
-            for ind, name in enumerate(varNames):
-
-                ax2.scatter(Y[ind, 0], Y[ind, 1],
-                            s=10, c='w', marker='o', edgecolor='grey')
-                ax2.text(Y[ind, 0],
-                         Y[ind, 1], name, fontsize=12, color='red')
-            plt.show()
+            # Plot all loadings in one collection, then add the variable names.
+            ax2.scatter(Y[:, 0], Y[:, 1],
+                        s=10, c='w', marker='o', edgecolor='grey')
+            drawLabels(ax2, Y[:, 0], Y[:, 1], varNames,
+                       maxLabels=maxLabels, labelBy=labelBy,
+                       fontsize=12, color='red')
+            figures.finish()
 
         # 5.	Regression coefficients
         if item == 5:
-            RegCoefs = model.regressionCoefficients(comp[0])
-            for ind in range(np.shape(RegCoefs)[1]):
-                fig = plt.figure(figsize=figsize)
-                ax = fig.add_subplot(111)
-                if np.shape(RegCoefs)[1] > 1:
-                    ax.plot(RegCoefs[:, ind], color='b',
-                            linewidth=1, label=YvarNames[ind])
+            RegCoefs = timer.fetch(model, 'regressionCoefficients', comp[0])
+            numY = np.shape(RegCoefs)[1]
+            xMaxLine = np.shape(RegCoefs)[0] * 1.05
+
+            if overlay:
+                # All responses as one collection of lines in one axes
+                ax = figures.newAxes()
+                xPos, coefs = _decimate(RegCoefs, _maxPoints(ax, maxPoints))
+                if numY <= 10:
+                    colors = ['C{0}'.format(ind) for ind in range(numY)]
                 else:
-                    ax.plot(RegCoefs, color='b',
-                            linewidth=1)
-
-                xMaxLine = np.shape(RegCoefs)[0] * 1.05
+                    colors = plt.get_cmap('viridis')(np.linspace(0, 1, numY))
+                ax.add_collection(LineCollection(
+                    np.stack([xPos.T, coefs.T], axis=-1), colors=colors,
+                    linewidths=1))
                 ax.plot([0, xMaxLine], [0, 0], color='0.4', linestyle='dashed',
                         linewidth=1)
 
-                ax.set_title('Regression coefficients')
+                yMin = np.min(coefs)
+                yMax = np.max(coefs)
+                yMargin = (yMax - yMin) * .05
                 ax.set_xlim(0, xMaxLine)
+                ax.set_ylim(min(yMin - yMargin, 0), max(yMax + yMargin, 0))
+                ax.set_title('Regression coefficients')
 
-                if np.shape(RegCoefs)[1] > 1:
-                    plt.legend([YvarNames[ind]], loc='best', shadow=False, labelspacing=.1)
-                    ltext = plt.gca().get_legend().get_texts()
-                    plt.setp(ltext[0], fontsize=10, color='k')
-                plt.show()
+                if 1 < numY <= 10:
+                    handles = [Line2D([], [], color=color, linewidth=1)
+                               for color in colors]
+                    ax.legend(handles, [YvarNames[ind] for ind in range(numY)],
+                              loc='best', shadow=False, labelspacing=.1,
+                              fontsize=10)
+                figures.finish()
+            else:
+                panels = figures
+                if smallMultiples and numY > 1:
+                    panels = _smallMultiples(figures, numY, figsize, show, timer)
+
+                for ind in range(numY):
+                    ax = panels.newAxes()
+                    xPos, coefs = _decimate(RegCoefs[:, [ind]],
+                                            _maxPoints(ax, maxPoints))
+                    if numY > 1:
+                        ax.plot(xPos[:, 0], coefs[:, 0], color='b',
+                                linewidth=1, label=YvarNames[ind])
+                    else:
+                        ax.plot(xPos[:, 0], coefs[:, 0], color='b',
+                                linewidth=1)
+
+                    ax.plot([0, xMaxLine], [0, 0], color='0.4', linestyle='dashed',
+                            linewidth=1)
+                    ax.set_xlim(0, xMaxLine)
+
+                    if panels is not figures:
+                        ax.set_title(YvarNames[ind], fontsize=10)
+                        continue
+
+                    ax.set_title('Regression coefficients')
+
+                    if numY > 1:
+                        ax.legend([YvarNames[ind]], loc='best', shadow=False, labelspacing=.1)
+                        ltext = ax.get_legend().get_texts()
+                        plt.setp(ltext[0], fontsize=10, color='k')
+                    figures.finish()
+
+                if panels is not figures:
+                    figures.figs.extend(panels.figs)
+                    panels.finishAll()
 
         # 6. Explained variance
         #    o cumulative = True, validated = False, individual = False
@@ -647,12 +1219,13 @@ def plot(model, comp=[1, 2], plots=[1, 2, 3, 4], which=[], line=False,
 
                 if which[plotInd] == 'X':
                     XorY = 'X'
-                    CalExplVar_indVar = model.X_cumCalExplVar_indVar()
+                    CumCalExplVar_indVar = timer.fetch(model, 'X_cumCalExplVar_indVar')
                     varNames = XvarNames
                 else:
                     XorY = 'Y'
-                    CalExplVar_indVar = model.Y_cumCalExplVar_indVar()
+                    CumCalExplVar_indVar = timer.fetch(model, 'Y_cumCalExplVar_indVar')
                     varNames = YvarNames
+                CalExplVar_indVar = CumCalExplVar_indVar
                 if cumulative == False:
                     CalExplVar_indVar = np.hstack(
                         [np.reshape(CalExplVar_indVar[:, 0], [-1, 1]), np.diff(CalExplVar_indVar)])
@@ -660,35 +1233,40 @@ def plot(model, comp=[1, 2], plots=[1, 2, 3, 4], which=[], line=False,
                 if validated == False:
                     # Calibrated
                     try:
-                        fig = plt.figure(figsize=figsize)
-                        ax = fig.add_subplot(111)
+                        ax = figures.newAxes()
 
-                        # Construct positions for ticks along x-axis.
-                        xPos = range(np.shape(CalExplVar_indVar)[0])
+                        if heatmap:
+                            order = _orderVariables(CumCalExplVar_indVar, varOrder)
+                            _drawExplVarHeatmap(ax, CumCalExplVar_indVar, varNames,
+                                                order, cumulative)
+                        else:
+                            # Construct positions for ticks along x-axis.
+                            xPos = range(np.shape(CalExplVar_indVar)[0])
 
-                        plot_colours = it.cycle(('b', 'r', 'k', 'g', 'm', 'b', 'r', 'k', 'g', 'm'))
-                        plot_linestyles = it.cycle(('solid', 'solid', 'solid', 'solid', 'solid',
-                                                    'dashed', 'dashed', 'dashed', 'dashed', 'dashed'))
+                            plot_colours = it.cycle(('b', 'r', 'k', 'g', 'm', 'b', 'r', 'k', 'g', 'm'))
+                            plot_linestyles = it.cycle(('solid', 'solid', 'solid', 'solid', 'solid',
+                                                        'dashed', 'dashed', 'dashed', 'dashed', 'dashed'))
 
-                        for varInd in range(np.shape(CalExplVar_indVar)[1]):
-                            ax.plot(xPos, CalExplVar_indVar[:, varInd],
-                                    color=next(plot_colours),
-                                    linestyle=next(plot_linestyles), linewidth=1,
-                                    label=varNames[varInd]+' CAL')
+                            for varInd in range(np.shape(CalExplVar_indVar)[1]):
+                                ax.plot(xPos, CalExplVar_indVar[:, varInd],
+                                        color=next(plot_colours),
+                                        linestyle=next(plot_linestyles), linewidth=1,
+                                        label=varNames[varInd]+' CAL')
 
-                        ax.set_xticks(xPos)
+                            ax.set_xticks(xPos)
 
-                        ax.set_ylabel('Explained variance [%]')
+                            ax.set_ylabel('Explained variance [%]')
                         if XorY == 'X':
                             ax.set_title('CALIBRATED Explained variance of individual variables in X')
                         else:
                             ax.set_title('CALIBRATED Explained variance of individual variables in Y')
 
-                        plt.legend(loc='best', shadow=False, labelspacing=.1)
-                        ltext = plt.gca().get_legend().get_texts()
-                        plt.setp(ltext[0], fontsize=10, color='k')
+                        if not heatmap:
+                            ax.legend(loc='best', shadow=False, labelspacing=.1)
+                            ltext = ax.get_legend().get_texts()
+                            plt.setp(ltext[0], fontsize=10, color='k')
 
-                        plt.show()
+                        figures.finish()
 
                     except AttributeError:
                         print('Cumulative calbrated explained variances plot for individual variables not available for PLSR1 model.')
@@ -698,43 +1276,49 @@ def plot(model, comp=[1, 2], plots=[1, 2, 3, 4], which=[], line=False,
                     try:
                         if which[plotInd] == 'X':
                             XorY = 'X'
-                            ValExplVar_indVar = model.X_cumValExplVar_indVar()
+                            CumValExplVar_indVar = timer.fetch(model, 'X_cumValExplVar_indVar')
                         else:
                             XorY = 'Y'
-                            ValExplVar_indVar = model.Y_cumValExplVar_indVar()
+                            CumValExplVar_indVar = timer.fetch(model, 'Y_cumValExplVar_indVar')
+                        ValExplVar_indVar = CumValExplVar_indVar
                         if cumulative == False:
                             ValExplVar_indVar = np.hstack(
                                 [np.reshape(ValExplVar_indVar[:, 0], [-1, 1]), np.diff(ValExplVar_indVar)])
 
-                        fig = plt.figure(figsize=figsize)
-                        ax = fig.add_subplot(111)
+                        ax = figures.newAxes()
 
-                        # Construct positions for ticks along x-axis.
-                        xPos = range(np.shape(ValExplVar_indVar)[0])
+                        if heatmap:
+                            order = _orderVariables(CumValExplVar_indVar, varOrder)
+                            _drawExplVarHeatmap(ax, CumValExplVar_indVar, varNames,
+                                                order, cumulative)
+                        else:
+                            # Construct positions for ticks along x-axis.
+                            xPos = range(np.shape(ValExplVar_indVar)[0])
 
-                        plot_colours = it.cycle(('b', 'r', 'k', 'g', 'm', 'b', 'r', 'k', 'g', 'm'))
-                        plot_linestyles = it.cycle(('solid', 'solid', 'solid', 'solid', 'solid',
-                                                    'dashed', 'dashed', 'dashed', 'dashed', 'dashed'))
+                            plot_colours = it.cycle(('b', 'r', 'k', 'g', 'm', 'b', 'r', 'k', 'g', 'm'))
+                            plot_linestyles = it.cycle(('solid', 'solid', 'solid', 'solid', 'solid',
+                                                        'dashed', 'dashed', 'dashed', 'dashed', 'dashed'))
 
-                        for varInd in range(np.shape(ValExplVar_indVar)[1]):
-                            ax.plot(xPos, ValExplVar_indVar[:, varInd],
-                                    color=next(plot_colours),
-                                    linestyle=next(plot_linestyles), linewidth=1,
-                                    label=varNames[varInd]+' VAL')
+                            for varInd in range(np.shape(ValExplVar_indVar)[1]):
+                                ax.plot(xPos, ValExplVar_indVar[:, varInd],
+                                        color=next(plot_colours),
+                                        linestyle=next(plot_linestyles), linewidth=1,
+                                        label=varNames[varInd]+' VAL')
 
-                        ax.set_xticks(xPos)
+                            ax.set_xticks(xPos)
 
-                        ax.set_ylabel('Explained variance [%]')
+                            ax.set_ylabel('Explained variance [%]')
                         if XorY == 'X':
                             ax.set_title('VALIDATED Explained variance of individual variables in X')
                         else:
                             ax.set_title('VALIDATED Explained variance of individual variables in Y')
 
-                        plt.legend(loc='best', shadow=False, labelspacing=.1)
-                        ltext = plt.gca().get_legend().get_texts()
-                        plt.setp(ltext[0], fontsize=10, color='k')
+                        if not heatmap:
+                            ax.legend(loc='best', shadow=False, labelspacing=.1)
+                            ltext = ax.get_legend().get_texts()
+                            plt.setp(ltext[0], fontsize=10, color='k')
 
-                        plt.show()
+                        figures.finish()
 
                     except AttributeError:
                         print('Cumulative validated explained variances plot for individual variables in Y not available for PLSR1 model.')
@@ -742,18 +1326,17 @@ def plot(model, comp=[1, 2], plots=[1, 2, 3, 4], which=[], line=False,
             else:  # Per block
                 if which[plotInd] == 'X':
                     XorY = 'X'
-                    CalExplVar = model.X_cumCalExplVar()
-                    ValExplVar = model.X_cumValExplVar()
+                    CalExplVar = timer.fetch(model, 'X_cumCalExplVar')
+                    ValExplVar = timer.fetch(model, 'X_cumValExplVar')
                 else:
                     XorY = 'Y'
-                    CalExplVar = model.Y_cumCalExplVar()
-                    ValExplVar = model.Y_cumValExplVar()
+                    CalExplVar = timer.fetch(model, 'Y_cumCalExplVar')
+                    ValExplVar = timer.fetch(model, 'Y_cumValExplVar')
                 if cumulative == False:
                     CalExplVar = np.hstack([CalExplVar[0], np.diff(CalExplVar)])
                     ValExplVar = np.hstack([ValExplVar[0], np.diff(ValExplVar)])
 
-                fig = plt.figure(figsize=figsize)
-                ax = fig.add_subplot(111)
+                ax = figures.newAxes()
 
                 # Construct positions for ticks along x-axis.
                 xPos = range(len(CalExplVar))
@@ -772,11 +1355,11 @@ def plot(model, comp=[1, 2], plots=[1, 2, 3, 4], which=[], line=False,
                 else:
                     ax.set_title('Explained variance in Y')
 
-                plt.legend(loc='best', shadow=False, labelspacing=.1)
-                ltext = plt.gca().get_legend().get_texts()
+                ax.legend(loc='best', shadow=False, labelspacing=.1)
+                ltext = ax.get_legend().get_texts()
                 plt.setp(ltext[0], fontsize=10, color='k')
 
-                plt.show()
+                figures.finish()
 
         # 7. Prediction plot (y ?yhatt)
         if item == 7:
@@ -787,73 +1370,53 @@ def plot(model, comp=[1, 2], plots=[1, 2, 3, 4], which=[], line=False,
                 Y = model.arrY_input
                 ny = np.shape(Y)[1]
             if newData == False:
-                Yhat = model.Y_predict(model.arrX_input, comp[0])
+                Yhat = timer.call(model.Y_predict, model.arrX_input, comp[0])
                 theObjNames = objNames
             else:
                 Y = newY
-                Yhat = model.Y_predict(newX, comp[0])
+                Yhat = timer.call(model.Y_predict, newX, comp[0])
                 theObjNames = newObjNames
 
-            for ys in range(ny):
-                fig = plt.figure(figsize=figsize)
-                ax = fig.add_subplot(111)
-
-                # Loop through all coordinates (PC1,PC2) and names to plot scores.
-                for ind, objName in enumerate(theObjNames):
-
-                    ax.scatter(Y[ind, ys], Yhat[ind, ys], s=10, c='w',
-                               marker='o', edgecolor='grey')
-                    ax.text(Y[ind, ys], Yhat[ind, ys], objName, fontsize=10)
-
-                # Find maximum and minimum scores along PC1 and PC2
-                xMax = max(Y[:, ys])
-                xMin = min(Y[:, ys])
-
-                yMax = max(Yhat[:, ys])
-                yMin = min(Yhat[:, ys])
-
-                xyMin = min([xMin, yMin])
-                xyMax = max([xMax, yMax])
-
-                # Set limits for lines representing the axes.
-                # x-axis
-                if abs(xyMax) >= abs(xyMin):
-                    extraX = xyMax * .4
-                    limX = xyMax * .3
-
-                elif abs(xyMax) < abs(xyMin):
-                    extraX = abs(xyMin) * .4
-                    limX = abs(xyMin) * .3
-
-                # y-axis
-                if abs(xyMax) >= abs(xyMin):
-                    extraY = xyMax * .4
-                    limY = xyMax * .3
+            # Limits of all responses at once
+            xyMin = np.minimum(np.min(Y, axis=0), np.min(Yhat, axis=0))
+            xyMax = np.maximum(np.max(Y, axis=0), np.max(Yhat, axis=0))
+            extent = np.where(np.abs(xyMax) >= np.abs(xyMin), xyMax,
+                              np.abs(xyMin))
+            lineLims = np.column_stack([xyMin - extent * .4, xyMax + extent * .4])
+            plotLims = np.column_stack([xyMin - extent * .3, xyMax + extent * .3])
 
-                elif abs(xyMax) < abs(xyMin):
-                    extraY = abs(xyMin) * .4
-                    limY = abs(xyMin) * .3
+            # Small multiples: all responses as panels of one figure
+            panels = figures
+            if smallMultiples:
+                panels = _smallMultiples(figures, ny, figsize, show, timer)
 
-                xMaxLine = xyMax + extraX
-                xMinLine = xyMin - extraX
+            for ys in range(ny):
+                ax = panels.newAxes()
 
-                yMaxLine = xyMax + extraY
-                yMinLine = xyMin - extraY
+                # Plot all predictions at once, then add the names ranked by
+                # distance from the diagonal, i.e. the residual
+                _drawObjects(ax, Y[:, ys], Yhat[:, ys], theObjNames,
+                             density, densityOutliers, maxLabels, labelBy,
+                             rankCoords=np.column_stack([Y[:, ys] - Yhat[:, ys],
+                                                         np.zeros(len(Y))]))
 
-                ax.plot([xMinLine, xMaxLine], [xMinLine, xMaxLine],
+                ax.plot(lineLims[ys], lineLims[ys],
                         color='0.4', linestyle='dashed', linewidth=1)
 
                 # Set limits for plot regions.
-                xMaxLim = xyMax + limX
-                xMinLim = xyMin - limX
-
-                yMaxLim = xyMax + limY
-                yMinLim = xyMin - limY
-
-                ax.set_xlim(xMinLim, xMaxLim)
-                ax.set_ylim(yMinLim, yMaxLim)
+                ax.set_xlim(plotLims[ys])
+                ax.set_ylim(plotLims[ys])
 
                 # Plot title, axis names.
+                if panels is not figures:
+                    # Axis names only along the left column and bottom row
+                    ax.set_title(YvarNames[ys], fontsize=10)
+                    if ys % panels.grid[1] == 0:
+                        ax.set_ylabel('Predicted ({0} comp.)'.format(str(comp[0])))
+                    if ys + panels.grid[1] >= ny:
+                        ax.set_xlabel('Reference')
+                    continue
+
                 ax.set_xlabel('Reference')
                 ax.set_ylabel('Predicted ({0} comp.)'.format(str(comp[0])))
 
@@ -862,4 +1425,61 @@ def plot(model, comp=[1, 2], plots=[1, 2, 3, 4], which=[], line=False,
                 else:
                     ax.set_title('Prediction plot ('+YvarNames[ys]+')')
 
-                plt.show()
+                figures.finish()
+
+            if panels is not figures:
+                figures.figs.extend(panels.figs)
+                panels.finishAll()
+
+        # 8. Control chart, calibration objects followed by new objects
+        if item == 8:
+            T2, Q = timer.call(controlStatistics, model, comp[0])
+            T2lim, Qlim = timer.call(controlLimits, model, comp[0], limitLevels)
+            numCal = len(T2)
+            if newData:
+                newT2, newQ = timer.call(controlStatistics, model, comp[0], newX)
+                T2 = np.concatenate([T2, newT2])
+                Q = np.concatenate([Q, newQ])
+
+            for values, limits, name in [(T2, T2lim, 'Hotelling T2'),
+                                         (Q, Qlim, 'Q residuals')]:
+                ax = figures.newAxes()
+                xPos, line = _decimate(values[:, np.newaxis],
+                                       _maxPoints(ax, maxPoints))
+                xPos = xPos[:, 0]
+                line = line[:, 0]
+                cal = xPos < numCal
+                ax.plot(xPos[cal], line[cal], color='0.4', linewidth=1)
+                if newData:
+                    ax.plot(xPos[~cal], line[~cal], color='b', linewidth=1)
+                    ax.axvline(numCal - .5, color='0.4', linestyle='dotted',
+                               linewidth=1)
+
+                # Objects beyond the highest limit
+                outside = np.flatnonzero(values > np.max(limits))
+                ax.scatter(outside, values[outside], s=10, c='r', marker='o',
+                           zorder=3)
+
+                for level, limit in zip(limitLevels, limits):
+                    ax.axhline(limit, color='r', linestyle='dashed',
+                               linewidth=1)
+                    ax.annotate('{0}%'.format(level), (1, limit),
+                                xycoords=('axes fraction', 'data'),
+                                xytext=(-2, 2), textcoords='offset points',
+                                ha='right', va='bottom', color='r',
+                                fontsize=8)
+
+                ax.set_xlim(-.5, len(values) - .5)
+                ax.set_ylim(0, max(np.max(values), np.max(limits)) * 1.05)
+                ax.set_xlabel('Object')
+                ax.set_ylabel(name)
+                ax.set_title('{0} ({1} comp.)'.format(name, comp[0]))
+                figures.finish()
+
+        timer.end()
+
+    timer.begin('finish', figs=figures.figs)
+    figures.finishAll()
+    timer.end('layout')
+    if not show:
+        return figures.figs
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+"""Memoization of results fetched from hoggorm models"""
+
+import threading
+import weakref
+from collections import OrderedDict
+
+
+class ModelCache(object):
+    """
+    Least recently used cache of model results. Results are stored per model
+    object and per accessor (including its arguments). At most ``maxModels``
+    models are kept. A model's entries are also dropped as soon as the model
+    itself is garbage collected.
+
+    Cached results are shared between callers and must not be modified in
+    place.
+
+    PARAMETERS
+    ----------
+    maxModels : int, optional
+        Maximum number of models for which results are kept. Defaults to 8.
+    """
+
+    def __init__(self, maxModels=8):
+        self.maxModels = maxModels
+        self._entries = OrderedDict()
+        self._lock = threading.RLock()
+
+    def _entry(self, model):
+        """
+        Returns the dictionary of cached results for a model, or None if the
+        model can not be tracked.
+        """
+        key = id(model)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0]() is model:
+                self._entries.move_to_end(key)
+                return entry[1]
+
+            try:
+                ref = weakref.ref(model, lambda ref: self._forget(key, ref))
+            except TypeError:
+                return None
+            results = {}
+            self._entries[key] = (ref, results)
+            while len(self._entries) > self.maxModels:
+                self._entries.popitem(last=False)
+            return results
+
+    def _forget(self, key, ref):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] is ref:
+                del self._entries[key]
+
+    def get(self, model, accessor, *args):
+        """
+        Returns ``getattr(model, accessor)(*args)``, computed only once per
+        model. All arguments must be hashable.
+        """
+        results = self._entry(model)
+        if results is None:
+            return getattr(model, accessor)(*args)
+
+        key = (accessor,) + args
+        if key not in results:
+            results[key] = getattr(model, accessor)(*args)
+        return results[key]
+
+    def derived(self, model, key, func):
+        """
+        Returns ``func()``, computed only once per model and ``key``. Used
+        for results combined from several accessors.
+        """
+        results = self._entry(model)
+        if results is None:
+            return func()
+
+        key = ('derived',) + tuple(key)
+        if key not in results:
+            results[key] = func()
+        return results[key]
+
+    def clear(self):
+        """
+        Removes all cached results.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def resize(self, maxModels):
+        """
+        Sets the maximum number of models kept, evicting the least recently
+        used models if needed.
+        """
+        with self._lock:
+            self.maxModels = maxModels
+            while len(self._entries) > self.maxModels:
+                self._entries.popitem(last=False)
+
+
+_cache = ModelCache()
+
+
+def cached(model, accessor, *args):
+    """
+    Returns the result of ``model.<accessor>(*args)`` from the module wide
+    model cache, calling the accessor only on the first request.
+    """
+    return _cache.get(model, accessor, *args)
+
+
+def derived(model, key, func):
+    """
+    Returns ``func()`` from the module wide model cache, computed only on
+    the first request for the model and ``key`` (a tuple).
+    """
+    return _cache.derived(model, key, func)
+
+
+def clearCache():
+    """
+    Removes all model results cached by hoggormplot. Call this after a model
+    object has been modified in place.
+    """
+    _cache.clear()
+
+
+def setCacheSize(maxModels):
+    """
+    Sets the number of models for which hoggormplot keeps fetched results.
+    Defaults to 8. With ``maxModels=0`` nothing is cached.
+    """
+    _cache.resize(maxModels)
@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+"""Hotelling T2, Q residual and leverage statistics of model objects"""
+
+import numpy as np
+
+from .model_cache import cached, derived
+
+
+# Number of new objects processed at once, bounds the memory used for the
+# residuals of large data sets
+CHUNKSIZE = 100000
+
+
+def _numComp(model, numComp):
+    maxComp = np.shape(cached(model, 'X_scores'))[1]
+    if numComp is None:
+        return maxComp
+    numComp = int(numComp)
+    if not 1 <= numComp <= maxComp:
+        raise ValueError('numComp must be between 1 and {0}'.format(maxComp))
+    return numComp
+
+
+def _scoreTerms(model):
+    """
+    Returns the cumulative T2 of the calibration objects for 1, 2, ...
+    components (objects x components) and the score variances. Computed
+    once for all components, so any number of components is a column.
+    """
+    scores = cached(model, 'X_scores')
+    variances = np.var(scores, axis=0, ddof=1)
+    return np.cumsum(np.square(scores) / variances, axis=1), variances
+
+
+def _residualSS(model, numComp):
+    """
+    Returns the sum of squared X residuals per calibration object.
+    """
+    residuals = cached(model, 'X_residuals')[numComp]
+    return np.einsum('ij,ij->i', residuals, residuals)
+
+
+def _calibration(model, numComp):
+    """
+    Returns T2 and Q of the calibration objects and the score variances.
+    """
+    cumT2, variances = derived(model, ('scoreTerms',),
+                               lambda: _scoreTerms(model))
+    Q = derived(model, ('residualSS', numComp),
+                lambda: _residualSS(model, numComp))
+    return cumT2[:, numComp - 1], Q, variances[:numComp]
+
+
+def _preprocessing(model):
+    """
+    Returns the column means and scales with which the calibration objects
+    were centred (and standardised per variable if ``Xstand``).
+    """
+    means = np.average(model.arrX_input, axis=0)
+    if model.Xstand:
+        return means, np.std(model.arrX_input, axis=0, ddof=1)
+    return means, np.ones_like(means)
+
+
+def _projection(model, numComp):
+    """
+    Returns the matrix projecting preprocessed objects onto the scores of
+    the first ``numComp`` components: the loadings for PCA and PCR models,
+    ``W inv(P'W)`` for PLS models.
+    """
+    loadings = cached(model, 'X_loadings')[:, :numComp]
+    try:
+        weights = cached(model, 'X_loadingWeights')[:, :numComp]
+    except AttributeError:
+        return loadings
+    return np.dot(weights, np.linalg.inv(np.dot(loadings.T, weights)))
+
+
+def controlStatistics(model, numComp=None, newX=None):
+    """
+    Computes Hotelling's T2 and the Q residuals (squared prediction error)
+    of objects with a hoggorm model, vectorised over all objects. Results
+    for the calibration objects are cached per model: T2 once for all
+    numbers of components, Q per number of components. New objects are
+    preprocessed as the calibration objects and projected onto the model in
+    chunks of ``CHUNKSIZE`` objects, so also very long data sets are
+    processed with bounded memory.
+
+    PARAMETERS
+    ----------
+    model : nipalsPCA/nipalsPCR/nipalsPLS1/nipalsPLS2 class object computed
+        in hoggorm.
+
+    numComp : int, optional
+        Number of components of the model used. Defaults to all components.
+
+    newX : array, optional
+        New objects (rows) to compute the statistics for. Defaults to None,
+        i.e. the calibration objects.
+
+    RETURNS
+    -------
+    A tuple of two arrays holding T2 and Q per object.
+
+    EXAMPLES
+    --------
+    >>> import hoggorm as ho
+    >>> import hoggormplot as hopl
+    >>> myModel = ho.nipalsPCA(arrX=my_X_data, numComp=3)
+    >>> T2, Q = hopl.controlStatistics(myModel, numComp=3, newX=my_new_data)
+    """
+    numComp = _numComp(model, numComp)
+    calT2, calQ, variances = _calibration(model, numComp)
+    if newX is None:
+        return calT2, calQ
+
+    newX = np.asarray(newX, dtype=float)
+    loadings = cached(model, 'X_loadings')[:, :numComp]
+    means, scale = derived(model, ('preprocessing',),
+                           lambda: _preprocessing(model))
+    projection = derived(model, ('projection', numComp),
+                         lambda: _projection(model, numComp))
+
+    T2 = np.empty(len(newX))
+    Q = np.empty(len(newX))
+    for start in range(0, len(newX), CHUNKSIZE):
+        chunk = (newX[start:start + CHUNKSIZE] - means) / scale
+        scores = np.dot(chunk, projection)
+        residuals = chunk - np.dot(scores, loadings.T)
+        T2[start:start + CHUNKSIZE] = np.sum(np.square(scores) / variances,
+                                             axis=1)
+        Q[start:start + CHUNKSIZE] = np.einsum('ij,ij->i', residuals,
+                                               residuals)
+    return T2, Q
+
+
+def controlLimits(model, numComp=None, levels=[95, 99]):
+    """
+    Returns control limits of Hotelling's T2 and the Q residuals as
+    empirical percentiles of the calibration objects.
+
+    PARAMETERS
+    ----------
+    model : nipalsPCA/nipalsPCR/nipalsPLS1/nipalsPLS2 class object computed
+        in hoggorm.
+
+    numComp : int, optional
+        Number of components of the model used. Defaults to all components.
+
+    levels : list, optional
+        Confidence levels in percent. Defaults to [95, 99].
+
+    RETURNS
+    -------
+    A tuple of two arrays holding the T2 and Q limits per level.
+    """
+    T2, Q = controlStatistics(model, numComp)
+    return np.percentile(T2, levels), np.percentile(Q, levels)
+
+
+def influenceStatistics(model, numComp=None):
+    """
+    Returns leverages and residual variances of the calibration objects of
+    a hoggorm model, computed from the cached T2 and Q statistics. The
+    leverage of an object is ``1/n + sum_a t_a**2 / (t_a' t_a)`` over the
+    components used, the residual variance is the mean squared X residual
+    of the object.
+
+    PARAMETERS
+    ----------
+    model : nipalsPCA/nipalsPCR/nipalsPLS1/nipalsPLS2 class object computed
+        in hoggorm.
+
+    numComp : int, optional
+        Number of components of the model used. Defaults to all components.
+
+    RETURNS
+    -------
+    A tuple of two arrays holding leverage and residual variance per
+    object.
+
+    EXAMPLES
+    --------
+    >>> import hoggorm as ho
+    >>> import hoggormplot as hopl
+    >>> myModel = ho.nipalsPCA(arrX=my_X_data, numComp=3)
+    >>> leverage, residualVar = hopl.influenceStatistics(myModel, numComp=2)
+    """
+    T2, Q = controlStatistics(model, numComp)
+    numObj = len(T2)
+    numVars = np.shape(cached(model, 'X_loadings'))[0]
+    return 1.0 / numObj + T2 / (numObj - 1), Q / numVars
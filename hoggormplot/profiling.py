@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+"""Opt-in timing of the phases of a plot call"""
+
+import time
+
+from .model_cache import cached
+
+
+class PlotProfile(object):
+    """
+    Collects the timing records of plot calls. Pass an instance as
+    ``profile`` to ``hoggormplot.plot`` or ``hoggormplot.plotSMI``. Any other
+    callable accepting one record may be passed instead, e.g. to forward the
+    records to a metrics system.
+
+    Each record is a dictionary with the keys
+
+        - ``'function'``: name of the plot function, 'plot' or 'plotSMI'
+        - ``'plot'``: plot type of the item, 'setup' for the preparation
+          before the first item and 'finish' for the final layout
+        - ``'index'``: position of the item in ``plots`` (None for setup
+          and finish records)
+        - ``'phases'``: dictionary mapping phase names to seconds, with
+          phases among 'inputs', 'names', 'figures', 'accessors',
+          'significance', 'artists', 'layout' and 'show'
+        - ``'seconds'``: total time of the item
+        - ``'artists'``: number of artists added by the item
+
+    EXAMPLES
+    --------
+    >>> import hoggormplot as hopl
+    >>> profile = hopl.PlotProfile()
+    >>> hopl.plot(myModel, plots=[1, 2, 6], profile=profile, show=False)
+    >>> profile.totals()
+    {'accessors': 0.012, 'artists': 0.034, ...}
+    >>> hopl.plot(myModel, profile=lambda record: print(record))
+    """
+
+    def __init__(self):
+        self.records = []
+
+    def __call__(self, record):
+        self.records.append(record)
+
+    def clear(self):
+        """
+        Removes all records.
+        """
+        self.records = []
+
+    def totals(self):
+        """
+        Returns dictionary with the seconds spent per phase, summed over all
+        records.
+        """
+        totals = {}
+        for record in self.records:
+            for phase, seconds in record['phases'].items():
+                totals[phase] = totals.get(phase, 0.0) + seconds
+        return totals
+
+    def __str__(self):
+        lines = ['{0:<10}{1:>12}{2:>8}{3:>11}{4:>9}  {5}'.format(
+            'function', 'plot', 'index', 'seconds', 'artists', 'phases')]
+        for record in self.records:
+            phases = ', '.join('{0} {1:.4f}'.format(phase, seconds)
+                               for phase, seconds in record['phases'].items())
+            index = '' if record['index'] is None else record['index']
+            lines.append('{0:<10}{1:>12}{2:>8}{3:>11.4f}{4:>9}  {5}'.format(
+                record['function'], record['plot'], index, record['seconds'],
+                record['artists'], phases))
+        return '\n'.join(lines)
+
+
+def _countArtists(figs):
+    return sum(len(fig.findobj()) for fig in figs)
+
+
+class _Timer(object):
+    """
+    Checkpoint timer used inside the plot functions. Time between two calls
+    of ``lap`` is booked on the named phase, except for the time spent in
+    model accessors called through ``fetch`` or ``call``, which is booked on
+    'accessors'. Without a profile all methods return immediately.
+    """
+
+    def __init__(self, profile, function):
+        self.profile = profile
+        self.function = function
+        self.record = None
+
+    def begin(self, plotType, index=None, figs=()):
+        """
+        Starts the record of one plot item. ``figs`` is the list the item
+        adds its figures to, so the added artists can be counted.
+        """
+        if self.profile is None:
+            return
+        self.record = {'function': self.function, 'plot': plotType,
+                       'index': index, 'phases': {}, 'seconds': 0.0,
+                       'artists': 0}
+        self._figs = figs
+        self._artists = _countArtists(figs)
+        self._fetched = 0.0
+        self._start = self._last = time.perf_counter()
+
+    def lap(self, phase):
+        """
+        Books the time since the last checkpoint on ``phase``.
+        """
+        if self.record is None:
+            return
+        now = time.perf_counter()
+        self._book(phase, now - self._last - self._fetched)
+        self._book('accessors', self._fetched)
+        self._fetched = 0.0
+        self._last = now
+
+    def _book(self, phase, seconds):
+        if seconds > 0:
+            phases = self.record['phases']
+            phases[phase] = phases.get(phase, 0.0) + seconds
+
+    def fetch(self, model, accessor, *args):
+        """
+        Returns ``cached(model, accessor, *args)``, timing the call.
+        """
+        if self.record is None:
+            return cached(model, accessor, *args)
+        return self.call(cached, model, accessor, *args)
+
+    def call(self, func, *args):
+        """
+        Returns ``func(*args)``, booking its time on 'accessors'.
+        """
+        if self.record is None:
+            return func(*args)
+        start = time.perf_counter()
+        result = func(*args)
+        self._fetched += time.perf_counter() - start
+        return result
+
+    def end(self, phase='artists'):
+        """
+        Books the remaining time on ``phase`` and passes the record to the
+        profile.
+        """
+        if self.record is None:
+            return
+        self.lap(phase)
+        record = self.record
+        record['seconds'] = self._last - self._start
+        record['artists'] = _countArtists(self._figs) - self._artists
+        self.record = None
+        self.profile(record)
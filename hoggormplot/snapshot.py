@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+"""Memory-mapped snapshots of the model results drawn by hoggormplot"""
+
+import json
+import os
+
+import numpy as np
+import hoggorm
+
+from .conv_coefficientsPlot import coefficientsStack
+from .model_cache import cached
+
+
+# Version of the on-disk layout, stored in the metadata file
+FORMAT = 1
+
+METADATA = 'snapshot.json'
+
+# Model accessors stored in a snapshot. Accessors a model does not provide
+# (e.g. validated results of a model without cross validation) are skipped.
+ACCESSORS = ['X_scores', 'X_loadings', 'X_loadingWeights', 'X_corrLoadings',
+             'X_calExplVar', 'X_cumCalExplVar', 'X_cumValExplVar',
+             'X_cumCalExplVar_indVar', 'X_cumValExplVar_indVar',
+             'Y_scores', 'Y_loadings', 'Y_corrLoadings',
+             'Y_calExplVar', 'Y_cumCalExplVar', 'Y_cumValExplVar',
+             'Y_cumCalExplVar_indVar', 'Y_cumValExplVar_indVar']
+
+
+def _modeltype(model):
+    if isinstance(model, hoggorm.pca.nipalsPCA):
+        return 'PCA'
+    elif isinstance(model, hoggorm.pcr.nipalsPCR):
+        return 'PCR'
+    elif isinstance(model, hoggorm.plsr1.nipalsPLS1):
+        return 'PLS1'
+    elif isinstance(model, hoggorm.plsr2.nipalsPLS2):
+        return 'PLS2'
+    elif isinstance(model, PlotSnapshot):
+        return model.modeltype
+    raise TypeError('model must be a hoggorm nipalsPCA, nipalsPCR, nipalsPLS1 '
+                    'or nipalsPLS2 object or a PlotSnapshot')
+
+
+def saveSnapshot(model, path):
+    """
+    Writes the results of a model drawn by ``hoggormplot.plot`` to the
+    directory ``path``: scores, loadings, loading weights, correlation
+    loadings, explained variances and regression coefficients for all
+    numbers of components. Each result is stored as an uncompressed ``.npy``
+    file, described by the metadata file ``snapshot.json``. The input data
+    of the model are not stored.
+
+    The metadata file is written last, so a directory only counts as a
+    snapshot once all arrays are complete. An existing snapshot in the
+    directory is overwritten.
+
+    PARAMETERS
+    ----------
+    model : nipalsPCA/nipalsPCR/nipalsPLS1/nipalsPLS2 class object computed
+        in hoggorm, or a PlotSnapshot.
+
+    path : str
+        Directory of the snapshot, created if it does not exist.
+
+    EXAMPLES
+    --------
+    >>> import hoggorm as ho
+    >>> import hoggormplot as hopl
+    >>> myModel = ho.nipalsPLS2(arrX=my_X_data, arrY=my_Y_data, numComp=5)
+    >>> hopl.saveSnapshot(myModel, 'snapshots/myModel')
+    """
+    modeltype = _modeltype(model)
+    if not os.path.isdir(path):
+        os.makedirs(path)
+    metadataPath = os.path.join(path, METADATA)
+    if os.path.exists(metadataPath):
+        os.remove(metadataPath)
+
+    arrays = {}
+    for accessor in ACCESSORS:
+        try:
+            values = cached(model, accessor)
+        except (AttributeError, KeyError):
+            continue
+        arrays[accessor] = values
+    if modeltype != 'PCA':
+        arrays['regressionCoefficients'] = coefficientsStack(model)
+
+    metadata = {'format': FORMAT, 'modeltype': modeltype, 'arrays': {}}
+    for accessor, values in arrays.items():
+        values = np.ascontiguousarray(values, dtype=float)
+        fileName = accessor + '.npy'
+        np.save(os.path.join(path, fileName), values)
+        metadata['arrays'][accessor] = {'file': fileName,
+                                        'shape': list(values.shape)}
+
+    with open(metadataPath + '.tmp', 'w') as fp:
+        json.dump(metadata, fp, indent=1, sort_keys=True)
+    os.replace(metadataPath + '.tmp', metadataPath)
+
+
+def loadSnapshot(path):
+    """
+    Opens a snapshot written by ``saveSnapshot``. Only the metadata file is
+    read, the arrays are memory-mapped read-only when first used. Loading
+    is therefore almost instant, and processes plotting from the same
+    snapshot share the pages of the arrays.
+
+    PARAMETERS
+    ----------
+    path : str
+        Directory of the snapshot.
+
+    RETURNS
+    -------
+    A PlotSnapshot, which can be passed as model to ``hoggormplot.plot`` and
+    the convenience functions.
+
+    EXAMPLES
+    --------
+    >>> import hoggormplot as hopl
+    >>> snapshot = hopl.loadSnapshot('snapshots/myModel')
+    >>> hopl.plot(snapshot, comp=[1, 2], plots=[1, 2, 3, 4, 6])
+    """
+    return PlotSnapshot(path)
+
+
+class PlotSnapshot(object):
+    """
+    Results of a model read from a snapshot directory, see ``loadSnapshot``.
+    Provides the accessors of the hoggorm model used by the scores,
+    loadings, correlation loadings, biplot, coefficients and explained
+    variance plots (plot types 1 to 6). Prediction, control chart and
+    influence plots as well as new data need the input data of the model
+    and are not available from a snapshot.
+
+    Arrays are read-only memory maps of the files in the snapshot
+    directory, mapped on first use.
+
+    ATTRIBUTES
+    ----------
+    path : str
+        Directory of the snapshot.
+
+    modeltype : str
+        Type of the model, 'PCA', 'PCR', 'PLS1' or 'PLS2'.
+    """
+
+    def __init__(self, path):
+        with open(os.path.join(path, METADATA)) as fp:
+            metadata = json.load(fp)
+        if metadata.get('format') != FORMAT:
+            raise ValueError('unsupported snapshot format {0} in {1}'.format(
+                metadata.get('format'), path))
+        self.path = path
+        self.modeltype = metadata['modeltype']
+        self._files = metadata['arrays']
+        self._arrays = {}
+
+    def __getstate__(self):
+        # Pickled by reference to the files, e.g. when sent to the worker
+        # processes of batchPlot, which map the arrays themselves
+        return {'path': self.path, 'modeltype': self.modeltype,
+                '_files': self._files}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._arrays = {}
+
+    def __repr__(self):
+        return 'PlotSnapshot({0!r}, modeltype={1!r})'.format(self.path,
+                                                             self.modeltype)
+
+    def __getattr__(self, name):
+        # Only called for attributes not found otherwise, e.g. the input
+        # data of the model
+        if name.startswith('__') or name in ('path', 'modeltype', '_files',
+                                             '_arrays'):
+            raise AttributeError(name)
+        raise AttributeError('{0!r} is not available from a plot snapshot, '
+                             'it needs the hoggorm model'.format(name))
+
+    def _array(self, accessor):
+        if accessor not in self._arrays:
+            if accessor not in self._files:
+                raise AttributeError('{0!r} is not stored in the snapshot '
+                                     '{1}'.format(accessor, self.path))
+            fileName = os.path.join(self.path, self._files[accessor]['file'])
+            self._arrays[accessor] = np.load(fileName, mmap_mode='r')
+        return self._arrays[accessor]
+
+    def regressionCoefficients(self, numComp=1):
+        """
+        Returns the regression coefficients for ``numComp`` components.
+        """
+        coefficients = self._array('regressionCoefficients')
+        if not 1 <= numComp <= len(coefficients):
+            raise ValueError('numComp must be between 1 and '
+                             '{0}'.format(len(coefficients)))
+        return coefficients[numComp - 1]
+
+
+def _accessor(name):
+    def accessor(self):
+        return self._array(name)
+    accessor.__name__ = name
+    accessor.__doc__ = 'Returns {0} of the model.'.format(name)
+    return accessor
+
+
+for _name in ACCESSORS:
+    setattr(PlotSnapshot, _name, _accessor(_name))
@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+"""Scores plot that is updated incrementally with new objects"""
+
+import numpy as np
+
+from .main_plot import plot
+
+
+class ScoresStream(object):
+    """
+    Scores plot for online monitoring. Batches of new objects are projected
+    onto the model with ``model.X_scores_predict`` and appended to the plot
+    by updating the offsets of a single collection, so no artists are
+    created per batch.
+
+    PARAMETERS
+    ----------
+    model : nipalsPCA/nipalsPCR/nipalsPLS1/nipalsPLS2 class object computed
+        in hoggorm.
+
+    comp : list, optional
+        The list contains components to be displayed. Defaults to [1,2].
+
+    ax : matplotlib axes, optional
+        Existing scores plot the new objects are added to, for example
+        ``hoggormplot.scores(model, show=False)[0].axes[0]``. By default a
+        new X scores plot of the calibration objects is created (not shown).
+
+    window : int, optional
+        Maximum number of new objects kept in the plot. When exceeded the
+        oldest objects are removed. Must be at least 1. Defaults to None,
+        i.e. all objects are kept.
+
+    maxLabels : int, optional
+        Passed on to ``hoggormplot.plot`` when a new scores plot is created.
+
+    figsize : tuple, optional
+        Sets figure width and height in inches of a newly created plot.
+
+    EXAMPLES
+    --------
+    >>> import hoggorm as ho
+    >>> import hoggormplot as hopl
+    >>> myModel = ho.nipalsPCA(arrX=my_X_data, numComp=3)
+    >>> stream = hopl.ScoresStream(myModel, window=500, maxLabels=0)
+    >>> for newX in my_batches:
+    ...     stream.update(newX)
+    ...     stream.fig.savefig('monitor.png')
+
+    For a live window, draw the scores plot in interactive mode and pass its
+    axes:
+
+    >>> import matplotlib.pyplot as plt
+    >>> plt.ion()
+    >>> hopl.scores(myModel)
+    >>> stream = hopl.ScoresStream(myModel, ax=plt.gca())
+    """
+
+    def __init__(self, model, comp=[1, 2], ax=None, window=None,
+                 maxLabels=None, figsize=None):
+        if window is not None and window < 1:
+            raise ValueError('window must be None or at least 1, got '
+                             '{0}'.format(window))
+        if ax is None:
+            fig = plot(model, comp=comp, plots=[1], which=['X'],
+                       maxLabels=maxLabels, figsize=figsize, show=False)[0]
+            ax = fig.axes[0]
+        self.model = model
+        self.comp = list(comp)
+        self.ax = ax
+        self.fig = ax.figure
+        self.window = window
+        self.points = np.zeros((0, 2))
+        self.collection = ax.scatter(self.points[:, 0], self.points[:, 1],
+                                     s=10, c='w', marker='o', edgecolor='r')
+
+    def update(self, newX):
+        """
+        Projects a batch of new objects onto the model and adds them to the
+        plot. Axis limits are widened when new scores fall outside of them.
+
+        PARAMETERS
+        ----------
+        newX : array
+            New measurement data, one row per object. A single object may be
+            given as a 1-D array.
+
+        RETURNS
+        -------
+        Array with the scores of the batch along the displayed components.
+        """
+        newX = np.atleast_2d(np.asarray(newX, dtype=float))
+        newScores = self.model.X_scores_predict(newX)[:, [self.comp[0]-1,
+                                                          self.comp[1]-1]]
+
+        points = np.vstack([self.points, newScores])
+        if self.window is not None:
+            points = points[-self.window:]
+        self.points = points
+        self.collection.set_offsets(points)
+
+        self._widenLimits(newScores)
+        self.fig.canvas.draw_idle()
+        return newScores
+
+    def clear(self):
+        """
+        Removes all new objects from the plot.
+        """
+        self.points = np.zeros((0, 2))
+        self.collection.set_offsets(self.points)
+        self.fig.canvas.draw_idle()
+
+    def _widenLimits(self, newScores):
+        if len(newScores) == 0:
+            return
+        for lims, setLims, coords in [
+                (self.ax.get_xlim(), self.ax.set_xlim, newScores[:, 0]),
+                (self.ax.get_ylim(), self.ax.set_ylim, newScores[:, 1])]:
+            low, high = np.min(coords), np.max(coords)
+            if low >= lims[0] and high <= lims[1]:
+                continue
+            margin = (max(high, lims[1]) - min(low, lims[0])) * .05
+            setLims(min(lims[0], low - margin), max(lims[1], high + margin))
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""Models shared by the tests, fitted once per session on synthetic data"""
+
+import contextlib
+import io
+
+import matplotlib
+matplotlib.use('Agg')
+
+import numpy as np
+import pytest
+import hoggorm as ho
+
+import hoggormplot as hopl
+
+
+def _data(objects=30, variables=12, responses=2, seed=0):
+    rng = np.random.RandomState(seed)
+    latent = rng.randn(objects, 3)
+    X = np.dot(latent, rng.randn(3, variables)) + \
+        0.3 * rng.randn(objects, variables)
+    Y = np.dot(latent, rng.randn(3, responses)) + \
+        0.3 * rng.randn(objects, responses)
+    return X, Y
+
+
+def _fit(modelClass, **kwargs):
+    # hoggorm reports progress on stdout
+    with contextlib.redirect_stdout(io.StringIO()):
+        return modelClass(**kwargs)
+
+
+@pytest.fixture(scope='session')
+def data():
+    return _data()
+
+
+@pytest.fixture(scope='session')
+def pca(data):
+    return _fit(ho.nipalsPCA, arrX=data[0], numComp=4, cvType=['loo'])
+
+
+@pytest.fixture(scope='session')
+def pls2(data):
+    return _fit(ho.nipalsPLS2, arrX=data[0], arrY=data[1], numComp=4,
+                cvType=['loo'])
+
+
+@pytest.fixture(scope='session')
+def pcr(data):
+    return _fit(ho.nipalsPCR, arrX=data[0], arrY=data[1], numComp=4,
+                cvType=['loo'])
+
+
+@pytest.fixture(scope='session')
+def spectra():
+    """
+    PLS2 model of long spectra, so line plots are decimated.
+    """
+    X, Y = _data(objects=40, variables=3000, seed=1)
+    return _fit(ho.nipalsPLS2, arrX=X, arrY=Y, numComp=3)
+
+
+@pytest.fixture(autouse=True)
+def _closeFigures():
+    yield
+    matplotlib.pyplot.close('all')
+    hopl.clearCache()
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+"""Headless rendering of many models in worker processes"""
+
+import os
+
+import pytest
+
+import hoggormplot as hopl
+from hoggormplot import batch_plot
+
+
+pytestmark = pytest.mark.filterwarnings('ignore:.*fork')
+
+
+def test_files_per_model_spec_and_format(pca, pls2, tmp_path):
+    specs = [{'name': 'overview', 'plots': [1, 2]},
+             {'plots': [6], 'comp': [1, 2]}]
+    written = hopl.batchPlot([pca, pls2], specs, str(tmp_path),
+                             formats=['png', 'svg'],
+                             modelNames=['pca', 'pls'], processes=2)
+    names = sorted(os.path.basename(path) for path in written)
+    assert names == sorted(
+        '{0}_{1}_{2}.{3}'.format(model, spec, num, fmt)
+        for model in ['pca', 'pls'] for spec, num in
+        [('overview', 1), ('overview', 2), ('plot2', 1)]
+        for fmt in ['png', 'svg'])
+    assert all(os.path.getsize(path) > 0 for path in written)
+    assert batch_plot._models == []
+
+
+def test_nested_calls_keep_their_models(pca, pls2, tmp_path, monkeypatch):
+    # A second call runs while the first one starts its pool, as happens
+    # with calls from several threads
+    realPool = batch_plot.ProcessPoolExecutor
+    inner = []
+
+    def pool(*args, **kwargs):
+        if not inner:
+            inner.append(None)
+            inner[0] = hopl.batchPlot([pls2], [{'plots': [5]}],
+                                      str(tmp_path / 'inner'), processes=1)
+        return realPool(*args, **kwargs)
+
+    monkeypatch.setattr(batch_plot, 'ProcessPoolExecutor', pool)
+    outer = hopl.batchPlot([pca] * 3, [{'plots': [1]}],
+                           str(tmp_path / 'outer'), processes=2)
+    assert len(outer) == 3
+    assert len(inner[0]) == 2
+
+
+def test_invalid_arguments(pca, tmp_path):
+    with pytest.raises(ValueError):
+        hopl.batchPlot([pca], [{}], str(tmp_path), formats=['bmp'])
+    with pytest.raises(ValueError):
+        hopl.batchPlot([pca], [{}], str(tmp_path), modelNames=['a', 'b'])
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""Min/max decimation of long lines"""
+
+import numpy as np
+import pytest
+
+import hoggormplot as hopl
+from hoggormplot.main_plot import _decimate, _maxPoints
+
+
+def test_decimate_keeps_bucket_extremes():
+    rng = np.random.RandomState(0)
+    values = rng.randn(1000, 3)
+    pos, decimated = _decimate(values, 100)
+    assert pos.shape == decimated.shape == (100, 3)
+
+    # 50 buckets of 20 rows, each represented by its minimum and maximum
+    buckets = values.reshape(50, 20, 3)
+    np.testing.assert_array_equal(np.sort(decimated.reshape(50, 2, 3), axis=1),
+                                  np.stack([buckets.min(axis=1),
+                                            buckets.max(axis=1)], axis=1))
+    # Positions point at the kept values and keep their original order
+    for col in range(3):
+        np.testing.assert_array_equal(values[pos[:, col], col],
+                                      decimated[:, col])
+    assert np.all(np.diff(pos, axis=0) >= 0)
+
+
+def test_decimate_keeps_short_lines():
+    values = np.arange(10.0)[:, np.newaxis]
+    pos, decimated = _decimate(values, 100)
+    np.testing.assert_array_equal(decimated, values)
+    pos, decimated = _decimate(values, None)
+    np.testing.assert_array_equal(pos[:, 0], np.arange(10))
+
+
+def test_decimate_ragged_last_bucket():
+    values = np.random.RandomState(1).randn(1001, 1)
+    pos, decimated = _decimate(values, 100)
+    assert pos.max() <= 1000
+    assert decimated.max() == values.max()
+    assert decimated.min() == values.min()
+
+
+def test_maxPoints_resolution():
+    from matplotlib.figure import Figure
+    ax = Figure(figsize=(4, 3), dpi=100).add_subplot(111)
+    assert _maxPoints(ax, None) is None
+    assert _maxPoints(ax, 500) == 500
+    assert _maxPoints(ax, 'auto') == int(2 * ax.bbox.width)
+    with pytest.raises(ValueError):
+        _maxPoints(ax, 'all')
+
+
+@pytest.mark.parametrize('overlay', [False, True])
+def test_auto_coefficients_and_control_chart(spectra, overlay):
+    figs = hopl.plot(spectra, plots=[2, 5, 8], line=True, maxPoints='auto',
+                     overlay=overlay, show=False)
+    for fig in figs:
+        for ax in fig.axes:
+            for line in ax.lines:
+                assert len(line.get_xdata()) <= 2 * ax.bbox.width + 2
+        fig.canvas.draw()
+
+
+def test_auto_convenience_functions(spectra):
+    hopl.coefficients(spectra, maxPoints='auto', show=False)
+    hopl.coefficientsRange(spectra, maxPoints='auto', show=False)
+    hopl.controlChart(spectra, maxPoints='auto', show=False)
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""Density rendering of many objects"""
+
+import numpy as np
+from matplotlib.figure import Figure
+
+import hoggormplot as hopl
+from hoggormplot.main_plot import _drawDensity
+
+
+def _axes():
+    return Figure().add_subplot(111)
+
+
+def test_histogram_image():
+    rng = np.random.RandomState(0)
+    x, y = rng.randn(2, 10000)
+    ax = _axes()
+    _drawDensity(ax, x, y, bins=25)
+    image = ax.images[0].get_array()
+    assert image.shape == (25, 25)
+    # Rows are y bins, all objects are counted, empty bins are masked
+    counts = np.histogram2d(x, y, bins=25)[0].T
+    np.testing.assert_array_equal(image.filled(0), counts)
+    np.testing.assert_array_equal(np.ma.getmaskarray(image), counts == 0)
+    assert image.sum() == len(x)
+    assert len(ax.collections) == 0
+
+
+def test_outliers_in_sparse_bins():
+    x = np.concatenate([np.zeros(100), [5.0, -5.0]])
+    y = np.concatenate([np.zeros(100), [5.0, 5.0]])
+    ax = _axes()
+    _drawDensity(ax, x, y, bins=10, outliers=1)
+    np.testing.assert_array_equal(
+        np.sort(ax.collections[0].get_offsets(), axis=0),
+        [[-5.0, 5.0], [5.0, 5.0]])
+
+
+def test_scores_density_mode(pca):
+    ax = hopl.plot(pca, plots=[1], density=12, show=False)[0].axes[0]
+    assert ax.images[0].get_array().shape == (12, 12)
+    assert ax.images[0].get_array().sum() == np.shape(pca.arrX_input)[0]
+    # Names are only drawn with a label budget in density mode
+    assert len(ax.texts) == 0
+    ax = hopl.plot(pca, plots=[1], density=True, maxLabels=3,
+                   show=False)[0].axes[0]
+    assert ax.images[0].get_array().shape == (200, 200)
+    assert 0 < len(ax.texts) <= 3
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""Heatmap of explained variances of individual variables"""
+
+import numpy as np
+import pytest
+
+import hoggormplot as hopl
+from hoggormplot.main_plot import _orderVariables
+
+
+def _cumulative(increments):
+    """
+    Cumulative explained variances starting with 0 components from the
+    per-component increments (components x variables).
+    """
+    increments = np.asarray(increments, dtype=float)
+    return np.vstack([np.zeros(increments.shape[1]),
+                      np.cumsum(increments, axis=0)])
+
+
+def test_data_order():
+    explVar = _cumulative(np.ones((3, 5)))
+    np.testing.assert_array_equal(_orderVariables(explVar), np.arange(5))
+
+
+def test_sort_by_total():
+    explVar = _cumulative([[10, 50, 5, 30], [5, 20, 5, 45]])
+    np.testing.assert_array_equal(_orderVariables(explVar, 'sort'),
+                                  [3, 1, 0, 2])
+
+
+def test_cluster_groups_variables_of_the_same_component():
+    # Variables 0, 2, 4 are explained by component 1, 1, 3, 5 by component 2
+    increments = [[80, 5, 70, 10, 90, 0],
+                  [5, 85, 10, 60, 0, 75],
+                  [5, 5, 5, 5, 5, 5]]
+    order = _orderVariables(_cumulative(increments), 'cluster')
+    groups = [set(order[:3]), set(order[3:])]
+    assert {0, 2, 4} in groups and {1, 3, 5} in groups
+
+
+def test_invalid_order():
+    with pytest.raises(ValueError):
+        _orderVariables(_cumulative(np.ones((2, 3))), 'alphabetical')
+
+
+@pytest.mark.parametrize('cumulative', [True, False])
+@pytest.mark.parametrize('varOrder', [None, 'sort', 'cluster'])
+def test_heatmap_image(pca, cumulative, varOrder):
+    fig = hopl.explainedVariance(pca, individual=True, heatmap=True,
+                                 cumulative=cumulative, varOrder=varOrder,
+                                 show=False)[0]
+    ax = fig.axes[0]
+    assert len(ax.images) == 1 and len(ax.lines) == 0
+
+    # Validated explained variances are shown by default
+    cumExplVar = np.asarray(pca.X_cumValExplVar_indVar())
+    order = _orderVariables(cumExplVar, varOrder)
+    expected = cumExplVar if cumulative else np.diff(cumExplVar, axis=0)
+    np.testing.assert_allclose(ax.images[0].get_array(), expected[:, order])
+    assert [label.get_text() for label in ax.get_xticklabels()] == \
+        ['Var {0}'.format(ind + 1) for ind in order]
+
+
+def test_heatmap_without_tick_labels_for_many_variables(spectra):
+    ax = hopl.plot(spectra, plots=[6], individual=True, heatmap=True,
+                   which=['X'], validated=False, show=False)[0].axes[0]
+    assert len(ax.images) == 1
+    np.testing.assert_allclose(ax.images[0].get_array(),
+                               spectra.X_cumCalExplVar_indVar())
+    assert ax.get_xlabel() == 'Variables'
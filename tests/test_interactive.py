@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+"""Component explorer and linked lasso selection, driven through events"""
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+from matplotlib.backend_bases import KeyEvent
+
+import hoggormplot as hopl
+
+
+pytestmark = pytest.mark.filterwarnings('ignore:.*non-interactive')
+
+
+def _box(coords, indices):
+    """
+    Returns lasso vertices around the given points, inside their bounding
+    box widened by a small margin.
+    """
+    lower = coords[indices].min(axis=0) - 1e-6
+    upper = coords[indices].max(axis=0) + 1e-6
+    return [(lower[0], lower[1]), (upper[0], lower[1]),
+            (upper[0], upper[1]), (lower[0], upper[1])]
+
+
+def test_explorer_is_shown_through_pyplot(pls2):
+    explorer = hopl.ComponentExplorer(pls2, show=True)
+    assert explorer.fig.number in plt.get_fignums()
+
+    canvas = explorer.fig.canvas
+    canvas.callbacks.process('key_press_event',
+                             KeyEvent('key_press_event', canvas, 'right'))
+    assert explorer.comp == [2, 3]
+    canvas.callbacks.process('key_press_event',
+                             KeyEvent('key_press_event', canvas, 'down'))
+    assert explorer.comp == [2, 2]
+
+    scores = pls2.X_scores()[:, [1, 1]]
+    np.testing.assert_allclose(explorer.panels[0]['collection'].get_offsets(),
+                               scores)
+    canvas.draw()
+
+
+def test_explorer_without_show_is_not_registered(pls2):
+    explorer = hopl.ComponentExplorer(pls2, show=False)
+    assert plt.get_fignums() == []
+    explorer.setComponents([3, 4])
+    assert explorer.fig.axes[0].get_xlabel().startswith('comp 3')
+
+
+def test_lasso_highlights_linked_views(pls2):
+    selections = []
+    views = hopl.LinkedViews(pls2, plots=[1, 2, 7], show=True,
+                             onSelect=lambda objects, variables:
+                             selections.append((objects, variables)))
+    assert views.fig.number in plt.get_fignums()
+    assert len(views.selectors) == 2 + np.shape(pls2.arrY_input)[1]
+
+    # Lasso around some objects in the scores plot
+    layer = views.layers[0]
+    selected = np.argsort(layer['coords'][:, 0])[-4:]
+    verts = _box(layer['coords'], selected)
+    inside = np.flatnonzero(
+        np.all((layer['coords'] >= np.min(verts, axis=0)) &
+               (layer['coords'] <= np.max(verts, axis=0)), axis=1))
+    views.selectors[0].onselect(verts)
+
+    objects, variables = selections[-1]
+    np.testing.assert_array_equal(objects, inside)
+    assert 0 < len(variables) <= views.numMatches
+    for layer in views.layers:
+        expected = objects if layer['kind'] == 'objects' else variables
+        np.testing.assert_allclose(layer['overlay'].get_offsets(),
+                                   layer['coords'][expected].reshape(-1, 2))
+
+    # Selecting variables in the loadings plot highlights matching objects
+    layer = views.layers[1]
+    views.selectors[1].onselect(_box(layer['coords'], [0]))
+    objects, variables = selections[-1]
+    assert 0 in variables
+    assert len(objects) <= views.numMatches
+    views.fig.canvas.draw()
+
+
+def test_select_without_show(pls2):
+    views = hopl.LinkedViews(pls2, show=False)
+    assert plt.get_fignums() == []
+    objects, variables = views.select(objects=[0, 1, 2])
+    np.testing.assert_array_equal(objects, [0, 1, 2])
+    objects, variables = views.select()
+    assert len(objects) == len(variables) == 0
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+"""Label budget and grid-based label culling"""
+
+import numpy as np
+import pytest
+
+import hoggormplot as hopl
+from hoggormplot.labels import GridIndex, selectLabels
+
+
+@pytest.fixture
+def coords():
+    return np.random.RandomState(0).randn(500, 2)
+
+
+def test_grid_query_matches_brute_force(coords):
+    index = GridIndex(coords, gridSize=8)
+    for limits in [(-1, 0.5, -0.2, 2), (0, 0, 0, 0), (-5, 5, -5, 5)]:
+        xMin, xMax, yMin, yMax = limits
+        expected = np.flatnonzero((coords[:, 0] >= xMin) &
+                                  (coords[:, 0] <= xMax) &
+                                  (coords[:, 1] >= yMin) &
+                                  (coords[:, 1] <= yMax))
+        np.testing.assert_array_equal(index.query(*limits), expected)
+
+
+def test_one_label_per_cell_highest_ranked_first(coords):
+    selected = selectLabels(coords, 20, gridSize=4)
+    assert len(selected) <= 16
+    cells = GridIndex(coords, gridSize=4).cellIds[selected]
+    assert len(np.unique(cells)) == len(selected)
+
+    distance = np.hypot(coords[:, 0], coords[:, 1])
+    assert selected[0] == np.argmax(distance)
+    assert np.all(np.diff(distance[selected]) <= 0)
+    # Every selected point is the farthest of its cell
+    index = GridIndex(coords, gridSize=4)
+    for ind in selected:
+        members = np.flatnonzero(index.cellIds == index.cellIds[ind])
+        assert distance[ind] == distance[members].max()
+
+
+@pytest.mark.parametrize('maxLabels', [0, 1, 5, 50])
+def test_label_budget(coords, maxLabels):
+    assert len(selectLabels(coords, maxLabels)) <= maxLabels
+    assert len(selectLabels(coords[:0], maxLabels)) == 0
+
+
+def test_leverage_ranking():
+    # Leverage scales the components by their sum of squares, so the far
+    # point along the narrow second axis ranks first
+    coords = np.array([[10.0, 0], [-9, 0], [8, 0], [0, 1], [0, -0.1],
+                       [0, 0.1]])
+    assert selectLabels(coords, 1, labelBy='distance')[0] == 0
+    assert selectLabels(coords, 1, labelBy='leverage')[0] == 3
+    with pytest.raises(ValueError):
+        selectLabels(coords, 1, labelBy='size')
+
+
+def test_scores_plot_labels(pca):
+    numObj = np.shape(pca.arrX_input)[0]
+    ax = hopl.plot(pca, plots=[1], show=False)[0].axes[0]
+    assert len(ax.texts) == numObj
+
+    ax = hopl.plot(pca, plots=[1], maxLabels=5, show=False)[0].axes[0]
+    assert 0 < len(ax.texts) <= 5
+    scores = pca.X_scores()[:, :2]
+    farthest = np.argmax(np.hypot(scores[:, 0], scores[:, 1]))
+    assert 'Obj {0}'.format(farthest + 1) in [text.get_text()
+                                              for text in ax.texts]
+
+    ax = hopl.plot(pca, plots=[1], maxLabels=0, show=False)[0].axes[0]
+    assert len(ax.texts) == 0
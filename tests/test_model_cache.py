@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+"""Least recently used cache of model results"""
+
+import gc
+
+import numpy as np
+import pytest
+
+import hoggormplot as hopl
+from hoggormplot.model_cache import ModelCache
+
+
+class CountingModel(object):
+    """
+    Stand-in for a hoggorm model counting the calls of its accessors.
+    """
+
+    def __init__(self):
+        self.calls = 0
+
+    def X_scores(self):
+        self.calls += 1
+        return np.arange(6.0).reshape(3, 2)
+
+    def regressionCoefficients(self, numComp=1):
+        self.calls += 1
+        return np.full((4, 1), float(numComp))
+
+
+def test_accessors_called_once_per_arguments():
+    cache = ModelCache()
+    model = CountingModel()
+    first = cache.get(model, 'X_scores')
+    assert cache.get(model, 'X_scores') is first
+    cache.get(model, 'regressionCoefficients', 1)
+    cache.get(model, 'regressionCoefficients', 2)
+    cache.get(model, 'regressionCoefficients', 2)
+    assert model.calls == 3
+
+
+def test_derived_results():
+    cache = ModelCache()
+    model = CountingModel()
+    calls = []
+    func = lambda: calls.append(None) or len(calls)
+    assert cache.derived(model, ('key',), func) == 1
+    assert cache.derived(model, ('key',), func) == 1
+    assert cache.derived(model, ('other',), func) == 2
+
+
+def test_least_recently_used_model_evicted():
+    cache = ModelCache(maxModels=2)
+    models = [CountingModel() for num in range(3)]
+    cache.get(models[0], 'X_scores')
+    cache.get(models[1], 'X_scores')
+    cache.get(models[0], 'X_scores')     # models[1] is now least recent
+    cache.get(models[2], 'X_scores')
+    cache.get(models[0], 'X_scores')
+    cache.get(models[1], 'X_scores')
+    assert [model.calls for model in models] == [1, 2, 1]
+
+
+def test_entries_dropped_with_model():
+    cache = ModelCache()
+    model = CountingModel()
+    cache.get(model, 'X_scores')
+    assert len(cache._entries) == 1
+    del model
+    gc.collect()
+    assert len(cache._entries) == 0
+
+
+def test_untrackable_models_not_cached():
+    # Objects without weak reference support are passed through
+    cache = ModelCache()
+    calls = []
+    func = lambda: calls.append(None) or len(calls)
+    assert cache.derived((1, 2), ('key',), func) == 1
+    assert cache.derived((1, 2), ('key',), func) == 2
+    assert len(cache._entries) == 0
+
+
+def test_resize_and_clear():
+    cache = ModelCache(maxModels=3)
+    models = [CountingModel() for num in range(3)]
+    for model in models:
+        cache.get(model, 'X_scores')
+    cache.resize(1)
+    assert len(cache._entries) == 1
+    cache.clear()
+    cache.get(models[2], 'X_scores')
+    assert models[2].calls == 2
+
+
+def test_plot_reuses_cached_results(pls2, monkeypatch):
+    calls = []
+    original = type(pls2).X_scores
+
+    def counting(self):
+        calls.append(None)
+        return original(self)
+    monkeypatch.setattr(type(pls2), 'X_scores', counting)
+    hopl.plot(pls2, plots=[1, 4], show=False)
+    hopl.scores(pls2, show=False)
+    assert len(calls) == 1
+
+    hopl.setCacheSize(0)
+    try:
+        hopl.scores(pls2, show=False)
+        uncached = len(calls)
+        hopl.scores(pls2, show=False)
+        assert uncached > 1 and len(calls) == 2 * uncached - 1
+    finally:
+        hopl.setCacheSize(8)
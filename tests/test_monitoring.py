@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""Hotelling T2, Q residual and leverage statistics"""
+
+import contextlib
+import io
+
+import numpy as np
+import pytest
+import hoggorm as ho
+
+import hoggormplot as hopl
+from hoggormplot import monitoring
+
+
+@pytest.fixture(scope='module')
+def standardised(data):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return ho.nipalsPCA(arrX=data[0], numComp=4, Xstand=True)
+
+
+def test_calibration_statistics(pca):
+    scores = pca.X_scores()[:, :2]
+    T2, Q = hopl.controlStatistics(pca, numComp=2)
+    np.testing.assert_allclose(
+        T2, np.sum(scores**2 / np.var(scores, axis=0, ddof=1), axis=1))
+    np.testing.assert_allclose(Q, np.sum(pca.X_residuals()[2]**2, axis=1))
+
+
+@pytest.mark.parametrize('modelName', ['pca', 'pls2', 'standardised'])
+@pytest.mark.parametrize('numComp', [1, 3])
+def test_training_data_reproduces_calibration(request, data, modelName,
+                                              numComp):
+    model = request.getfixturevalue(modelName)
+    calT2, calQ = hopl.controlStatistics(model, numComp)
+    newT2, newQ = hopl.controlStatistics(model, numComp, newX=data[0])
+    np.testing.assert_allclose(newT2, calT2, rtol=1e-8, atol=1e-10)
+    np.testing.assert_allclose(newQ, calQ, rtol=1e-8, atol=1e-10)
+
+
+def test_chunks(pca, data, monkeypatch):
+    whole = hopl.controlStatistics(pca, 2, newX=data[0])
+    monkeypatch.setattr(monitoring, 'CHUNKSIZE', 7)
+    chunked = hopl.controlStatistics(pca, 2, newX=data[0])
+    np.testing.assert_allclose(chunked, whole)
+
+
+def test_limits_and_influence(pca):
+    T2, Q = hopl.controlStatistics(pca, 2)
+    T2lim, Qlim = hopl.controlLimits(pca, 2, levels=[50, 95])
+    assert T2lim[0] < T2lim[1] and Qlim[0] < Qlim[1]
+    np.testing.assert_allclose(T2lim, np.percentile(T2, [50, 95]))
+
+    leverage, residualVar = hopl.influenceStatistics(pca, 2)
+    numObj, numVars = np.shape(pca.arrX_input)
+    np.testing.assert_allclose(leverage, 1.0 / numObj + T2 / (numObj - 1))
+    np.testing.assert_allclose(residualVar, Q / numVars)
+
+
+def test_numComp_range(pca):
+    with pytest.raises(ValueError):
+        hopl.controlStatistics(pca, 5)
+
+
+def test_new_objects_match_hoggorm_scores(pls2, pcr, data):
+    # Without standardisation the scores equal those of X_scores_predict
+    newX = data[0][:7] * 1.1 + 0.2
+    for model in [pls2, pcr]:
+        scores = model.X_scores_predict(newX, 3)
+        T2, Q = hopl.controlStatistics(model, 3, newX=newX)
+        variances = np.var(model.X_scores()[:, :3], axis=0, ddof=1)
+        np.testing.assert_allclose(T2, np.sum(scores**2 / variances, axis=1))
+
+
+def test_preprocessing_cached(pca, data, monkeypatch):
+    hopl.controlStatistics(pca, 2, newX=data[0][:3])
+    monkeypatch.setattr(monitoring, '_preprocessing', None)
+    monkeypatch.setattr(monitoring, '_projection', None)
+    hopl.controlStatistics(pca, 2, newX=data[0][:3])
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+"""Smoke tests of every keyword argument of plot across all plot types"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+import hoggormplot as hopl
+
+
+# All plot types per model, prediction plots only for regression models
+PLOTS = {'pca': [1, 2, 3, 4, 6, 8, 9],
+         'pls2': [1, 2, 3, 4, 5, 6, 7, 8, 9],
+         'pcr': [1, 2, 3, 4, 5, 6, 7, 8, 9]}
+
+
+def _newData(data):
+    X, Y = data
+    return {'newX': X[:5] + 0.1, 'newY': Y[:5]}
+
+
+# Name of the case: function returning the keyword arguments for the data
+CASES = {
+    'defaults': lambda data: {},
+    'comp': lambda data: {'comp': [2, 3]},
+    'comp single': lambda data: {'comp': 2, 'plots': [5, 7, 8, 9]},
+    'plot names': lambda data: {'plots': ['scores', 'loadings',
+                                          'correlationLoadings', 'biplot',
+                                          'explainedVariance', 'controlChart',
+                                          'influence']},
+    'which X': lambda data: {'which': ['X']},
+    'which Y': lambda data: {'which': ['Y']},
+    'which Both': lambda data: {'which': ['Both']},
+    'line': lambda data: {'line': True},
+    'weights': lambda data: {'weights': True},
+    'cumulative': lambda data: {'cumulative': False},
+    'individual': lambda data: {'individual': True},
+    'validated': lambda data: {'validated': [False]},
+    'objNames': lambda data: {'objNames': ['o{0}'.format(num) for num in
+                                           range(len(data[0]))]},
+    'varNames': lambda data: {
+        'XvarNames': ['x{0}'.format(num) for num in range(data[0].shape[1])],
+        'YvarNames': ['y{0}'.format(num) for num in range(data[1].shape[1])]},
+    'index names': lambda data: {
+        'objNames': pd.Index(['o{0}'.format(num)
+                              for num in range(len(data[0]))]),
+        'XvarNames': pd.RangeIndex(data[0].shape[1])},
+    'newX': _newData,
+    'newObjNames': lambda data: dict(_newData(data),
+                                     newObjNames=['n1', 'n2', 'n3', 'n4',
+                                                  'n5']),
+    'new DataFrame': lambda data: {
+        'newX': pd.DataFrame(data[0][:5]), 'newY': pd.DataFrame(data[1][:5])},
+    'figsize': lambda data: {'figsize': (4, 3)},
+    'maxLabels': lambda data: {'maxLabels': 5},
+    'labelBy': lambda data: {'maxLabels': 5, 'labelBy': 'leverage'},
+    'layout grid': lambda data: {'layout': 'grid'},
+    'layout shape': lambda data: {'layout': (4, 4)},
+    'density': lambda data: {'density': True},
+    'density bins': lambda data: {'density': 20, 'densityOutliers': 3},
+    'profile': lambda data: {'profile': hopl.PlotProfile()},
+    'smallMultiples': lambda data: {'smallMultiples': True},
+    'overlay': lambda data: {'overlay': True},
+    'maxPoints': lambda data: {'line': True, 'maxPoints': 6},
+    'maxPoints auto': lambda data: {'line': True, 'maxPoints': 'auto'},
+    'heatmap': lambda data: {'individual': True, 'heatmap': True},
+    'heatmap sort': lambda data: {'individual': True, 'heatmap': True,
+                                  'varOrder': 'sort'},
+    'heatmap cluster': lambda data: {'individual': True, 'heatmap': True,
+                                     'cumulative': False,
+                                     'varOrder': 'cluster'},
+    'limitLevels': lambda data: {'limitLevels': [90, 95, 99.9]},
+}
+
+
+# Cases whose figures are also drawn, drawing every case takes minutes
+DRAWN = {'defaults', 'density bins', 'heatmap cluster', 'layout grid',
+         'maxPoints auto', 'newX', 'overlay', 'smallMultiples'}
+
+
+# Results a model type does not provide: loading weights exist only for PLS
+# models, PCR models have no Y scores
+UNSUPPORTED = {('weights', 'pca'), ('weights', 'pcr'), ('which Y', 'pcr'),
+               ('which Both', 'pcr')}
+
+
+@pytest.mark.parametrize('modelName', sorted(PLOTS))
+@pytest.mark.parametrize('case', sorted(CASES))
+def test_plot_keyword(request, data, modelName, case):
+    if (case, modelName) in UNSUPPORTED:
+        pytest.skip('not provided by the model type')
+    model = request.getfixturevalue(modelName)
+    kwargs = CASES[case](data)
+    kwargs.setdefault('plots', list(PLOTS[modelName]))
+    if modelName == 'pca' and 'plots' in kwargs:
+        kwargs['plots'] = [item for item in kwargs['plots']
+                           if item not in [5, 7, 'coeffs', 'predict']]
+
+    figs = hopl.plot(model, show=False, **kwargs)
+    assert len(figs) > 0
+    if case in DRAWN:
+        for fig in figs:
+            FigureCanvasAgg(fig).draw()
+    if 'profile' in kwargs:
+        assert len(kwargs['profile'].records) > 0
+
+
+def test_plot_keyword_cases_cover_signature():
+    import inspect
+    covered = set(['model', 'show'])
+    for makeKwargs in CASES.values():
+        covered.update(makeKwargs((np.zeros((3, 3)), np.zeros((3, 2)))))
+    assert set(inspect.signature(hopl.plot).parameters) <= covered
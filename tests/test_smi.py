@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""Cached and parallel SMI permutation testing"""
+
+import contextlib
+import io
+
+import numpy as np
+import pytest
+import hoggorm as ho
+
+import hoggormplot as hopl
+from hoggormplot import SMI_significance
+
+
+@pytest.fixture(scope='module')
+def smi(data):
+    X, Y = data
+    rng = np.random.RandomState(3)
+    with contextlib.redirect_stdout(io.StringIO()):
+        return ho.SMI(X, X[:, :8] + rng.randn(len(X), 8), ncomp1=3, ncomp2=3)
+
+
+def _uncached(smi):
+    # P-values are cached per SMI object, start every call afresh
+    SMI_significance._pvalues.pop(smi, None)
+
+
+def test_serial_and_pooled_pvalues_equal(smi):
+    _uncached(smi)
+    serial = hopl.smiSignificance(smi, B=600, seed=5)
+    _uncached(smi)
+    pooled = hopl.smiSignificance(smi, B=600, seed=5, processes=2)
+    np.testing.assert_array_equal(serial, pooled)
+    assert serial.shape == np.shape(smi.smi)
+    assert np.all((serial >= 0) & (serial <= 1))
+
+
+def test_pvalues_cached(smi, tmp_path, monkeypatch):
+    _uncached(smi)
+    cacheFile = str(tmp_path / 'smi')
+    first = hopl.smiSignificance(smi, B=300, seed=1, cacheFile=cacheFile)
+    assert hopl.smiSignificance(smi, B=300, seed=1) is first
+
+    # Stored on disk, so a new session does not permute again
+    _uncached(smi)
+    monkeypatch.setattr(SMI_significance, '_permutationCounts', None)
+    np.testing.assert_array_equal(
+        hopl.smiSignificance(smi, B=300, seed=1, cacheFile=cacheFile), first)
+
+
+def test_plotSMI_runs_serially_by_default(smi, monkeypatch):
+    _uncached(smi)
+
+    def noPool(*args, **kwargs):
+        raise AssertionError('worker processes started')
+    monkeypatch.setattr(SMI_significance, 'ProcessPoolExecutor', noPool)
+    hopl.plotSMI(smi, B=600, seed=0, show=False)
+
+
+def test_diamonds_drawn_as_one_collection(smi):
+    from matplotlib.collections import PolyCollection
+
+    _uncached(smi)
+    fig = hopl.plotSMI(smi, significance=False, show=False)
+    ax = fig.axes[0]
+    diamonds = [collection for collection in ax.collections
+                if isinstance(collection, PolyCollection)]
+    assert len(diamonds) == len(ax.collections) == 1
+    ncomp1, ncomp2 = np.shape(smi.smi)
+    np.testing.assert_allclose(diamonds[0].get_array(), np.ravel(smi.smi))
+
+    # Diamond of components (i+1, j+1) has its bottom corner at
+    # ((j-i)/2, (i+j)/2)
+    paths = diamonds[0].get_paths()
+    assert len(paths) == ncomp1 * ncomp2
+    i, j = 1, 2
+    bottom = paths[i * ncomp2 + j].vertices[0]
+    np.testing.assert_allclose(bottom, [(j - i) / 2.0, (i + j) / 2.0])
+    # Component numbers and the two data set names
+    assert len(ax.texts) == ncomp1 + ncomp2 + 2
+
+
+def test_significance_symbols_one_collection_per_symbol(smi):
+    _uncached(smi)
+    Pval = hopl.smiSignificance(smi, B=300, seed=2)
+    fig = hopl.plotSMI(smi, B=300, seed=2, show=False)
+    glyphs = fig.axes[0].collections[1:]
+
+    # One symbol per combination of components: stars and a dot by
+    # P-value, otherwise =, superset or subset by the number of components
+    ncomp1, ncomp2 = np.shape(smi.smi)
+    I, J = np.meshgrid(np.arange(ncomp1), np.arange(ncomp2), indexing='ij')
+    symbols = np.select([Pval < 0.001, Pval < 0.01, Pval < 0.05, Pval < 0.1,
+                         I == J, I > J],
+                        ['***', '**', '*', 'dot', '=', 'sup'], default='sub')
+    counts = sorted(np.unique(symbols, return_counts=True)[1])
+    assert sorted(len(glyph.get_offsets()) for glyph in glyphs) == counts
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""Memory-mapped plot snapshots"""
+
+import os
+import pickle
+
+import numpy as np
+import pytest
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+import hoggormplot as hopl
+
+
+def _pixels(figs):
+    images = []
+    for fig in figs:
+        canvas = FigureCanvasAgg(fig)
+        canvas.draw()
+        images.append(np.asarray(canvas.buffer_rgba()).copy())
+    return images
+
+
+@pytest.mark.parametrize('modelName, modeltype, plots', [
+    ('pca', 'PCA', [1, 2, 3, 4, 6]),
+    ('pls2', 'PLS2', [1, 2, 3, 4, 5, 6]),
+    ('pcr', 'PCR', [1, 2, 3, 4, 5, 6]),
+])
+def test_snapshot_draws_like_model(request, tmp_path, modelName, modeltype,
+                                   plots):
+    model = request.getfixturevalue(modelName)
+    hopl.saveSnapshot(model, str(tmp_path))
+    snapshot = hopl.loadSnapshot(str(tmp_path))
+    assert snapshot.modeltype == modeltype
+
+    for kwargs in [{}, {'line': True}]:
+        expected = _pixels(hopl.plot(model, plots=plots, show=False,
+                                     **kwargs))
+        actual = _pixels(hopl.plot(snapshot, plots=plots, show=False,
+                                   **kwargs))
+        assert len(actual) == len(expected)
+        for image, reference in zip(actual, expected):
+            np.testing.assert_array_equal(image, reference)
+
+
+def test_snapshot_arrays(pls2, tmp_path):
+    hopl.saveSnapshot(pls2, str(tmp_path))
+    snapshot = hopl.loadSnapshot(str(tmp_path))
+    scores = snapshot.X_scores()
+    assert isinstance(scores, np.memmap)
+    assert not scores.flags.writeable
+    np.testing.assert_array_equal(scores, pls2.X_scores())
+    np.testing.assert_array_equal(snapshot.regressionCoefficients(2),
+                                  pls2.regressionCoefficients(2))
+    with pytest.raises(ValueError):
+        snapshot.regressionCoefficients(5)
+
+
+def test_snapshot_pickles_by_path(pls2, tmp_path):
+    hopl.saveSnapshot(pls2, str(tmp_path))
+    snapshot = hopl.loadSnapshot(str(tmp_path))
+    snapshot.X_scores()
+    data = pickle.dumps(snapshot)
+    assert len(data) < 2000
+    copy = pickle.loads(data)
+    np.testing.assert_array_equal(copy.X_scores(), pls2.X_scores())
+
+
+def test_snapshot_without_input_data(pca, pls2, tmp_path):
+    hopl.saveSnapshot(pls2, str(tmp_path / 'pls2'))
+    snapshot = hopl.loadSnapshot(str(tmp_path / 'pls2'))
+    assert not hasattr(snapshot, 'arrX_input')
+    with pytest.raises(AttributeError, match='plot snapshot'):
+        hopl.plot(snapshot, plots=[7], show=False)
+
+    hopl.saveSnapshot(pca, str(tmp_path / 'pca'))
+    snapshot = hopl.loadSnapshot(str(tmp_path / 'pca'))
+    with pytest.raises(AttributeError, match='not stored'):
+        snapshot.regressionCoefficients(1)
+
+
+def test_incomplete_snapshot(pca, tmp_path):
+    hopl.saveSnapshot(pca, str(tmp_path))
+    os.remove(str(tmp_path / 'snapshot.json'))
+    with pytest.raises(IOError):
+        hopl.loadSnapshot(str(tmp_path))
+
+
+def test_batchPlot_snapshots(pls2, tmp_path):
+    hopl.saveSnapshot(pls2, str(tmp_path / 'snapshot'))
+    snapshot = hopl.loadSnapshot(str(tmp_path / 'snapshot'))
+    written = hopl.batchPlot([snapshot], [{'plots': [1, 2]}],
+                             str(tmp_path / 'out'), processes=1)
+    assert len(written) == 2
+    assert all(os.path.getsize(path) > 0 for path in written)
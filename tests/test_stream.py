@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+"""Incrementally updated scores plot"""
+
+import numpy as np
+import pytest
+
+import hoggormplot as hopl
+
+
+@pytest.mark.parametrize('window', [0, -1, -10])
+def test_invalid_window(pca, window):
+    with pytest.raises(ValueError):
+        hopl.ScoresStream(pca, window=window)
+
+
+def test_window_keeps_newest_objects(pca, data):
+    stream = hopl.ScoresStream(pca, comp=[1, 3], window=4)
+    newX = data[0][:10]
+    expected = pca.X_scores_predict(newX)[:, [0, 2]]
+
+    np.testing.assert_allclose(stream.update(newX[:3]), expected[:3])
+    assert len(stream.points) == 3
+    stream.update(newX[3:])
+    np.testing.assert_allclose(stream.points, expected[-4:])
+    np.testing.assert_allclose(stream.collection.get_offsets(), expected[-4:])
+
+    stream.update(newX[0])
+    np.testing.assert_allclose(stream.points[-1], expected[0])
+    assert len(stream.points) == 4
+
+
+def test_unlimited_window_and_clear(pca, data):
+    stream = hopl.ScoresStream(pca)
+    stream.update(data[0][:5])
+    stream.update(data[0][:5] * 10)
+    assert len(stream.points) == 10
+    xMin, xMax = stream.ax.get_xlim()
+    assert xMin <= stream.points[:, 0].min() and \
+        stream.points[:, 0].max() <= xMax
+    stream.clear()
+    assert len(stream.collection.get_offsets()) == 0
@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+"""Static artist templates shared across figures"""
+
+import matplotlib
+import numpy as np
+
+import hoggormplot as hopl
+from hoggormplot.main_plot import _template
+
+
+def _circles(fig):
+    return fig.axes[0].collections[0]
+
+
+def test_correlation_circles_follow_rc_settings(pca):
+    for width in [1.5, 3.0]:
+        with matplotlib.rc_context({'lines.linewidth': width}):
+            fig = hopl.correlationLoadings(pca, show=False)[0]
+        np.testing.assert_allclose(_circles(fig).get_linewidths(),
+                                   [1, 1, width, width])
+
+
+def test_template_geometry_shared(pca):
+    template = _template('correlationLoadings')
+    first = _circles(hopl.correlationLoadings(pca, show=False)[0])
+    second = _circles(hopl.correlationLoadings(pca, show=False)[0])
+    assert first is not second
+    assert _template('correlationLoadings') is template
+    radii = [np.max(np.hypot(*segment.T)) for segment in first.get_segments()]
+    np.testing.assert_allclose(radii, [1.2, 1.2, 0.707, 1.0], atol=1e-3)